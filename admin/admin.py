@@ -1,6 +1,8 @@
 from django.contrib import admin
 from django.utils.html import format_html
 
+from .exports import stream_csv
+from .images import variant_url
 from .models import (
     AttendanceRecord,
     Course,
@@ -10,6 +12,27 @@ from .models import (
     SiteBranding,
     WebsiteImage,
 )
+from .pagination import EstimatedCountPaginator, KeysetPaginationMixin
+from .search import filter_matches, search_available
+
+
+class CsvExportMixin:
+    export_kind = None
+    actions = ['export_csv']
+
+    @admin.action(description='Export selected rows as CSV')
+    def export_csv(self, request, queryset):
+        return stream_csv(self.export_kind, queryset)
+
+
+class FullTextSearchMixin:
+    """Answer changelist searches from the full-text index instead of LIKE scans."""
+    search_kind = None
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip() or not search_available():
+            return super().get_search_results(request, queryset, search_term)
+        return filter_matches(queryset, search_term, self.search_kind), False
 
 
 @admin.register(SiteBranding)
@@ -20,7 +43,7 @@ class SiteBrandingAdmin(admin.ModelAdmin):
         if obj.logo:
             return format_html(
                 '<img src="{}" style="height:38px;width:auto;border:1px solid #ddd;border-radius:4px;padding:2px;" />',
-                obj.logo.url,
+                variant_url(obj.logo, 'thumb'),
             )
         return '-'
 
@@ -35,7 +58,7 @@ class WebsiteImageAdmin(admin.ModelAdmin):
         if obj.image:
             return format_html(
                 '<img src="{}" style="height:45px;width:auto;border:1px solid #ddd;border-radius:4px;padding:2px;" />',
-                obj.image.url,
+                variant_url(obj.image, 'thumb'),
             )
         return '-'
 
@@ -47,28 +70,38 @@ class CourseCategoryAdmin(admin.ModelAdmin):
 
 
 @admin.register(Course)
-class CourseAdmin(admin.ModelAdmin):
-    list_display = ('title', 'category', 'level', 'duration_hours', 'is_active', 'created_at')
+class CourseAdmin(FullTextSearchMixin, admin.ModelAdmin):
+    search_kind = 'course'
+    list_display = (
+        'title', 'category', 'level', 'duration_hours', 'is_active',
+        'enrollment_count', 'lesson_count', 'attendance_count', 'created_at',
+    )
     list_filter = ('category', 'level', 'is_active')
     search_fields = ('title', 'description')
 
 
 @admin.register(Lesson)
-class LessonAdmin(admin.ModelAdmin):
+class LessonAdmin(KeysetPaginationMixin, FullTextSearchMixin, admin.ModelAdmin):
+    search_kind = 'lesson'
+    paginator = EstimatedCountPaginator
     list_display = ('title', 'course', 'visibility', 'lesson_file', 'created_at')
     list_filter = ('visibility', 'course__category')
     search_fields = ('title', 'description', 'course__title')
 
 
 @admin.register(CourseEnrollment)
-class CourseEnrollmentAdmin(admin.ModelAdmin):
+class CourseEnrollmentAdmin(KeysetPaginationMixin, CsvExportMixin, admin.ModelAdmin):
+    export_kind = 'enrollments'
+    paginator = EstimatedCountPaginator
     list_display = ('student', 'course', 'enrolled_at')
     list_filter = ('course__category',)
     search_fields = ('student__username', 'course__title')
 
 
 @admin.register(AttendanceRecord)
-class AttendanceRecordAdmin(admin.ModelAdmin):
+class AttendanceRecordAdmin(KeysetPaginationMixin, CsvExportMixin, admin.ModelAdmin):
+    export_kind = 'attendance'
+    paginator = EstimatedCountPaginator
     list_display = ('student', 'course', 'attendance_date', 'source', 'marked_at')
     list_filter = ('source', 'attendance_date', 'course__category')
     search_fields = ('student__username', 'course__title')
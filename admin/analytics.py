@@ -0,0 +1,116 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from .models import AttendanceRecord, CourseEnrollment
+from .versions import course_version
+
+ROLLING_WINDOW = 7
+
+
+def _runs(student_pos, day_idx):
+    """Split (student, day) pairs sorted by student then day into consecutive-day runs."""
+    if not len(day_idx):
+        return student_pos, day_idx, day_idx
+    breaks = (student_pos[1:] != student_pos[:-1]) | (np.diff(day_idx) != 1)
+    starts = np.flatnonzero(np.r_[True, breaks])
+    ends = np.r_[starts[1:], len(day_idx)]
+    return student_pos[starts], day_idx[ends - 1], ends - starts
+
+
+def compute_attendance_analytics(student_ids, dates, enrolled_ids, start, end, at_risk_rate=0.5, at_risk_idle_days=7):
+    """Attendance statistics for one course over ``start``..``end``.
+
+    ``student_ids`` and ``dates`` are parallel sequences of the course's
+    attendance rows inside the range; ``enrolled_ids`` lists its students.
+    """
+    days = (end - start).days + 1
+    origin = np.datetime64(start, 'D')
+    student_ids = np.asarray(student_ids, dtype=np.int64)
+    day_idx = (np.asarray(dates, dtype='datetime64[D]') - origin).astype(np.int64)
+    enrolled = np.unique(np.asarray(enrolled_ids, dtype=np.int64))
+
+    daily = np.bincount(day_idx, minlength=days)
+    cumulative = np.cumsum(daily)
+    rolling = cumulative - np.r_[np.zeros(ROLLING_WINDOW, dtype=np.int64), cumulative[:-ROLLING_WINDOW]][:days]
+    weekly = np.bincount(day_idx // 7, minlength=(days + 6) // 7)
+
+    students, student_pos = np.unique(student_ids, return_inverse=True)
+    present = np.bincount(student_pos, minlength=len(students))
+    last_day = np.full(len(students), -1, dtype=np.int64)
+    np.maximum.at(last_day, student_pos, day_idx)
+
+    order = np.lexsort((day_idx, student_pos))
+    run_student, run_end, run_length = _runs(student_pos[order], day_idx[order])
+    longest = np.zeros(len(students), dtype=np.int64)
+    np.maximum.at(longest, run_student, run_length)
+    current = np.zeros(len(students), dtype=np.int64)
+    ongoing = run_end >= days - 2
+    current[run_student[ongoing]] = run_length[ongoing]
+
+    attended = np.isin(enrolled, students)
+    slot = np.searchsorted(students, enrolled)
+    slot[~attended] = 0
+    enrolled_present = np.where(attended, present[slot] if len(students) else 0, 0)
+    enrolled_last = np.where(attended, last_day[slot] if len(students) else -1, -1)
+    rate = enrolled_present / days
+    risky = (rate < at_risk_rate) | (enrolled_last < days - at_risk_idle_days)
+    risk_order = np.argsort(rate[risky], kind='stable')
+
+    def to_date(index):
+        return start + timedelta(days=int(index))
+
+    streak_order = np.lexsort((-longest, -current))[:10]
+    return {
+        'days': [(to_date(i), int(daily[i]), int(rolling[i])) for i in range(days)],
+        'weeks': [(to_date(i * 7), int(total)) for i, total in enumerate(weekly)],
+        'total_present': int(daily.sum()),
+        'enrolled': int(len(enrolled)),
+        'attended': int(attended.sum()),
+        'conversion': float(attended.mean()) if len(enrolled) else 0.0,
+        'streaks': [
+            (int(students[i]), int(current[i]), int(longest[i]))
+            for i in streak_order
+            if longest[i] > 1
+        ],
+        'at_risk': [
+            (int(student_id), int(present_days), to_date(last) if last >= 0 else None, float(student_rate))
+            for student_id, present_days, last, student_rate in zip(
+                enrolled[risky][risk_order],
+                enrolled_present[risky][risk_order],
+                enrolled_last[risky][risk_order],
+                rate[risky][risk_order],
+            )
+        ],
+    }
+
+
+def course_attendance_analytics(course, start, end, at_risk_limit=25):
+    """Return cached analytics for ``course``; any attendance or enrollment change moves the key."""
+    key = f'analytics:{course.pk}:{start}:{end}:{course_version(course.pk)}'
+    result = cache.get(key)
+    if result is None:
+        rows = AttendanceRecord.objects.filter(
+            course_id=course.pk, attendance_date__range=(start, end)
+        ).order_by().values_list('student_id', 'attendance_date')
+        student_ids, dates = zip(*rows) if rows else ((), ())
+        enrolled_ids = CourseEnrollment.objects.filter(course_id=course.pk).values_list('student_id', flat=True)
+        result = compute_attendance_analytics(student_ids, dates, list(enrolled_ids), start, end)
+        result['at_risk_total'] = len(result['at_risk'])
+        result['at_risk'] = result['at_risk'][:at_risk_limit]
+        shown = {row[0] for row in result['at_risk']} | {row[0] for row in result['streaks']}
+        User = get_user_model()
+        names = dict(User.objects.filter(pk__in=shown).values_list('pk', 'username')) if shown else {}
+        result['streaks'] = [(names.get(row[0], row[0]),) + row[1:] for row in result['streaks']]
+        result['at_risk'] = [(names.get(row[0], row[0]),) + row[1:] for row in result['at_risk']]
+        cache.set(key, result, getattr(settings, 'ANALYTICS_CACHE_TIMEOUT', 300))
+    return result
+
+
+def default_range(today=None, days=28):
+    today = today or date.today()
+    return today - timedelta(days=days - 1), today
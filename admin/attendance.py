@@ -0,0 +1,296 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+import weakref
+from collections import Counter
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.db import close_old_connections, connections, router, transaction
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from .counters import adjust_course_counter
+from .models import AttendanceRecord, CourseEnrollment
+from .rollups import record_attendance
+from .rowcounts import adjust_row_count
+from .versions import bump_student_versions
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ATTENDANCE_BACKEND = {
+    'BACKEND': 'admin.attendance.DirectAttendanceBackend',
+    'OPTIONS': {},
+}
+
+_backend = None
+_backend_lock = threading.Lock()
+_buffered_backends = weakref.WeakSet()
+
+
+def insert_ignore(obj):
+    """Run ``INSERT ... ON CONFLICT DO NOTHING`` for ``obj``; return True if a row was written.
+
+    Unlike ``bulk_create(ignore_conflicts=True)`` this reports whether the
+    row was new, which the counters need. Signals are not sent.
+    """
+    model = type(obj)
+    connection = connections[router.db_for_write(model, instance=obj)]
+    quote = connection.ops.quote_name
+    fields = [field for field in model._meta.concrete_fields if not field.primary_key]
+    values = [field.get_db_prep_save(field.pre_save(obj, True), connection) for field in fields]
+    sql = 'INSERT INTO {} ({}) VALUES ({}) ON CONFLICT DO NOTHING'.format(
+        quote(model._meta.db_table),
+        ', '.join(quote(field.column) for field in fields),
+        ', '.join(['%s'] * len(fields)),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, values)
+        return cursor.rowcount == 1
+
+
+def _marked_key(student_id, course_id, attendance_date):
+    return f'attendance:marked:{student_id}:{course_id}:{attendance_date.isoformat()}'
+
+
+def already_marked(student_id, course_id, attendance_date):
+    return bool(cache.get(_marked_key(student_id, course_id, attendance_date)))
+
+
+def _marked_timeout():
+    # Deleting a record forgets its flag only in processes sharing the cache;
+    # this bounds how long other workers keep skipping the student's mark.
+    return getattr(settings, 'ATTENDANCE_MARKED_TIMEOUT', 300)
+
+
+def remember_marked(student_id, course_id, attendance_date):
+    cache.set(_marked_key(student_id, course_id, attendance_date), True, _marked_timeout())
+
+
+def forget_marked(keys):
+    """Drop the marked flags for ``(student_id, course_id, attendance_date)`` keys."""
+    cache.delete_many([_marked_key(*key) for key in keys])
+
+
+def enroll_student(student, course):
+    """Create the enrollment if missing; return True when it was new."""
+    created = insert_ignore(CourseEnrollment(student=student, course=course))
+    if created:
+        adjust_course_counter(CourseEnrollment, course.pk, 1)
+        adjust_row_count(CourseEnrollment, 1)
+        bump_student_versions([student.pk])
+    return created
+
+
+class DirectAttendanceBackend:
+    """Write each mark synchronously inside the request."""
+
+    def mark(self, student, course, source, attendance_date):
+        with transaction.atomic(using=router.db_for_write(AttendanceRecord)):
+            enroll_student(student, course)
+            created = insert_ignore(
+                AttendanceRecord(student=student, course=course, attendance_date=attendance_date, source=source)
+            )
+            if created:
+                adjust_course_counter(AttendanceRecord, course.pk, 1)
+                adjust_row_count(AttendanceRecord, 1)
+                record_attendance([(student.pk, course.pk, attendance_date)])
+        transaction.on_commit(lambda: remember_marked(student.pk, course.pk, attendance_date))
+        return created
+
+    def flush(self):
+        return 0
+
+
+class BufferedAttendanceBackend:
+    """Queue marks in memory and write them in batches from a background thread.
+
+    Enrollment is still written synchronously so the course list reflects it
+    straight away; only the attendance rows are deferred. A batch is written
+    once ``batch_size`` marks are waiting or ``flush_interval_ms`` has passed,
+    and whatever is left is flushed when the process exits. A failed write is
+    retried ``retries`` times; after that the batch is dropped and its marks
+    forgotten, so the students can mark again.
+    """
+
+    def __init__(self, batch_size=500, flush_interval_ms=200, threaded=True, retries=3, retry_delay_ms=200):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.threaded = threaded
+        self.retries = retries
+        self.retry_delay = retry_delay_ms / 1000
+        self._queue = queue.Queue()
+        self._seen = set()
+        self._seen_date = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._worker = None
+        _buffered_backends.add(self)
+
+    def _claim(self, key, attendance_date):
+        with self._lock:
+            if self._seen_date != attendance_date:
+                self._seen = set()
+                self._seen_date = attendance_date
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+            return True
+
+    def mark(self, student, course, source, attendance_date):
+        key = (student.pk, course.pk)
+        if not self._claim(key, attendance_date):
+            return False
+        try:
+            with transaction.atomic(using=router.db_for_write(CourseEnrollment)):
+                enroll_student(student, course)
+        except Exception:
+            with self._lock:
+                self._seen.discard(key)
+            raise
+        self._queue.put(
+            AttendanceRecord(student_id=student.pk, course_id=course.pk, attendance_date=attendance_date, source=source)
+        )
+        remember_marked(student.pk, course.pk, attendance_date)
+        if self.threaded:
+            self._ensure_worker()
+        return True
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='attendance-flush', daemon=True)
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            close_old_connections()
+            try:
+                self._write_or_forget(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _drain(self, limit):
+        records = []
+        while len(records) < limit:
+            try:
+                records.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return records
+
+    def _write(self, records):
+        if not records:
+            return 0
+        with self._write_lock, transaction.atomic(using=router.db_for_write(AttendanceRecord)):
+            existing = set(
+                AttendanceRecord.objects.filter(
+                    student_id__in={record.student_id for record in records},
+                    course_id__in={record.course_id for record in records},
+                    attendance_date__in={record.attendance_date for record in records},
+                ).values_list('student_id', 'course_id', 'attendance_date')
+            )
+            new = {}
+            for record in records:
+                key = (record.student_id, record.course_id, record.attendance_date)
+                if key not in existing:
+                    new.setdefault(key, record)
+            AttendanceRecord.objects.bulk_create(new.values(), batch_size=self.batch_size, ignore_conflicts=True)
+            for course_id, added in Counter(key[1] for key in new).items():
+                adjust_course_counter(AttendanceRecord, course_id, added)
+            adjust_row_count(AttendanceRecord, len(new))
+            record_attendance(new)
+        return len(new)
+
+    def _write_or_forget(self, records):
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.retry_delay * attempt)
+                close_old_connections()
+            try:
+                return self._write(records)
+            except Exception:
+                if attempt < self.retries:
+                    logger.warning('Writing %d attendance marks failed; retrying', len(records), exc_info=True)
+                    continue
+                logger.exception('Dropping %d attendance marks after %d failed writes', len(records), attempt + 1)
+        self._forget(records)
+        return 0
+
+    def _forget(self, records):
+        keys = {(record.student_id, record.course_id, record.attendance_date) for record in records}
+        with self._lock:
+            self._seen.difference_update(
+                (student_id, course_id) for student_id, course_id, attendance_date in keys
+                if attendance_date == self._seen_date
+            )
+        forget_marked(keys)
+
+    def flush(self):
+        """Write every queued mark and wait for the worker's batch in flight; return new rows written here."""
+        written = 0
+        while batch := self._drain(self.batch_size):
+            try:
+                written += self._write_or_forget(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        worker = self._worker
+        if worker is not None and worker.is_alive() and worker is not threading.current_thread():
+            self._queue.join()
+        return written
+
+
+@atexit.register
+def _flush_buffered_backends():
+    for backend in list(_buffered_backends):
+        backend.flush()
+
+
+def get_attendance_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                config = getattr(settings, 'ATTENDANCE_BACKEND', DEFAULT_ATTENDANCE_BACKEND)
+                _backend = import_string(config['BACKEND'])(**config.get('OPTIONS', {}))
+    return _backend
+
+
+@receiver(setting_changed)
+def reset_attendance_backend(setting, **kwargs):
+    global _backend
+    if setting == 'ATTENDANCE_BACKEND':
+        _backend = None
+
+
+def mark_attendance(student, course, source='enter', attendance_date=None):
+    """Enroll ``student`` and mark attendance through the configured backend.
+
+    Repeat marks for the same day are answered from the cache without
+    touching the database. Returns True when a new mark was accepted.
+    """
+    attendance_date = attendance_date or date.today()
+    if already_marked(student.pk, course.pk, attendance_date):
+        return False
+    return get_attendance_backend().mark(student, course, source, attendance_date)
@@ -0,0 +1,85 @@
+import hashlib
+import threading
+import time
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .images import ready_variants
+from .models import SiteBranding, WebsiteImage
+
+_VERSION_KEY = 'site_assets:version'
+_ASSETS_KEY = 'site_assets:data'
+
+_lock = threading.Lock()
+_local_assets = None
+_local_expires = 0
+
+
+class SiteAssets(NamedTuple):
+    branding: SiteBranding | None
+    images: list
+    version: str
+    modified: object
+
+
+def _shared_cache():
+    alias = getattr(settings, 'SITE_ASSETS_CACHE', None)
+    return caches[alias] if alias else None
+
+
+def _local_timeout():
+    # Only used with SITE_ASSETS_CACHE = None, where an invalidation reaches
+    # just the current process; other processes pick changes up within this.
+    return getattr(settings, 'SITE_ASSETS_LOCAL_TIMEOUT', 60)
+
+
+def _build_site_assets():
+    branding = SiteBranding.objects.order_by('-updated_at').first()
+    images = list(WebsiteImage.objects.filter(is_active=True))
+    digest = hashlib.sha1()
+    if branding:
+        digest.update(repr((
+            branding.pk, branding.site_name, branding.logo.name, branding.updated_at, ready_variants(branding.logo),
+        )).encode())
+    for image in images:
+        digest.update(repr((image.pk, image.title, image.image.name, image.page, ready_variants(image.image))).encode())
+    # Taken from the rows rather than the clock, so every process building
+    # the same version reports the same time.
+    stamps = [image.created_at for image in images] + ([branding.updated_at] if branding else [])
+    return SiteAssets(branding, images, digest.hexdigest()[:16], max(stamps, default=None))
+
+
+def get_site_assets():
+    """Return branding and active images, hitting the database only after a change."""
+    global _local_assets, _local_expires
+    assets = _local_assets
+    shared = _shared_cache()
+    if shared is None:
+        if assets is None or time.monotonic() >= _local_expires:
+            with _lock:
+                if _local_assets is None or time.monotonic() >= _local_expires:
+                    _local_assets = _build_site_assets()
+                    _local_expires = time.monotonic() + _local_timeout()
+                assets = _local_assets
+        return assets
+
+    version = shared.get(_VERSION_KEY)
+    if assets is not None and assets.version == version:
+        return assets
+    cached = shared.get(_ASSETS_KEY) if version else None
+    if cached is None or cached.version != version:
+        cached = _build_site_assets()
+        shared.set_many({_ASSETS_KEY: cached, _VERSION_KEY: cached.version}, None)
+    _local_assets = cached
+    return cached
+
+
+def invalidate_site_assets():
+    global _local_assets
+    with _lock:
+        _local_assets = None
+    shared = _shared_cache()
+    if shared is not None:
+        shared.delete_many([_VERSION_KEY, _ASSETS_KEY])
@@ -1,13 +1,12 @@
 from django.conf import settings
 
-from .models import SiteBranding, WebsiteImage
+from .branding import get_site_assets
 
 
 def site_assets(request):
-    branding = SiteBranding.objects.order_by('-updated_at').first()
-    images = WebsiteImage.objects.filter(is_active=True)
+    assets = get_site_assets()
     return {
-        'site_branding': branding,
-        'website_images': images,
+        'site_branding': assets.branding,
+        'website_images': assets.images,
         'default_logo_url': f'{settings.MEDIA_URL}logo.png',
     }
@@ -0,0 +1,70 @@
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Greatest
+
+from .models import AttendanceRecord, Course, CourseEnrollment, Lesson
+from .versions import bump_course_versions
+
+COUNTER_FIELDS = {
+    CourseEnrollment: 'enrollment_count',
+    Lesson: 'lesson_count',
+    AttendanceRecord: 'attendance_count',
+}
+
+
+def adjust_course_counter(model, course_id, delta):
+    # Clamped so a counter that drifted low (rows bulk-loaded without a
+    # rebuild) cannot fail the unsigned CHECK constraint on delete;
+    # rebuild_course_counters puts the exact value back.
+    field = COUNTER_FIELDS[model]
+    Course.objects.filter(pk=course_id).update(**{field: Greatest(F(field) + delta, 0)})
+    if model is CourseEnrollment:
+        bump_course_versions([course_id])
+
+
+def subtract_course_rows(model, rows):
+    """Take ``rows``, which are about to be deleted, off their courses' counters in one UPDATE."""
+    field = COUNTER_FIELDS[model]
+    removed = rows.filter(course_id=OuterRef('pk')).order_by().values('course_id').annotate(total=Count('pk'))
+    Course.objects.filter(pk__in=rows.values('course_id')).update(
+        **{field: Greatest(F(field) - Subquery(removed.values('total')), 0)}
+    )
+    if model is CourseEnrollment:
+        bump_course_versions(rows.order_by().values_list('course_id', flat=True).distinct())
+
+
+def count_course_rows(course_ids=None):
+    """Return ``{course_id: {field: count}}`` computed from the child tables."""
+    courses = Course.objects.all()
+    if course_ids is not None:
+        courses = courses.filter(pk__in=course_ids)
+    counts = {course_id: dict.fromkeys(COUNTER_FIELDS.values(), 0) for course_id in courses.values_list('pk', flat=True)}
+    for model, field in COUNTER_FIELDS.items():
+        rows = model.objects.order_by().values('course_id').annotate(total=Count('id'))
+        if course_ids is not None:
+            rows = rows.filter(course_id__in=course_ids)
+        for row in rows:
+            if row['course_id'] in counts:
+                counts[row['course_id']][field] = row['total']
+    return counts
+
+
+def find_counter_drift(course_ids=None):
+    """Return ``(course_id, field, stored, actual)`` for every stale counter."""
+    expected = count_course_rows(course_ids)
+    stored = Course.objects.filter(pk__in=expected).values('pk', *COUNTER_FIELDS.values())
+    drift = []
+    for row in stored:
+        for field, actual in expected[row['pk']].items():
+            if row[field] != actual:
+                drift.append((row['pk'], field, row[field], actual))
+    return drift
+
+
+def rebuild_course_counters(course_ids=None, batch_size=500):
+    with transaction.atomic():
+        expected = count_course_rows(course_ids)
+        courses = [Course(pk=course_id, **fields) for course_id, fields in expected.items()]
+        Course.objects.bulk_update(courses, list(COUNTER_FIELDS.values()), batch_size=batch_size)
+        bump_course_versions(course_ids)
+    return len(courses)
@@ -0,0 +1,81 @@
+from django.conf import settings
+from django.core import checks
+
+DEFAULT_SQLITE_PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    'busy_timeout': 5000,
+    'mmap_size': 128 * 1024 * 1024,
+    'cache_size': -20000,
+    'temp_store': 'memory',
+}
+
+# Numeric values SQLite reports back for the named settings.
+_PRAGMA_VALUES = {
+    'synchronous': {'off': 0, 'normal': 1, 'full': 2, 'extra': 3},
+    'temp_store': {'default': 0, 'file': 1, 'memory': 2},
+}
+
+
+def sqlite_pragmas():
+    return getattr(settings, 'SQLITE_PRAGMAS', DEFAULT_SQLITE_PRAGMAS)
+
+
+def apply_sqlite_pragmas(connection):
+    """Apply SQLITE_PRAGMAS to a freshly opened SQLite connection."""
+    if connection.vendor != 'sqlite':
+        return
+    in_memory = connection.is_in_memory_db()
+    read_only = 'mode=ro' in str(connection.settings_dict['NAME'])
+    with connection.cursor() as cursor:
+        for name, value in sqlite_pragmas().items():
+            if in_memory and name in {'journal_mode', 'mmap_size'}:
+                continue
+            if read_only and name == 'journal_mode':
+                continue
+            cursor.execute(f'PRAGMA {name} = {value}')
+
+
+def read_sqlite_pragmas(connection):
+    """Return ``{name: (configured, effective)}`` for every configured PRAGMA."""
+    report = {}
+    with connection.cursor() as cursor:
+        for name, configured in sqlite_pragmas().items():
+            cursor.execute(f'PRAGMA {name}')
+            row = cursor.fetchone()
+            report[name] = (configured, row[0] if row else None)
+    return report
+
+
+def pragma_matches(name, configured, effective):
+    if isinstance(configured, str):
+        configured = configured.lower()
+        if isinstance(effective, str):
+            return effective.lower() == configured
+        return _PRAGMA_VALUES.get(name, {}).get(configured) == effective
+    return configured == effective
+
+
+@checks.register(checks.Tags.database)
+def check_sqlite_pragmas(app_configs, databases=None, **kwargs):
+    """Warn when a configured PRAGMA did not take effect.
+
+    Like every database-tagged check this is skipped by runserver's startup
+    checks; it runs during ``migrate`` and with ``manage.py check --database
+    default``. ``manage.py sqlite_status`` reports the same values on demand.
+    """
+    from django.db import connections
+
+    messages = []
+    for alias in databases or []:
+        connection = connections[alias]
+        if connection.vendor != 'sqlite' or connection.is_in_memory_db():
+            continue
+        for name, (configured, effective) in read_sqlite_pragmas(connection).items():
+            if not pragma_matches(name, configured, effective):
+                messages.append(checks.Warning(
+                    f'PRAGMA {name} is {effective!r} on database "{alias}", expected {configured!r}.',
+                    hint='Check SQLITE_PRAGMAS and that the database file is writable.',
+                    id='custom_admin.W001',
+                ))
+    return messages
@@ -0,0 +1,114 @@
+import mimetypes
+import os
+import re
+import zlib
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import content_disposition_header, http_date, quote_etag
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class _FileRange:
+    """Read at most ``length`` bytes from an already positioned file."""
+
+    def __init__(self, handle, length):
+        self.handle = handle
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.handle.read(size) if size else b''
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.handle.close()
+
+
+def parse_range(header, size):
+    """Return ``(start, end)`` for a single satisfiable byte range, ``None`` to send the
+    whole file, or ``False`` when the range cannot be satisfied."""
+    match = _RANGE_RE.match(header.replace(' ', ''))
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None
+    else:
+        start = max(size - int(last), 0)
+        end = size - 1
+    if start >= size or end < start:
+        return False
+    return start, end
+
+
+def file_etag(name, stat):
+    return quote_etag(f'{stat.st_mtime_ns:x}-{stat.st_size:x}-{zlib.crc32(name.encode()):x}')
+
+
+def serve_file(request, field_file):
+    """Serve a stored file with ETag/304, single byte ranges and optional proxy offload."""
+    path = field_file.path
+    stat = os.stat(path)
+    etag = file_etag(field_file.name, stat)
+    filename = os.path.basename(field_file.name)
+    content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+    response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if response is None:
+        response = _build_response(request, field_file, path, stat, etag, filename, content_type)
+    response.headers.setdefault('ETag', etag)
+    response.headers.setdefault('Last-Modified', http_date(stat.st_mtime))
+    response.headers['Accept-Ranges'] = 'bytes'
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _build_response(request, field_file, path, stat, etag, filename, content_type):
+    # 'direct' streams through FileResponse (sendfile when the server supports
+    # wsgi.file_wrapper); 'x-accel' and 'x-sendfile' hand the transfer to the
+    # front proxy so workers never touch the bytes.
+    mode = getattr(settings, 'LESSON_DOWNLOAD_MODE', 'direct')
+    if mode in {'x-accel', 'x-sendfile'}:
+        response = HttpResponse(content_type=content_type)
+        response['Content-Disposition'] = content_disposition_header(False, filename)
+        if mode == 'x-accel':
+            prefix = getattr(settings, 'LESSON_DOWNLOAD_ACCEL_PREFIX', '/protected-media/')
+            response['X-Accel-Redirect'] = prefix + quote(field_file.name)
+        else:
+            response['X-Sendfile'] = path
+        return response
+
+    size = stat.st_size
+    byte_range = None
+    if request.headers.get('Range') and request.headers.get('If-Range', etag) == etag:
+        byte_range = parse_range(request.headers['Range'], size)
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+
+    handle = open(path, 'rb')
+    if byte_range is None:
+        return FileResponse(handle, filename=filename, content_type=content_type)
+
+    start, end = byte_range
+    handle.seek(start)
+    if end == size - 1:
+        # Open-ended ranges keep the real file so wsgi.file_wrapper can still sendfile().
+        response = FileResponse(handle, filename=filename, content_type=content_type, status=206)
+    else:
+        response = FileResponse(_FileRange(handle, end - start + 1), filename=filename, content_type=content_type,
+                                status=206)
+        response.block_size = 64 * 1024
+    response['Content-Length'] = end - start + 1
+    response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    return response
@@ -0,0 +1,64 @@
+import csv
+from datetime import date
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+from .models import AttendanceRecord, CourseEnrollment
+
+EXPORT_CHUNK_SIZE = getattr(settings, 'EXPORT_CHUNK_SIZE', 2000)
+
+# kind: (model, date lookup, [(header, values_list lookup), ...])
+EXPORTS = {
+    'attendance': (AttendanceRecord, 'attendance_date', [
+        ('student', 'student__username'),
+        ('course', 'course__title'),
+        ('category', 'course__category__name'),
+        ('attendance_date', 'attendance_date'),
+        ('source', 'source'),
+        ('marked_at', 'marked_at'),
+    ]),
+    'enrollments': (CourseEnrollment, 'enrolled_at__date', [
+        ('student', 'student__username'),
+        ('course', 'course__title'),
+        ('category', 'course__category__name'),
+        ('enrolled_at', 'enrolled_at'),
+    ]),
+}
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def export_queryset(kind, queryset=None, course_ids=None, category_ids=None, start=None, end=None):
+    model, date_lookup, _ = EXPORTS[kind]
+    queryset = model.objects.all() if queryset is None else queryset
+    if course_ids:
+        queryset = queryset.filter(course_id__in=course_ids)
+    if category_ids:
+        queryset = queryset.filter(course__category_id__in=category_ids)
+    if start:
+        queryset = queryset.filter(**{f'{date_lookup}__gte': start})
+    if end:
+        queryset = queryset.filter(**{f'{date_lookup}__lte': end})
+    return queryset
+
+
+def export_rows(kind, queryset):
+    """Yield the header and then plain tuples, one database chunk at a time."""
+    _, _, columns = EXPORTS[kind]
+    yield [header for header, _ in columns]
+    yield from queryset.values_list(*(lookup for _, lookup in columns)).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def stream_csv(kind, queryset, filename=None):
+    writer = csv.writer(_Echo())
+    response = StreamingHttpResponse(
+        (writer.writerow(row) for row in export_rows(kind, queryset)),
+        content_type='text/csv; charset=utf-8',
+    )
+    filename = filename or f'{kind}-{date.today():%Y%m%d}.csv'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
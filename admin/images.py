@@ -0,0 +1,120 @@
+import io
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, features
+
+logger = logging.getLogger(__name__)
+
+# name: {'size': (max width, max height), 'format': Pillow format, 'quality': 1-100}
+DEFAULT_IMAGE_VARIANTS = {
+    'thumb': {'size': (160, 90), 'format': 'WEBP', 'quality': 80},
+    'logo': {'size': (400, 68), 'format': 'WEBP', 'quality': 85},
+    'large': {'size': (1600, 1600), 'format': 'WEBP', 'quality': 80},
+}
+
+_EXTENSIONS = {'WEBP': 'webp', 'AVIF': 'avif', 'JPEG': 'jpg', 'PNG': 'png'}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def image_variants():
+    variants = getattr(settings, 'IMAGE_VARIANTS', DEFAULT_IMAGE_VARIANTS)
+    return {
+        name: spec for name, spec in variants.items()
+        if spec['format'] not in {'WEBP', 'AVIF'} or features.check(spec['format'].lower())
+    }
+
+
+def variant_name(name, variant):
+    """``website/images/hero.jpg`` -> ``website/images/hero.jpg.thumb.webp``, next to the original.
+
+    The original's extension stays in the name, so ``hero.jpg`` and
+    ``hero.png`` never share variants.
+    """
+    spec = image_variants()[variant]
+    return f'{name}.{variant}.{_EXTENSIONS[spec["format"]]}'
+
+
+def variant_url(field_file, variant):
+    """URL of a generated variant, falling back to the original until it exists."""
+    if not field_file:
+        return ''
+    if variant in image_variants():
+        name = variant_name(field_file.name, variant)
+        if field_file.storage.exists(name):
+            return field_file.storage.url(name)
+    return field_file.url
+
+
+def ready_variants(field_file):
+    if not field_file:
+        return ()
+    return tuple(
+        variant for variant in image_variants()
+        if field_file.storage.exists(variant_name(field_file.name, variant))
+    )
+
+
+def _render(original, spec):
+    image = ImageOps.exif_transpose(original)
+    has_alpha = image.mode in {'RGBA', 'LA'} or (image.mode == 'P' and 'transparency' in image.info)
+    image = image.convert('RGBA' if has_alpha and spec['format'] != 'JPEG' else 'RGB')
+    image.thumbnail(spec['size'], Image.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    image.save(buffer, spec['format'], quality=spec.get('quality', 80))
+    return buffer.getvalue()
+
+
+def generate_variants(field_file, force=False):
+    """Write every configured variant of ``field_file`` next to it; return the names written."""
+    if not field_file:
+        return []
+    storage = field_file.storage
+    written = []
+    with storage.open(field_file.name, 'rb') as handle, Image.open(handle) as original:
+        original.load()
+        for variant, spec in image_variants().items():
+            name = variant_name(field_file.name, variant)
+            if storage.exists(name):
+                if not force:
+                    continue
+                storage.delete(name)
+            written.append(storage.save(name, ContentFile(_render(original, spec))))
+    return written
+
+
+def delete_variants(field_file):
+    if not field_file:
+        return
+    for variant in image_variants():
+        field_file.storage.delete(variant_name(field_file.name, variant))
+
+
+def _generate(field_file, on_done):
+    try:
+        if generate_variants(field_file) and on_done:
+            on_done()
+    except Exception:
+        logger.exception('Could not generate image variants for %s', field_file.name)
+
+
+def schedule_variants(field_file, on_done=None):
+    """Generate variants on a background thread, or inline when IMAGE_VARIANTS_BACKGROUND is off.
+
+    ``on_done`` runs after at least one variant was written.
+    """
+    global _executor
+    if not field_file:
+        return
+    if not getattr(settings, 'IMAGE_VARIANTS_BACKGROUND', True):
+        _generate(field_file, on_done)
+        return
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='image-variants')
+    _executor.submit(_generate, field_file, on_done)
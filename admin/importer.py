@@ -0,0 +1,331 @@
+import csv
+from itertools import islice
+from typing import NamedTuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models.functions import Lower
+
+from .counters import rebuild_course_counters
+from .models import Course, CourseCategory, CourseEnrollment, Lesson
+from .roles import FACULTY, STUDENT
+from .rowcounts import refresh_row_counts
+from .search import rebuild_search_index
+from .versions import bump_catalog_version, bump_student_versions
+
+User = get_user_model()
+
+IMPORT_BATCH_SIZE = getattr(settings, 'IMPORT_BATCH_SIZE', 1000)
+
+# kind: (required columns, optional columns)
+IMPORT_COLUMNS = {
+    'courses': (('category', 'title'), ('description', 'level', 'duration_hours')),
+    'lessons': (('category', 'course', 'title'), ('description', 'visibility')),
+    'enrollments': (('username', 'category', 'course'), ()),
+    'users': (('username', 'role'), ('email', 'first_name', 'last_name', 'password')),
+}
+
+LEVELS = {choice for choice, _ in Course.LEVEL_CHOICES}
+VISIBILITIES = {choice for choice, _ in Lesson.VISIBILITY_CHOICES}
+
+
+class ImportReport(NamedTuple):
+    kind: str
+    rows: int
+    created: int
+    skipped: int
+    errors: list  # [(line number, message)]
+    stopped_at: int | None = None  # line of the record that ended the import early
+
+
+def _batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _categories_by_lower_name(names):
+    categories = CourseCategory.objects.annotate(lower_name=Lower('name')).filter(
+        lower_name__in={name.lower() for name in names}
+    )
+    return {category.lower_name: category for category in categories}
+
+
+def _resolve_categories(names):
+    """Map category names to categories, creating the missing ones in bulk.
+
+    Names match case-insensitively, like the single-course form does.
+    """
+    found = _categories_by_lower_name(names)
+    missing = {}
+    for name in sorted(names):
+        if name.lower() not in found:
+            missing.setdefault(name.lower(), name)
+    if missing:
+        CourseCategory.objects.bulk_create(
+            [CourseCategory(name=name) for name in missing.values()], ignore_conflicts=True
+        )
+        found.update(_categories_by_lower_name(missing.values()))
+    return {name: found[name.lower()] for name in names}
+
+
+def _resolve_courses(keys):
+    """Map (category name, course title) pairs to course ids in one query; category names ignore case."""
+    rows = Course.objects.annotate(category_name=Lower('category__name')).filter(
+        category_name__in={category.lower() for category, _ in keys},
+        title__in={title for _, title in keys},
+    ).order_by().values_list('category_name', 'title', 'pk')
+    courses = {(category, title): pk for category, title, pk in rows}
+    return {
+        (category, title): courses[category.lower(), title]
+        for category, title in keys if (category.lower(), title) in courses
+    }
+
+
+def _import_courses(rows, options):
+    valid = []
+    errors = []
+    for line, row in rows:
+        level = row.get('level') or 'beginner'
+        duration = row.get('duration_hours') or '0'
+        if level not in LEVELS:
+            errors.append((line, f'Unknown level "{level}".'))
+        elif not duration.isdigit():
+            errors.append((line, f'Duration "{duration}" is not a whole number of hours.'))
+        else:
+            valid.append((row, level, int(duration)))
+
+    categories = _resolve_categories({row['category'] for row, _, _ in valid})
+    seen = set(
+        Course.objects.filter(category__in=categories.values(), title__in={row['title'] for row, _, _ in valid})
+        .order_by().values_list('category_id', 'title')
+    )
+    new = []
+    for row, level, duration in valid:
+        category = categories[row['category']]
+        if (category.pk, row['title']) in seen:
+            continue
+        seen.add((category.pk, row['title']))
+        new.append(Course(
+            title=row['title'],
+            category=category,
+            description=row.get('description', ''),
+            level=level,
+            duration_hours=duration,
+            created_by=options['user'],
+        ))
+    Course.objects.bulk_create(new, ignore_conflicts=True)
+    # ignore_conflicts leaves the primary keys unset, so look the new rows up again.
+    course_ids = set(
+        Course.objects.filter(
+            category_id__in={course.category_id for course in new}, title__in={course.title for course in new}
+        ).order_by().values_list('pk', flat=True)
+    ) if new else set()
+    return len(new), len(valid) - len(new), errors, course_ids
+
+
+def _import_lessons(rows, options):
+    courses = _resolve_courses({(row['category'], row['course']) for _, row in rows})
+    valid = []
+    errors = []
+    for line, row in rows:
+        course_id = courses.get((row['category'], row['course']))
+        visibility = row.get('visibility') or 'public'
+        if course_id is None:
+            errors.append((line, f'Unknown course "{row["category"]} > {row["course"]}".'))
+        elif visibility not in VISIBILITIES:
+            errors.append((line, f'Unknown visibility "{visibility}".'))
+        else:
+            valid.append((row, course_id, visibility))
+
+    seen = set(
+        Lesson.objects.filter(
+            course_id__in={course_id for _, course_id, _ in valid}, title__in={row['title'] for row, _, _ in valid}
+        ).order_by().values_list('course_id', 'title')
+    )
+    new = []
+    for row, course_id, visibility in valid:
+        if (course_id, row['title']) in seen:
+            continue
+        seen.add((course_id, row['title']))
+        new.append(Lesson(
+            course_id=course_id,
+            title=row['title'],
+            description=row.get('description', ''),
+            visibility=visibility,
+            created_by=options['user'],
+        ))
+    Lesson.objects.bulk_create(new)
+    return len(new), len(valid) - len(new), errors, {lesson.course_id for lesson in new}
+
+
+def _import_enrollments(rows, options):
+    students = dict(User.objects.filter(username__in={row['username'] for _, row in rows}).values_list('username', 'pk'))
+    courses = _resolve_courses({(row['category'], row['course']) for _, row in rows})
+    pairs = []
+    errors = []
+    for line, row in rows:
+        student_id = students.get(row['username'])
+        course_id = courses.get((row['category'], row['course']))
+        if student_id is None:
+            errors.append((line, f'Unknown user "{row["username"]}".'))
+        elif course_id is None:
+            errors.append((line, f'Unknown course "{row["category"]} > {row["course"]}".'))
+        else:
+            pairs.append((student_id, course_id))
+
+    seen = set(
+        CourseEnrollment.objects.filter(
+            student_id__in={student_id for student_id, _ in pairs},
+            course_id__in={course_id for _, course_id in pairs},
+        ).order_by().values_list('student_id', 'course_id')
+    )
+    new = []
+    for pair in pairs:
+        if pair not in seen:
+            seen.add(pair)
+            new.append(CourseEnrollment(student_id=pair[0], course_id=pair[1]))
+    CourseEnrollment.objects.bulk_create(new, ignore_conflicts=True)
+    bump_student_versions({enrollment.student_id for enrollment in new})
+    return len(new), len(pairs) - len(new), errors, {enrollment.course_id for enrollment in new}
+
+
+def _import_users(rows, options):
+    roles = {role.lower(): role for role in options['roles']}
+    existing = set(User.objects.filter(username__in={row['username'] for _, row in rows}).values_list('username', flat=True))
+    hashes = options['password_hashes']
+    new = {}
+    errors = []
+    skipped = 0
+    for line, row in rows:
+        role = roles.get(row['role'].lower())
+        password = row.get('password') or options['default_password']
+        if role is None:
+            errors.append((line, f'Role "{row["role"]}" is not allowed here.'))
+            continue
+        if row['username'] in existing or row['username'] in new:
+            skipped += 1
+            continue
+        if password not in hashes:
+            hashes[password] = make_password(password)
+        new[row['username']] = (role, User(
+            username=row['username'],
+            email=row.get('email', ''),
+            first_name=row.get('first_name', ''),
+            last_name=row.get('last_name', ''),
+            password=hashes[password],
+        ))
+
+    User.objects.bulk_create([user for _, user in new.values()], ignore_conflicts=True)
+    user_ids = dict(User.objects.filter(username__in=new).values_list('username', 'pk'))
+    groups = options['groups']
+    for role in {role for role, _ in new.values()} - groups.keys():
+        groups[role] = Group.objects.get_or_create(name=role)[0].pk
+    membership = User.groups.through
+    membership.objects.bulk_create(
+        [
+            membership(user_id=user_ids[username], group_id=groups[role])
+            for username, (role, _) in new.items()
+            if username in user_ids
+        ],
+        ignore_conflicts=True,
+    )
+    return len(new), skipped, errors, ()
+
+
+# Tables each kind bulk-inserts into, recounted once the import finishes.
+_COUNTED_TABLES = {
+    'courses': (CourseCategory, Course),
+    'lessons': (Lesson,),
+    'enrollments': (CourseEnrollment,),
+}
+
+_IMPORTERS = {
+    'courses': _import_courses,
+    'lessons': _import_lessons,
+    'enrollments': _import_enrollments,
+    'users': _import_users,
+}
+
+
+def _read_rows(reader, columns, stopped):
+    """Yield ``(line, row)`` pairs, ending at the first record that cannot be decoded or parsed.
+
+    The ``(line, message)`` for that record is appended to ``stopped``.
+    """
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        # line_num still points at the last record that parsed.
+        except csv.Error as exc:
+            stopped.append((reader.line_num + 1, f'Unreadable CSV, import stopped here: {exc}.'))
+            return
+        except UnicodeDecodeError as exc:
+            stopped.append((reader.line_num + 1, f'Undecodable text, import stopped here: {exc.reason}.'))
+            return
+        yield reader.line_num, {key: (value or '').strip() for key, value in row.items() if key in columns}
+
+
+def import_csv(kind, stream, *, user=None, roles=(FACULTY, STUDENT), default_password=None,
+               batch_size=IMPORT_BATCH_SIZE):
+    """Import ``kind`` rows from a text ``stream`` of CSV, ``batch_size`` rows at a time.
+
+    Rows that fail validation are reported by line number and skipped;
+    rows that already exist are counted as skipped. Each batch commits
+    on its own, so a bad row never rolls back its neighbours. A record that
+    cannot be decoded or parsed ends the import; the rows read before it
+    are still imported and its line is reported as ``stopped_at``. Raises
+    ``ValueError`` when a required column is missing or the header cannot
+    be read.
+    """
+    required, optional = IMPORT_COLUMNS[kind]
+    reader = csv.DictReader(stream)
+    try:
+        fieldnames = reader.fieldnames or ()
+    except csv.Error as exc:
+        raise ValueError(f'Unreadable CSV header: {exc}.')
+    missing = [column for column in required if column not in fieldnames]
+    if missing:
+        raise ValueError(f'Missing column(s): {", ".join(missing)}.')
+
+    options = {'user': user, 'roles': roles, 'default_password': default_password, 'password_hashes': {}, 'groups': {}}
+    total = created = skipped = 0
+    errors = []
+    stopped = []
+    rows = _read_rows(reader, required + optional, stopped)
+    touched = set()
+    for batch in _batched(rows, batch_size):
+        total += len(batch)
+        valid = []
+        for line, row in batch:
+            blank = [column for column in required if not row.get(column)]
+            if blank:
+                errors.append((line, f'Missing value for {", ".join(blank)}.'))
+            else:
+                valid.append((line, row))
+        if not valid:
+            continue
+        with transaction.atomic():
+            batch_created, batch_skipped, batch_errors, course_ids = _IMPORTERS[kind](valid, options)
+        created += batch_created
+        skipped += batch_skipped
+        errors.extend(batch_errors)
+        touched.update(course_ids)
+
+    if touched and kind != 'courses':
+        # New courses start with zeroed counters; everything else changed them.
+        rebuild_course_counters(touched)
+    if touched and kind in {'courses', 'lessons'}:
+        rebuild_search_index(touched)
+    if created and kind in _COUNTED_TABLES:
+        refresh_row_counts(_COUNTED_TABLES[kind])
+    if created and kind == 'courses':
+        bump_catalog_version()
+    errors.extend(stopped)
+    errors.sort()
+    return ImportReport(kind, total, created, skipped, errors, stopped[0][0] if stopped else None)
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from admin.branding import invalidate_site_assets
+from admin.images import generate_variants
+from admin.models import SiteBranding, WebsiteImage
+
+
+class Command(BaseCommand):
+    help = 'Generate resized WebP/AVIF variants for existing branding logos and website images.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Regenerate variants that already exist.')
+
+    def handle(self, *args, force=False, **options):
+        written = 0
+        for instance, field_file in [
+            *((branding, branding.logo) for branding in SiteBranding.objects.exclude(logo='')),
+            *((image, image.image) for image in WebsiteImage.objects.all()),
+        ]:
+            try:
+                written += len(generate_variants(field_file, force=force))
+            except (OSError, ValueError) as exc:
+                self.stderr.write(f'{instance}: {exc}')
+        invalidate_site_assets()
+        self.stdout.write(self.style.SUCCESS(f'Wrote {written} variant file(s).'))
@@ -0,0 +1,52 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from admin.synthetic import delete_synthetic_data, generate_synthetic_data, synthetic_data_exists
+
+
+class Command(BaseCommand):
+    help = 'Bulk-generate a reproducible catalog, users, enrollments and attendance history for load testing.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--categories', type=int, default=50)
+        parser.add_argument('--courses', type=int, default=2000)
+        parser.add_argument('--lessons', type=int, default=200_000)
+        parser.add_argument('--faculty', type=int, default=100)
+        parser.add_argument('--students', type=int, default=50_000)
+        parser.add_argument('--enrollments-per-student', type=int, default=3)
+        parser.add_argument('--days', type=int, default=730, help='Days of attendance history to generate.')
+        parser.add_argument('--attendance-rate', type=float, default=0.1,
+                            help='Chance that an enrolled student attends on a given day.')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--prefix', default='synthetic', help='Prefix for generated usernames and categories.')
+        parser.add_argument('--password', default='Student@123', help='Password shared by every generated user.')
+        parser.add_argument('--flush', action='store_true', help='Delete data from a previous run with this prefix first.')
+
+    def handle(self, *args, **options):
+        prefix = options['prefix']
+        if options['flush']:
+            delete_synthetic_data(prefix)
+        elif synthetic_data_exists(prefix):
+            raise CommandError(f'Synthetic data with prefix "{prefix}" already exists; pass --flush to replace it.')
+
+        started = time.monotonic()
+        stats = generate_synthetic_data(
+            categories=options['categories'],
+            courses=options['courses'],
+            lessons=options['lessons'],
+            faculty=options['faculty'],
+            students=options['students'],
+            enrollments_per_student=options['enrollments_per_student'],
+            days=options['days'],
+            attendance_rate=options['attendance_rate'],
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            prefix=prefix,
+            password=options['password'],
+            log=self.stdout.write,
+        )
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f'Generated {sum(stats.values())} rows in {elapsed:.1f}s.'))
+
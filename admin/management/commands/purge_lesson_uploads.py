@@ -0,0 +1,16 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from admin.uploads import purge_stale_uploads
+
+
+class Command(BaseCommand):
+    help = 'Delete unfinished chunked lesson uploads and their partial files.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=48, help='Only purge uploads idle for at least this long.')
+
+    def handle(self, *args, hours, **options):
+        purged = purge_stale_uploads(timedelta(hours=hours))
+        self.stdout.write(self.style.SUCCESS(f'Purged {purged} stale upload(s).'))
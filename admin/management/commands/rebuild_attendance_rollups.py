@@ -0,0 +1,33 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from admin.rollups import rebuild_daily_rollups, rebuild_student_attendance
+
+
+def _parse_date(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f'Invalid date "{value}", expected YYYY-MM-DD.')
+
+
+class Command(BaseCommand):
+    help = 'Backfill or rebuild the attendance rollup tables from AttendanceRecord.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', type=_parse_date, help='First day to rebuild (inclusive).')
+        parser.add_argument('--end', type=_parse_date, help='Last day to rebuild (inclusive).')
+        parser.add_argument('--course', type=int, action='append', dest='course_ids', help='Limit to a course id.')
+        parser.add_argument('--daily-only', action='store_true', help='Skip the per-student course summaries.')
+
+    def handle(self, *args, start=None, end=None, course_ids=None, daily_only=False, **options):
+        if start and end and start > end:
+            raise CommandError('--start must not be after --end.')
+
+        daily = rebuild_daily_rollups(start, end, course_ids)
+        self.stdout.write(f'{daily} daily course rollup row(s) written.')
+        if not daily_only:
+            summaries = rebuild_student_attendance(course_ids)
+            self.stdout.write(f'{summaries} student course summary row(s) written.')
+        self.stdout.write(self.style.SUCCESS('Attendance rollups rebuilt.'))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from admin.counters import find_counter_drift, rebuild_course_counters
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the denormalized enrollment/lesson/attendance counters on Course.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--course', type=int, action='append', dest='course_ids', help='Limit to a course id.')
+        parser.add_argument('--verify', action='store_true', help='Report stale counters without changing them.')
+
+    def handle(self, *args, course_ids=None, verify=False, **options):
+        drift = find_counter_drift(course_ids)
+        for course_id, field, stored, actual in drift:
+            self.stdout.write(f'course {course_id}: {field} is {stored}, expected {actual}')
+
+        if verify:
+            if drift:
+                raise CommandError(f'{len(drift)} stale counter(s) found.')
+            self.stdout.write(self.style.SUCCESS('All course counters are up to date.'))
+            return
+
+        updated = rebuild_course_counters(course_ids)
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt counters for {updated} course(s).'))
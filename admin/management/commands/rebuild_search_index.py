@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from admin.search import rebuild_search_index, search_available
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index over courses and lessons.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--course', type=int, action='append', dest='course_ids', help='Limit to a course id.')
+
+    def handle(self, *args, course_ids=None, **options):
+        if not search_available():
+            raise CommandError('The full-text index needs SQLite FTS5; other databases fall back to LIKE queries.')
+        rebuild_search_index(course_ids)
+        scope = f'{len(course_ids)} course(s)' if course_ids else 'all courses and lessons'
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt the search index for {scope}.'))
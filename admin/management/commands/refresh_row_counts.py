@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from admin.rowcounts import COUNTED_MODELS, refresh_row_counts, row_counts
+
+
+class Command(BaseCommand):
+    help = 'Recount the large tables behind the dashboard totals and admin changelist estimates.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verify', action='store_true', help='Report stale totals without changing them.')
+
+    def handle(self, *args, verify=False, **options):
+        stored = row_counts()
+        actual = {model: model.objects.count() for model in COUNTED_MODELS} if verify else refresh_row_counts()
+        drift = [model for model in COUNTED_MODELS if stored[model] != actual[model]]
+        for model in drift:
+            self.stdout.write(f'{model._meta.db_table}: stored {stored[model]}, expected {actual[model]}')
+
+        if verify:
+            if drift:
+                raise CommandError(f'{len(drift)} stale row count(s) found.')
+            self.stdout.write(self.style.SUCCESS('All row counts are up to date.'))
+            return
+
+        self.stdout.write(self.style.SUCCESS(f'Refreshed row counts for {len(COUNTED_MODELS)} table(s).'))
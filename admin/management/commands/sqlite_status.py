@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from admin.db import pragma_matches, read_sqlite_pragmas
+
+
+class Command(BaseCommand):
+    help = 'Report the effective SQLite PRAGMAs and connection settings of a database.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, database, **options):
+        connection = connections[database]
+        if connection.vendor != 'sqlite':
+            raise CommandError(f'Database "{database}" is not SQLite.')
+
+        settings_dict = connection.settings_dict
+        self.stdout.write(f'database      {settings_dict["NAME"]}')
+        self.stdout.write(f'conn_max_age  {settings_dict["CONN_MAX_AGE"]}')
+        self.stdout.write(f'health_checks {settings_dict["CONN_HEALTH_CHECKS"]}')
+        for name, (configured, effective) in read_sqlite_pragmas(connection).items():
+            line = f'{name:<13} {effective} (configured {configured})'
+            if pragma_matches(name, configured, effective):
+                self.stdout.write(line)
+            else:
+                self.stdout.write(self.style.WARNING(line))
@@ -0,0 +1,53 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .routers import end_request, start_request, wrote_to_primary
+
+PIN_COOKIE = 'primary_pin'
+
+
+class PrimaryPinningMiddleware:
+    """Keep a client's reads on the primary for a short window after it writes.
+
+    The window is tracked with a cookie rather than the session so that
+    checking it never costs a query. Works under WSGI and ASGI, so async
+    views are not pushed onto a thread by this middleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        tokens = start_request(pinned=PIN_COOKIE in request.COOKIES)
+        try:
+            response = self.get_response(request)
+            self._pin(response)
+        finally:
+            end_request(tokens)
+        return response
+
+    async def __acall__(self, request):
+        tokens = start_request(pinned=PIN_COOKIE in request.COOKIES)
+        try:
+            response = await self.get_response(request)
+            self._pin(response)
+        finally:
+            end_request(tokens)
+        return response
+
+    def _pin(self, response):
+        if wrote_to_primary():
+            response.set_cookie(
+                PIN_COOKIE,
+                '1',
+                max_age=getattr(settings, 'REPLICA_PIN_SECONDS', 10),
+                httponly=True,
+                samesite='Lax',
+            )
@@ -0,0 +1,41 @@
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_course_counters(apps, schema_editor):
+    Course = apps.get_model('custom_admin', 'Course')
+    children = {
+        'enrollment_count': apps.get_model('custom_admin', 'CourseEnrollment'),
+        'lesson_count': apps.get_model('custom_admin', 'Lesson'),
+        'attendance_count': apps.get_model('custom_admin', 'AttendanceRecord'),
+    }
+    for field, model in children.items():
+        rows = model.objects.order_by().values('course_id').annotate(total=Count('id'))
+        for row in rows:
+            Course.objects.filter(pk=row['course_id']).update(**{field: row['total']})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_admin', '0004_lesson_lesson_file'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='attendance_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='enrollment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='lesson_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_course_counters, migrations.RunPython.noop),
+    ]
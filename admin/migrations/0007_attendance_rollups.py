@@ -0,0 +1,59 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def backfill_attendance_rollups(apps, schema_editor):
+    AttendanceRecord = apps.get_model('custom_admin', 'AttendanceRecord')
+    AttendanceDailyRollup = apps.get_model('custom_admin', 'AttendanceDailyRollup')
+    StudentCourseAttendance = apps.get_model('custom_admin', 'StudentCourseAttendance')
+
+    daily = AttendanceRecord.objects.order_by().values('course_id', 'attendance_date').annotate(present_count=Count('id'))
+    AttendanceDailyRollup.objects.bulk_create([AttendanceDailyRollup(**row) for row in daily], batch_size=1000)
+
+    students = AttendanceRecord.objects.order_by().values('student_id', 'course_id').annotate(
+        present_days=Count('id'),
+        last_attended=Max('attendance_date'),
+    )
+    StudentCourseAttendance.objects.bulk_create([StudentCourseAttendance(**row) for row in students], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_admin', '0006_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attendance_date', models.DateField()),
+                ('present_count', models.PositiveIntegerField(default=0)),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_attendance', to='custom_admin.course')),
+            ],
+            options={
+                'ordering': ['-attendance_date'],
+                'indexes': [models.Index(fields=['attendance_date'], name='rollup_daily_date_idx')],
+                'unique_together': {('course', 'attendance_date')},
+            },
+        ),
+        migrations.CreateModel(
+            name='StudentCourseAttendance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('present_days', models.PositiveIntegerField(default=0)),
+                ('last_attended', models.DateField(blank=True, null=True)),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='student_attendance', to='custom_admin.course')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='course_attendance', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'Student course attendance',
+                'unique_together': {('student', 'course')},
+            },
+        ),
+        migrations.RunPython(backfill_attendance_rollups, migrations.RunPython.noop),
+    ]
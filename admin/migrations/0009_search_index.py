@@ -0,0 +1,39 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        'CREATE VIRTUAL TABLE custom_admin_search USING fts5('
+        'title, body, context, kind UNINDEXED, course_id UNINDEXED, visible UNINDEXED, '
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+    # Titles outweigh the course/category context, which outweighs descriptions.
+    schema_editor.execute("INSERT INTO custom_admin_search (custom_admin_search, rank) VALUES ('rank', 'bm25(10.0, 1.0, 3.0)')")
+    schema_editor.execute(
+        'INSERT INTO custom_admin_search (rowid, title, body, context, kind, course_id, visible) '
+        "SELECT c.id * 2, c.title, c.description, cat.name, 'course', c.id, c.is_active "
+        'FROM custom_admin_course c JOIN custom_admin_coursecategory cat ON cat.id = c.category_id'
+    )
+    schema_editor.execute(
+        'INSERT INTO custom_admin_search (rowid, title, body, context, kind, course_id, visible) '
+        "SELECT l.id * 2 + 1, l.title, l.description, c.title, 'lesson', l.course_id, l.visibility = 'public' "
+        'FROM custom_admin_lesson l JOIN custom_admin_course c ON c.id = l.course_id'
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute('DROP TABLE IF EXISTS custom_admin_search')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_admin', '0008_lesson_uploads'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
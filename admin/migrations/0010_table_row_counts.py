@@ -0,0 +1,31 @@
+from django.db import migrations, models
+from django.utils import timezone
+
+COUNTED_MODELS = ['CourseCategory', 'Course', 'Lesson', 'CourseEnrollment', 'AttendanceRecord']
+
+
+def backfill_row_counts(apps, schema_editor):
+    TableRowCount = apps.get_model('custom_admin', 'TableRowCount')
+    now = timezone.now()
+    for name in COUNTED_MODELS:
+        model = apps.get_model('custom_admin', name)
+        TableRowCount.objects.create(table=model._meta.db_table, row_count=model.objects.count(), refreshed_at=now)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_admin', '0009_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TableRowCount',
+            fields=[
+                ('table', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('row_count', models.BigIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_row_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_admin', '0011_course_updated_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='lessonupload',
+            name='sha256',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
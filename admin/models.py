@@ -1,5 +1,16 @@
-from django.db import models
+import uuid
+
+from django.db import models, router, transaction
 from django.conf import settings
+from django.db.models import Prefetch
+from django.dispatch import Signal
+
+# Sent with a queryset of the rows a Lesson, CourseEnrollment or
+# AttendanceRecord delete() is about to remove, inside its transaction.
+# Receivers fix up derived data with set-based SQL and may append callables
+# to ``on_deleted`` to run once the rows are gone. Unlike pre_delete it
+# leaves Django's fast delete path alone, so no row is loaded into memory.
+rows_deleting = Signal()
 
 
 class SiteBranding(models.Model):
@@ -38,6 +49,43 @@ class WebsiteImage(models.Model):
         return self.title
 
 
+class AtomicSaveMixin:
+    """Save inside a transaction, so post_save bookkeeping commits or rolls back with the row."""
+
+    def save(self, **kwargs):
+        with transaction.atomic(using=kwargs.get('using') or router.db_for_write(type(self), instance=self)):
+            super().save(**kwargs)
+
+
+def _tracked_delete(model, queryset, delete, using):
+    on_deleted = []
+    with transaction.atomic(using=using):
+        rows_deleting.send(sender=model, queryset=queryset, on_deleted=on_deleted)
+        result = delete()
+        for callback in on_deleted:
+            callback()
+    return result
+
+
+class TrackedDeleteQuerySet(models.QuerySet):
+    def delete(self):
+        return _tracked_delete(self.model, self, super().delete, self._db or router.db_for_write(self.model))
+
+
+class TrackedDeleteMixin:
+    """Send ``rows_deleting`` for this row before it is deleted."""
+
+    def delete(self, using=None, keep_parents=False):
+        model = type(self)
+        using = using or router.db_for_write(model, instance=self)
+        return _tracked_delete(
+            model,
+            model._base_manager.using(using).filter(pk=self.pk),
+            lambda: super(TrackedDeleteMixin, self).delete(using=using, keep_parents=keep_parents),
+            using,
+        )
+
+
 class CourseCategory(models.Model):
     name = models.CharField(max_length=120, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -70,7 +118,13 @@ class Course(models.Model):
         related_name='created_courses',
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     is_active = models.BooleanField(default=True)
+    enrollment_count = models.PositiveIntegerField(default=0, editable=False)
+    lesson_count = models.PositiveIntegerField(default=0, editable=False)
+    attendance_count = models.PositiveIntegerField(default=0, editable=False)
+
+    COUNTER_FIELDS = ('enrollment_count', 'lesson_count', 'attendance_count')
 
     class Meta:
         ordering = ['category__name', 'title']
@@ -79,8 +133,32 @@ class Course(models.Model):
     def __str__(self):
         return f'{self.title} ({self.category.name})'
 
+    def save(self, **kwargs):
+        # Counters only change through UPDATE ... SET n = n + delta; writing
+        # back this instance's copies would undo concurrent adjustments.
+        if not self._state.adding and not kwargs.get('force_insert'):
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None:
+                update_fields = [field.name for field in self._meta.concrete_fields if not field.primary_key]
+            # updated_at always goes along: the dashboard API's catalog
+            # deltas select courses by it.
+            kwargs['update_fields'] = {name for name in update_fields if name not in self.COUNTER_FIELDS} | {'updated_at'}
+        super().save(**kwargs)
+
 
-class Lesson(models.Model):
+class LessonQuerySet(TrackedDeleteQuerySet):
+    def public(self):
+        return self.filter(visibility='public')
+
+
+def prefetch_latest_lessons(limit, queryset=None, lookup='lessons', to_attr='recent_lessons'):
+    """Prefetch at most ``limit`` newest lessons per course in a single query."""
+    if queryset is None:
+        queryset = Lesson.objects.public()
+    return Prefetch(lookup, queryset=queryset.order_by('-created_at', '-id')[:limit], to_attr=to_attr)
+
+
+class Lesson(AtomicSaveMixin, TrackedDeleteMixin, models.Model):
     VISIBILITY_CHOICES = [
         ('public', 'Public'),
         ('private', 'Private'),
@@ -101,27 +179,38 @@ class Lesson(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = LessonQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['course', 'visibility', '-created_at'], name='lesson_course_vis_created_idx'),
+            models.Index(fields=['-created_at'], name='lesson_created_idx'),
+        ]
 
     def __str__(self):
         return f'{self.title} - {self.course.title}'
 
 
-class CourseEnrollment(models.Model):
+class CourseEnrollment(AtomicSaveMixin, TrackedDeleteMixin, models.Model):
     student = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='enrollments')
     course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='enrollments')
     enrolled_at = models.DateTimeField(auto_now_add=True)
 
+    objects = TrackedDeleteQuerySet.as_manager()
+
     class Meta:
         unique_together = [('student', 'course')]
         ordering = ['-enrolled_at']
+        indexes = [
+            models.Index(fields=['-enrolled_at'], name='enrollment_enrolled_idx'),
+        ]
 
     def __str__(self):
         return f'{self.student.username} -> {self.course.title}'
 
 
-class AttendanceRecord(models.Model):
+class AttendanceRecord(AtomicSaveMixin, TrackedDeleteMixin, models.Model):
     SOURCE_CHOICES = [
         ('enroll', 'Enroll'),
         ('enter', 'Enter Course'),
@@ -133,9 +222,85 @@ class AttendanceRecord(models.Model):
     source = models.CharField(max_length=20, choices=SOURCE_CHOICES, default='enter')
     marked_at = models.DateTimeField(auto_now_add=True)
 
+    objects = TrackedDeleteQuerySet.as_manager()
+
     class Meta:
         unique_together = [('student', 'course', 'attendance_date')]
         ordering = ['-attendance_date', '-marked_at']
+        indexes = [
+            models.Index(fields=['course', 'attendance_date'], name='attendance_course_date_idx'),
+            models.Index(fields=['-attendance_date', '-marked_at'], name='attendance_recent_idx'),
+        ]
 
     def __str__(self):
         return f'{self.student.username} {self.course.title} {self.attendance_date}'
+
+
+class AttendanceDailyRollup(models.Model):
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='daily_attendance')
+    attendance_date = models.DateField()
+    present_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = [('course', 'attendance_date')]
+        ordering = ['-attendance_date']
+        indexes = [
+            models.Index(fields=['attendance_date'], name='rollup_daily_date_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.course.title} {self.attendance_date}: {self.present_count}'
+
+
+class StudentCourseAttendance(models.Model):
+    student = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='course_attendance')
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='student_attendance')
+    present_days = models.PositiveIntegerField(default=0)
+    last_attended = models.DateField(null=True, blank=True)
+
+    class Meta:
+        unique_together = [('student', 'course')]
+        verbose_name_plural = 'Student course attendance'
+
+    def __str__(self):
+        return f'{self.student.username} {self.course.title}: {self.present_days}'
+
+
+class LessonUpload(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    lesson = models.ForeignKey(Lesson, on_delete=models.CASCADE, related_name='uploads')
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    sha256 = models.CharField(max_length=64, blank=True)
+    offset = models.PositiveBigIntegerField(default=0)
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='lesson_uploads')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f'{self.filename} ({self.offset}/{self.size})'
+
+
+class TableRowCount(models.Model):
+    """Stored row count for a large table, so pages can show totals without COUNT(*)."""
+
+    table = models.CharField(max_length=100, primary_key=True)
+    row_count = models.BigIntegerField(default=0)
+    refreshed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f'{self.table}: {self.row_count}'
+
+
+class DashboardVersion(models.Model):
+    """Change token behind the student dashboard API's ETags, one row per scope."""
+
+    key = models.CharField(max_length=64, primary_key=True)
+    token = models.CharField(max_length=32)
+
+    def __str__(self):
+        return f'{self.key}: {self.token}'
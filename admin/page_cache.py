@@ -0,0 +1,104 @@
+import hashlib
+from datetime import UTC, datetime
+from functools import lru_cache, wraps
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+from .branding import get_site_assets
+
+_BUILD_SUFFIXES = {'.py', '.html', '.txt', '.xml'}
+
+
+def _enabled():
+    return getattr(settings, 'PUBLIC_PAGE_CACHE', True)
+
+
+def _build_roots():
+    roots = [Path(directory) for engine in settings.TEMPLATES for directory in engine.get('DIRS', ())]
+    return [*roots, Path(__file__).resolve().parent]
+
+
+@lru_cache(maxsize=None)
+def build_version():
+    """Return ``(version, modified)`` for the deployed templates and code.
+
+    The version is ``DEPLOY_VERSION`` when set, else a digest of the project
+    templates and this app's files; ``modified`` is the newest of their
+    modification times. Computed once per process.
+    """
+    configured = getattr(settings, 'DEPLOY_VERSION', '')
+    digest = hashlib.sha1()
+    modified = 0
+    for root in _build_roots():
+        for path in sorted(root.rglob('*')):
+            if path.suffix not in _BUILD_SUFFIXES or not path.is_file():
+                continue
+            modified = max(modified, path.stat().st_mtime)
+            if not configured:
+                digest.update(path.relative_to(root).as_posix().encode())
+                digest.update(path.read_bytes())
+    return configured or digest.hexdigest()[:12], datetime.fromtimestamp(int(modified), UTC)
+
+
+@receiver(setting_changed)
+def reset_build_version(setting, **kwargs):
+    if setting in {'DEPLOY_VERSION', 'TEMPLATES'}:
+        build_version.cache_clear()
+
+
+def _page_version():
+    return f'{build_version()[0]}-{get_site_assets().version}'
+
+
+def cached_public_page(view_func):
+    """Cache a public page's rendered body keyed on the build and site assets versions.
+
+    The ETag and Last-Modified validators come from the same versions, so
+    conditional requests are answered with 304 before anything is rendered,
+    and a deploy that changes templates or code starts fresh. Nothing is
+    invalidated across processes: the site assets version is a digest of
+    the rows, so a change made by another worker reaches this one's keys and
+    validators within SITE_ASSETS_LOCAL_TIMEOUT.
+    """
+    name = view_func.__name__
+
+    def page_etag(request, *args, **kwargs):
+        if _enabled():
+            return f'{name}-{_page_version()}'
+        return None
+
+    def page_last_modified(request, *args, **kwargs):
+        if _enabled():
+            return max(filter(None, (get_site_assets().modified, build_version()[1])))
+        return None
+
+    @wraps(view_func)
+    def cached_view(request, *args, **kwargs):
+        if not _enabled() or request.method not in ('GET', 'HEAD'):
+            return view_func(request, *args, **kwargs)
+
+        key = f'public_page:{name}:{_page_version()}'
+        cached = cache.get(key)
+        if cached is None:
+            response = view_func(request, *args, **kwargs)
+            if response.status_code != 200 or response.streaming:
+                return response
+            cache.set(
+                key,
+                (response.content, response['Content-Type']),
+                getattr(settings, 'PUBLIC_PAGE_CACHE_TIMEOUT', 3600),
+            )
+        else:
+            content, content_type = cached
+            response = HttpResponse(content, content_type=content_type)
+        patch_cache_control(response, public=True, no_cache=True)
+        return response
+
+    return condition(etag_func=page_etag, last_modified_func=page_last_modified)(cached_view)
@@ -0,0 +1,234 @@
+import base64
+import binascii
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator
+from django.db.models import F, Q
+from django.db.models.constants import LOOKUP_SEP
+from django.utils.functional import cached_property
+
+from .rowcounts import estimated_count
+
+CURSOR_VAR = 'cursor'
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class KeysetPage:
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    @property
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+
+def _resolve_field(model, name):
+    *relations, last = name.split(LOOKUP_SEP)
+    try:
+        for part in relations:
+            model = model._meta.get_field(part).related_model
+            if model is None:
+                raise ValueError(f'Cannot order by "{name}".')
+        return model._meta.pk if last == 'pk' else model._meta.get_field(last)
+    except FieldDoesNotExist:
+        raise ValueError(f'Cannot order by "{name}".')
+
+
+def keyset_ordering(queryset):
+    """Return the queryset's ordering as ``(name, descending)`` pairs ending in the primary key.
+
+    Only plain, non-null columns can form a cursor; anything else raises
+    ValueError so callers can fall back to OFFSET pagination.
+    """
+    query = queryset.query
+    terms = query.order_by or (query.default_ordering and queryset.model._meta.ordering) or ()
+    ordering = []
+    for term in terms:
+        if not isinstance(term, str) or term == '?':
+            raise ValueError(f'Cannot build a cursor from {term!r}.')
+        name = term.lstrip('-')
+        field = _resolve_field(queryset.model, name)
+        if field.null or (field.is_relation and name.rsplit(LOOKUP_SEP, 1)[-1] != field.attname):
+            raise ValueError(f'Cannot build a cursor from "{name}".')
+        ordering.append((name, term.startswith('-')))
+        if LOOKUP_SEP not in name and field.primary_key:
+            return ordering
+    ordering.append(('pk', ordering[-1][1] if ordering else False))
+    return ordering
+
+
+def _json_value(value):
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, uuid.UUID)):
+        return str(value)
+    return value
+
+
+def encode_cursor(values, backwards=False):
+    payload = json.dumps([int(backwards), [_json_value(value) for value in values]], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, model, ordering):
+    """Return ``(backwards, values)``, converted back to the ordering fields' Python types."""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        backwards, values = json.loads(payload)
+        if len(values) != len(ordering):
+            raise InvalidCursor('The cursor does not match this listing.')
+        values = [
+            _resolve_field(model, name).to_python(value)
+            for (name, _), value in zip(ordering, values)
+        ]
+    except InvalidCursor:
+        raise
+    except (binascii.Error, TypeError, ValueError, ValidationError):
+        raise InvalidCursor('Malformed cursor.')
+    return bool(backwards), values
+
+
+def _seek(ordering, values, backwards):
+    """``WHERE`` clause for rows strictly after ``values`` in ``ordering`` (before, if ``backwards``)."""
+    condition = Q()
+    for index, (name, descending) in enumerate(ordering):
+        lookup = 'lt' if descending != backwards else 'gt'
+        ties = {ordering_name: value for (ordering_name, _), value in zip(ordering[:index], values)}
+        condition |= Q(**ties, **{f'{name}__{lookup}': values[index]})
+    # The redundant bound on the leading column lets the database seek
+    # straight to the cursor in an index instead of filtering from the start.
+    name, descending = ordering[0]
+    return Q(**{f'{name}__{"lte" if descending != backwards else "gte"}': values[0]}) & condition
+
+
+class KeysetPaginator:
+    """Paginate on ``(ordering fields, pk)`` instead of OFFSET, so every page costs the same.
+
+    Pages are addressed by opaque cursors rather than numbers; ``page(None)``
+    is the first page.
+    """
+
+    def __init__(self, object_list, per_page):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.ordering = keyset_ordering(object_list)
+
+    @cached_property
+    def count(self):
+        return self.object_list.count()
+
+    def _window(self, cursor):
+        backwards, values = decode_cursor(cursor, self.object_list.model, self.ordering) if cursor else (False, None)
+        keys = [f'_keyset_{index}' for index in range(len(self.ordering))]
+        queryset = self.object_list.annotate(**{key: F(name) for key, (name, _) in zip(keys, self.ordering)})
+        queryset = queryset.order_by(*[
+            f'{"-" if descending != backwards else ""}{name}' for name, descending in self.ordering
+        ])
+        if values is not None:
+            queryset = queryset.filter(_seek(self.ordering, values, backwards))
+        return queryset[:self.per_page + 1], keys, backwards, values is not None
+
+    def _page(self, rows, keys, backwards, after_cursor):
+        more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if backwards:
+            rows.reverse()
+        if not rows:
+            return KeysetPage(rows)
+
+        def cursor_for(row, towards_start):
+            return encode_cursor([getattr(row, key) for key in keys], backwards=towards_start)
+
+        has_next = more if not backwards else True
+        has_previous = more if backwards else after_cursor
+        return KeysetPage(
+            rows,
+            next_cursor=cursor_for(rows[-1], False) if has_next else None,
+            previous_cursor=cursor_for(rows[0], True) if has_previous else None,
+        )
+
+    def page(self, cursor=None):
+        queryset, *state = self._window(cursor)
+        return self._page(list(queryset), *state)
+
+    async def apage(self, cursor=None):
+        queryset, *state = self._window(cursor)
+        return self._page([row async for row in queryset], *state)
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that reads unfiltered totals from the row-count table instead of COUNT(*)."""
+
+    @cached_property
+    def count(self):
+        return estimated_count(self.object_list)
+
+
+class KeysetChangeList(ChangeList):
+    """ChangeList that pages by cursor, falling back to OFFSET pages for orderings a cursor cannot follow."""
+
+    keyset_page = None
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_results(self, request):
+        try:
+            paginator = KeysetPaginator(self.queryset, self.list_per_page)
+        except ValueError:
+            return super().get_results(request)
+        try:
+            page = paginator.page(request.GET.get(CURSOR_VAR))
+        except InvalidCursor:
+            raise IncorrectLookupParameters
+
+        # Totals come from the ModelAdmin's paginator, so admins using
+        # EstimatedCountPaginator skip both COUNT(*) queries.
+        self.result_count = self.model_admin.get_paginator(request, self.queryset, self.list_per_page).count
+        self.show_full_result_count = self.model_admin.show_full_result_count
+        self.full_result_count = (
+            self.model_admin.get_paginator(request, self.root_queryset, self.list_per_page).count
+            if self.show_full_result_count else None
+        )
+        self.show_admin_actions = not self.show_full_result_count or bool(self.full_result_count)
+        self.result_list = page.object_list
+        self.can_show_all = False
+        self.multi_page = page.has_other_pages
+        self.paginator = paginator
+        self.keyset_page = page
+
+
+class KeysetPaginationMixin:
+    """Use cursor pagination on a ModelAdmin changelist."""
+
+    change_list_template = 'admin/keyset_change_list.html'
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
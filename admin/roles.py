@@ -0,0 +1,79 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+FACULTY = 'Faculty'
+STUDENT = 'Student'
+
+_GENERATION_KEY = 'roles:generation'
+
+
+def _timeout():
+    # Invalidation only reaches processes that share the cache; with the
+    # default per-process LocMemCache this bounds how long a removed role
+    # keeps working in the other workers.
+    return getattr(settings, 'ROLE_CACHE_TIMEOUT', 60)
+
+
+def _new_generation():
+    return uuid.uuid4().hex[:12]
+
+
+def _generation():
+    generation = cache.get(_GENERATION_KEY)
+    if generation is None:
+        cache.add(_GENERATION_KEY, _new_generation(), _timeout())
+        generation = cache.get(_GENERATION_KEY) or _new_generation()
+    return generation
+
+
+def _cache_key(user_id, generation=None):
+    return f'roles:{generation or _generation()}:{user_id}'
+
+
+def get_user_roles(user):
+    """Return the user's group names, loaded at most once per request."""
+    if not user.is_authenticated:
+        return frozenset()
+    roles = getattr(user, '_role_cache', None)
+    if roles is None:
+        key = _cache_key(user.pk)
+        roles = cache.get(key)
+        if roles is None:
+            roles = frozenset(user.groups.values_list('name', flat=True))
+            cache.set(key, roles, _timeout())
+        user._role_cache = roles
+    return roles
+
+
+async def _ageneration():
+    generation = await cache.aget(_GENERATION_KEY)
+    if generation is None:
+        await cache.aadd(_GENERATION_KEY, _new_generation(), _timeout())
+        generation = await cache.aget(_GENERATION_KEY) or _new_generation()
+    return generation
+
+
+async def aget_user_roles(user):
+    """Async ``get_user_roles``, sharing the same per-request and cache entries."""
+    if not user.is_authenticated:
+        return frozenset()
+    roles = getattr(user, '_role_cache', None)
+    if roles is None:
+        key = _cache_key(user.pk, await _ageneration())
+        roles = await cache.aget(key)
+        if roles is None:
+            roles = frozenset([name async for name in user.groups.values_list('name', flat=True)])
+            await cache.aset(key, roles, _timeout())
+        user._role_cache = roles
+    return roles
+
+
+def invalidate_roles(user_ids=None):
+    """Drop cached roles for ``user_ids``, or for every user when omitted."""
+    if user_ids is None:
+        cache.set(_GENERATION_KEY, _new_generation(), _timeout())
+        return
+    generation = _generation()
+    cache.delete_many([_cache_key(user_id, generation) for user_id in user_ids])
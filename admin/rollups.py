@@ -0,0 +1,176 @@
+from itertools import islice
+
+from django.db import connections, router, transaction
+from django.db.models import Count, Max, Min
+
+from .models import AttendanceDailyRollup, AttendanceRecord, StudentCourseAttendance
+from .versions import bump_course_versions, bump_student_versions
+
+
+def _upsert_sql(connection, model, key_fields, add_field, extra_sets=()):
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    columns = [model._meta.get_field(name).column for name in (*key_fields, add_field, *(name for name, _ in extra_sets))]
+    key_columns = ', '.join(quote(model._meta.get_field(name).column) for name in key_fields)
+    add_column = quote(model._meta.get_field(add_field).column)
+    updates = [f'{add_column} = {table}.{add_column} + excluded.{add_column}']
+    for name, function in extra_sets:
+        column = quote(model._meta.get_field(name).column)
+        updates.append(f'{column} = {function}({table}.{column}, excluded.{column})')
+    return 'INSERT INTO {} ({}) VALUES ({}) ON CONFLICT ({}) DO UPDATE SET {}'.format(
+        table,
+        ', '.join(quote(column) for column in columns),
+        ', '.join(['%s'] * len(columns)),
+        key_columns,
+        ', '.join(updates),
+    )
+
+
+def record_attendance(rows):
+    """Fold newly inserted ``(student_id, course_id, attendance_date)`` rows into the rollups.
+
+    Only call this for rows that were actually written; repeats would be
+    counted twice.
+    """
+    daily = {}
+    students = {}
+    for student_id, course_id, attendance_date in rows:
+        daily[course_id, attendance_date] = daily.get((course_id, attendance_date), 0) + 1
+        present, last = students.get((student_id, course_id), (0, attendance_date))
+        students[student_id, course_id] = (present + 1, max(last, attendance_date))
+    if not daily:
+        return
+
+    connection = connections[router.db_for_write(AttendanceDailyRollup)]
+    adapt = connection.ops.adapt_datefield_value
+    greatest = 'MAX' if connection.vendor == 'sqlite' else 'GREATEST'
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.executemany(
+            _upsert_sql(connection, AttendanceDailyRollup, ['course', 'attendance_date'], 'present_count'),
+            [(course_id, adapt(day), count) for (course_id, day), count in daily.items()],
+        )
+        cursor.executemany(
+            _upsert_sql(
+                connection, StudentCourseAttendance, ['student', 'course'], 'present_days',
+                extra_sets=[('last_attended', greatest)],
+            ),
+            [(student_id, course_id, present, adapt(last)) for (student_id, course_id), (present, last) in students.items()],
+        )
+    bump_student_versions(student_id for student_id, _ in students)
+    bump_course_versions(course_id for course_id, _ in daily)
+
+
+def _bulk_insert(model, objects, batch_size):
+    objects = iter(objects)
+    total = 0
+    while batch := list(islice(objects, batch_size)):
+        model.objects.bulk_create(batch)
+        total += len(batch)
+    return total
+
+
+def rebuild_daily_rollups(start=None, end=None, course_ids=None, batch_size=5000):
+    """Recompute per-course daily totals from the raw records; returns rows written."""
+    records = AttendanceRecord.objects.order_by()
+    rollups = AttendanceDailyRollup.objects.all()
+    if start:
+        records = records.filter(attendance_date__gte=start)
+        rollups = rollups.filter(attendance_date__gte=start)
+    if end:
+        records = records.filter(attendance_date__lte=end)
+        rollups = rollups.filter(attendance_date__lte=end)
+    if course_ids is not None:
+        records = records.filter(course_id__in=course_ids)
+        rollups = rollups.filter(course_id__in=course_ids)
+
+    totals = records.values('course_id', 'attendance_date').annotate(total=Count('id'))
+    with transaction.atomic(using=router.db_for_write(AttendanceDailyRollup)):
+        rollups.delete()
+        bump_course_versions(course_ids)
+        return _bulk_insert(
+            AttendanceDailyRollup,
+            (
+                AttendanceDailyRollup(course_id=row['course_id'], attendance_date=row['attendance_date'], present_count=row['total'])
+                for row in totals.iterator(chunk_size=batch_size)
+            ),
+            batch_size,
+        )
+
+
+def rebuild_student_attendance(course_ids=None, student_ids=None, batch_size=5000):
+    """Recompute per-student course summaries from the raw records; returns rows written."""
+    if student_ids is None:
+        return _rebuild_student_attendance(course_ids, None, batch_size)
+    student_ids = sorted(set(student_ids))
+    written = 0
+    with transaction.atomic(using=router.db_for_write(StudentCourseAttendance)):
+        # Batched so a large id list stays under the backend's parameter limit.
+        for index in range(0, len(student_ids), batch_size):
+            written += _rebuild_student_attendance(course_ids, student_ids[index:index + batch_size], batch_size)
+    return written
+
+
+def _rebuild_student_attendance(course_ids, student_ids, batch_size):
+    records = AttendanceRecord.objects.order_by()
+    summaries = StudentCourseAttendance.objects.all()
+    if course_ids is not None:
+        records = records.filter(course_id__in=course_ids)
+        summaries = summaries.filter(course_id__in=course_ids)
+    if student_ids is not None:
+        records = records.filter(student_id__in=student_ids)
+        summaries = summaries.filter(student_id__in=student_ids)
+
+    totals = records.values('student_id', 'course_id').annotate(
+        present_days=Count('id'),
+        last_attended=Max('attendance_date'),
+    )
+    with transaction.atomic(using=router.db_for_write(StudentCourseAttendance)):
+        summaries.delete()
+        written = _bulk_insert(
+            StudentCourseAttendance,
+            (StudentCourseAttendance(**row) for row in totals.iterator(chunk_size=batch_size)),
+            batch_size,
+        )
+        bump_student_versions(student_ids)
+    return written
+
+
+def refresh_attendance_rollups(rows):
+    """Recompute the rollup rows touched by updated or deleted records.
+
+    However many rows are passed, this is one rebuild over the courses,
+    students and date span they cover.
+    """
+    rows = set(rows)
+    if not rows:
+        return
+    student_ids = {student_id for student_id, _, _ in rows}
+    course_ids = {course_id for _, course_id, _ in rows}
+    dates = [attendance_date for _, _, attendance_date in rows]
+    refresh_attendance_span(min(dates), max(dates), course_ids, student_ids)
+
+
+def attendance_span(records):
+    """Return the ``(start, end, course_ids, student_ids)`` that ``records`` cover, or None.
+
+    Read before the records are deleted and passed to
+    refresh_attendance_span afterwards; it holds one entry per course and
+    student, never one per record.
+    """
+    span = records.aggregate(start=Min('attendance_date'), end=Max('attendance_date'))
+    if span['start'] is None:
+        return None
+    records = records.order_by()
+    return (
+        span['start'],
+        span['end'],
+        set(records.values_list('course_id', flat=True).distinct()),
+        set(records.values_list('student_id', flat=True).distinct()),
+    )
+
+
+def refresh_attendance_span(start, end, course_ids, student_ids):
+    with transaction.atomic(using=router.db_for_write(AttendanceDailyRollup)):
+        rebuild_daily_rollups(start, end, course_ids)
+        rebuild_student_attendance(course_ids, student_ids)
+
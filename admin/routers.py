@@ -0,0 +1,65 @@
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = 'replica'
+
+_pinned = ContextVar('primary_pinned', default=False)
+_wrote = ContextVar('primary_wrote', default=False)
+
+
+def pin_to_primary():
+    _pinned.set(True)
+
+
+def is_pinned_to_primary():
+    return _pinned.get()
+
+
+def start_request(pinned=False):
+    """Reset the pinning state for a new request; returns tokens for ``end_request``."""
+    return _pinned.set(pinned), _wrote.set(False)
+
+
+def end_request(tokens):
+    pinned_token, wrote_token = tokens
+    _pinned.reset(pinned_token)
+    _wrote.reset(wrote_token)
+
+
+def wrote_to_primary():
+    return _wrote.get()
+
+
+def replica_available():
+    if REPLICA_DB_ALIAS not in settings.DATABASES:
+        return False
+    # A test mirror shares the primary's settings; reading through a second
+    # connection would hide the test transaction's writes.
+    return connections[REPLICA_DB_ALIAS].settings_dict is not connections[DEFAULT_DB_ALIAS].settings_dict
+
+
+class PrimaryReplicaRouter:
+    """Send reads to the replica and writes and migrations to the primary.
+
+    Once anything is written, reads stay on the primary for the rest of the
+    request, and ``PrimaryPinningMiddleware`` extends that to the client's
+    next few requests.
+    """
+
+    def db_for_read(self, model, **hints):
+        if _pinned.get() or connections[DEFAULT_DB_ALIAS].in_atomic_block or not replica_available():
+            return DEFAULT_DB_ALIAS
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        _pinned.set(True)
+        _wrote.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return {obj1._state.db, obj2._state.db} <= {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,59 @@
+from asgiref.sync import sync_to_async
+from django.db.models import F
+from django.utils import timezone
+
+from .models import AttendanceRecord, Course, CourseCategory, CourseEnrollment, Lesson, TableRowCount
+
+# Tables whose totals are kept in TableRowCount. Single-row saves and
+# deletes adjust them through signals; bulk loaders call refresh_row_counts().
+COUNTED_MODELS = (CourseCategory, Course, Lesson, CourseEnrollment, AttendanceRecord)
+
+
+def adjust_row_count(model, delta):
+    TableRowCount.objects.filter(pk=model._meta.db_table).update(row_count=F('row_count') + delta)
+
+
+def refresh_row_counts(models=COUNTED_MODELS):
+    """Recount ``models`` exactly and store the totals; return ``{model: count}``."""
+    now = timezone.now()
+    counts = {model: model.objects.count() for model in models}
+    rows = [
+        TableRowCount(table=model._meta.db_table, row_count=count, refreshed_at=now) for model, count in counts.items()
+    ]
+    TableRowCount.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=['table'],
+        update_fields=['row_count', 'refreshed_at'],
+    )
+    return counts
+
+
+def row_counts(models=COUNTED_MODELS):
+    """Return ``{model: rows}`` from the stats table, counting any table not stored yet."""
+    tables = {model._meta.db_table: model for model in models}
+    stored = dict(TableRowCount.objects.filter(pk__in=tables).values_list('table', 'row_count'))
+    counts = {model: stored[table] for table, model in tables.items() if table in stored}
+    missing = [model for model in models if model not in counts]
+    if missing:
+        counts.update(refresh_row_counts(missing))
+    return counts
+
+
+async def arow_counts(models=COUNTED_MODELS):
+    tables = {model._meta.db_table: model for model in models}
+    rows = TableRowCount.objects.filter(pk__in=tables).values_list('table', 'row_count')
+    stored = {table: count async for table, count in rows}
+    counts = {model: stored[table] for table, model in tables.items() if table in stored}
+    missing = [model for model in models if model not in counts]
+    if missing:
+        counts.update(await sync_to_async(refresh_row_counts)(missing))
+    return counts
+
+
+def estimated_count(queryset):
+    """Stored total for an unfiltered queryset over a counted table, else an exact COUNT."""
+    query = queryset.query
+    if queryset.model in COUNTED_MODELS and not query.where and not query.is_sliced and not query.distinct:
+        return row_counts([queryset.model])[queryset.model]
+    return queryset.count()
@@ -0,0 +1,212 @@
+import re
+from itertools import islice
+from typing import NamedTuple
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import F, Q
+from django.db.models.expressions import RawSQL
+
+from .models import Course, CourseCategory, Lesson
+
+SEARCH_TABLE = 'custom_admin_search'
+SEARCH_LIMIT = getattr(settings, 'SEARCH_LIMIT', 50)
+SEARCH_MAX_TERMS = 8
+
+# Rows are keyed by rowid so every sync is a primary-key operation:
+# course N lives at 2N, lesson N at 2N + 1.
+_COURSE_ROWS = (
+    "SELECT c.id * 2, c.title, c.description, cat.name, 'course', c.id, c.is_active "
+    f'FROM {Course._meta.db_table} c JOIN {CourseCategory._meta.db_table} cat ON cat.id = c.category_id'
+)
+_LESSON_ROWS = (
+    "SELECT l.id * 2 + 1, l.title, l.description, c.title, 'lesson', l.course_id, l.visibility = 'public' "
+    f'FROM {Lesson._meta.db_table} l JOIN {Course._meta.db_table} c ON c.id = l.course_id'
+)
+_INSERT = f'INSERT INTO {SEARCH_TABLE} (rowid, title, body, context, kind, course_id, visible) '
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+class SearchResult(NamedTuple):
+    kind: str
+    object: object
+
+
+def _batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _write_connection():
+    return connections[router.db_for_write(Lesson)]
+
+
+def search_available(connection=None):
+    connection = connection or connections[router.db_for_read(Lesson)]
+    return connection.vendor == 'sqlite'
+
+
+def match_expression(text):
+    """Turn user input into an FTS5 query where every word must match as a prefix.
+
+    Words are quoted, so FTS5 operators typed by the user are matched as text.
+    """
+    terms = _TOKEN_RE.findall(text)[:SEARCH_MAX_TERMS]
+    if not terms:
+        return None
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def index_lesson(lesson_id):
+    connection = _write_connection()
+    if not search_available(connection):
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [lesson_id * 2 + 1])
+        cursor.execute(_INSERT + _LESSON_ROWS + ' WHERE l.id = %s', [lesson_id])
+
+
+def index_course(course_id):
+    """Reindex a course; its lessons follow only when the course title changed."""
+    connection = _write_connection()
+    if not search_available(connection):
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT title FROM {SEARCH_TABLE} WHERE rowid = %s', [course_id * 2])
+        previous = cursor.fetchone()
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [course_id * 2])
+        cursor.execute(_INSERT + _COURSE_ROWS + ' WHERE c.id = %s', [course_id])
+        cursor.execute(f'SELECT title FROM {Course._meta.db_table} WHERE id = %s', [course_id])
+        current = cursor.fetchone()
+    if previous and current and previous[0] != current[0]:
+        rebuild_search_index([course_id])
+
+
+def unindex(queryset):
+    """Drop the index rows of a course or lesson queryset in one statement; courses take their lessons along."""
+    connection = _write_connection()
+    if not search_available(connection):
+        return
+    if queryset.model is Course:
+        column, rows = 'course_id', queryset.values('pk')
+    else:
+        column, rows = 'rowid', queryset.values(search_rowid=F('pk') * 2 + 1)
+    sql, params = rows.order_by().query.get_compiler(connection=connection).as_sql()
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE {column} IN ({sql})', params)
+
+
+def rebuild_search_index(course_ids=None, batch_size=500):
+    """Rebuild index rows for ``course_ids`` (courses and their lessons), or everything.
+
+    Bulk writes bypass the sync signals, so bulk loaders call this afterwards.
+    """
+    connection = _write_connection()
+    if not search_available(connection):
+        return
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        if course_ids is None:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+            cursor.execute(_INSERT + _COURSE_ROWS)
+            cursor.execute(_INSERT + _LESSON_ROWS)
+            cursor.execute(f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('optimize')")
+            return
+        for batch in _batched(sorted(course_ids), batch_size):
+            marks = ', '.join(['%s'] * len(batch))
+            cursor.execute(
+                f'DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({marks})', [course_id * 2 for course_id in batch]
+            )
+            cursor.execute(
+                f'DELETE FROM {SEARCH_TABLE} WHERE rowid IN '
+                f'(SELECT id * 2 + 1 FROM {Lesson._meta.db_table} WHERE course_id IN ({marks}))',
+                batch,
+            )
+            cursor.execute(_INSERT + _COURSE_ROWS + f' WHERE c.id IN ({marks})', batch)
+            cursor.execute(_INSERT + _LESSON_ROWS + f' WHERE l.course_id IN ({marks})', batch)
+
+
+def reindex_category(category_id):
+    rebuild_search_index(Course.objects.filter(category_id=category_id).values_list('pk', flat=True))
+
+
+def _match_sql(columns, match, kind, visible_only):
+    sql = f'SELECT {columns} FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s'
+    params = [match]
+    if kind:
+        sql += ' AND kind = %s'
+        params.append(kind)
+    if visible_only:
+        sql += ' AND visible = 1'
+    return sql, params
+
+
+def filter_matches(queryset, text, kind):
+    """Narrow a course or lesson queryset to rows matching ``text``.
+
+    The match runs as a subquery against the index, so no id list is pulled
+    into Python however many rows match.
+    """
+    match = match_expression(text)
+    if not match:
+        return queryset.none()
+    sql, params = _match_sql('rowid / 2', match, kind, visible_only=False)
+    return queryset.filter(pk__in=RawSQL(sql, params))
+
+
+def search_ids(text, kind=None, visible_only=False, limit=SEARCH_LIMIT):
+    """Return ``(kind, id)`` pairs, best BM25 match first; ``limit=None`` returns every match."""
+    match = match_expression(text)
+    if not match:
+        return []
+    connection = connections[router.db_for_read(Lesson)]
+    if not search_available(connection):
+        return _fallback_ids(text, kind, visible_only, limit)
+
+    sql, params = _match_sql('kind, rowid / 2', match, kind, visible_only)
+    sql += ' ORDER BY rank'
+    if limit is not None:
+        sql += ' LIMIT %s'
+        params.append(limit)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [(row_kind, object_id) for row_kind, object_id in cursor.fetchall()]
+
+
+def _fallback_ids(text, kind, visible_only, limit):
+    terms = _TOKEN_RE.findall(text)[:SEARCH_MAX_TERMS]
+    hits = []
+    if kind in (None, 'course'):
+        courses = Course.objects.all()
+        for term in terms:
+            courses = courses.filter(Q(title__icontains=term) | Q(description__icontains=term))
+        if visible_only:
+            courses = courses.filter(is_active=True)
+        hits += [('course', pk) for pk in courses.values_list('pk', flat=True)]
+    if kind in (None, 'lesson'):
+        lessons = Lesson.objects.all()
+        for term in terms:
+            lessons = lessons.filter(
+                Q(title__icontains=term) | Q(description__icontains=term) | Q(course__title__icontains=term)
+            )
+        if visible_only:
+            lessons = lessons.public()
+        hits += [('lesson', pk) for pk in lessons.values_list('pk', flat=True)]
+    return hits[:limit]
+
+
+def search(text, include_hidden=False, limit=SEARCH_LIMIT):
+    """Ranked courses and lessons for ``text``; hidden lessons and inactive courses only on request."""
+    hits = search_ids(text, visible_only=not include_hidden, limit=limit)
+    courses = Course.objects.select_related('category').in_bulk([pk for kind, pk in hits if kind == 'course'])
+    lessons = Lesson.objects.select_related('course__category').in_bulk([pk for kind, pk in hits if kind == 'lesson'])
+    results = []
+    for kind, pk in hits:
+        obj = courses.get(pk) if kind == 'course' else lessons.get(pk)
+        if obj is None:
+            continue
+        if not include_hidden and not (obj if kind == 'course' else obj.course).is_active:
+            continue
+        results.append(SearchResult(kind, obj))
+    return results
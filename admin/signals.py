@@ -0,0 +1,303 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models import CASCADE, QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .attendance import forget_marked
+from .branding import invalidate_site_assets
+from .counters import COUNTER_FIELDS, adjust_course_counter, subtract_course_rows
+from .db import apply_sqlite_pragmas
+from .images import delete_variants, image_variants, ready_variants, schedule_variants
+from .models import (
+    AttendanceRecord,
+    Course,
+    CourseCategory,
+    CourseEnrollment,
+    Lesson,
+    LessonUpload,
+    SiteBranding,
+    WebsiteImage,
+    rows_deleting,
+)
+from .roles import invalidate_roles
+from .rowcounts import COUNTED_MODELS, adjust_row_count
+from .rollups import (
+    attendance_span,
+    rebuild_daily_rollups,
+    record_attendance,
+    refresh_attendance_rollups,
+    refresh_attendance_span,
+)
+from .search import index_course, index_lesson, reindex_category, unindex
+from .uploads import upload_temp_path
+from .versions import bump_catalog_version, bump_course_versions, bump_student_versions
+
+User = get_user_model()
+
+
+@receiver(connection_created)
+def tune_new_connection(sender, connection, **kwargs):
+    apply_sqlite_pragmas(connection)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def user_groups_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in {'post_add', 'post_remove', 'post_clear'}:
+        return
+    if not reverse:
+        instance.__dict__.pop('_role_cache', None)
+        invalidate_roles([instance.pk])
+    elif pk_set:
+        invalidate_roles(pk_set)
+    else:
+        invalidate_roles()
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def group_changed(sender, **kwargs):
+    invalidate_roles()
+
+
+@receiver(post_save, sender=SiteBranding)
+@receiver(post_delete, sender=SiteBranding)
+@receiver(post_save, sender=WebsiteImage)
+@receiver(post_delete, sender=WebsiteImage)
+def site_assets_changed(sender, **kwargs):
+    transaction.on_commit(invalidate_site_assets)
+
+
+def _image_file(instance):
+    return instance.logo if isinstance(instance, SiteBranding) else instance.image
+
+
+@receiver(pre_save, sender=SiteBranding)
+@receiver(pre_save, sender=WebsiteImage)
+def site_image_pre_save(sender, instance, raw=False, **kwargs):
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    field = _image_file(instance).field
+    instance._previous_image = sender.objects.filter(pk=instance.pk).values_list(field.name, flat=True).first()
+
+
+@receiver(post_save, sender=SiteBranding)
+@receiver(post_save, sender=WebsiteImage)
+def site_image_saved(sender, instance, raw=False, **kwargs):
+    field_file = _image_file(instance)
+    previous = instance.__dict__.pop('_previous_image', None)
+    if previous and previous != field_file.name:
+        replaced = field_file.field.attr_class(instance, field_file.field, previous)
+        transaction.on_commit(lambda: delete_variants(replaced))
+    if raw or not field_file or len(ready_variants(field_file)) == len(image_variants()):
+        return
+    transaction.on_commit(lambda: schedule_variants(field_file, on_done=invalidate_site_assets))
+
+
+@receiver(post_delete, sender=SiteBranding)
+@receiver(post_delete, sender=WebsiteImage)
+def site_image_deleted(sender, instance, **kwargs):
+    field_file = _image_file(instance)
+    transaction.on_commit(lambda: delete_variants(field_file))
+
+
+@receiver(post_delete, sender=LessonUpload)
+def lesson_upload_deleted(sender, instance, **kwargs):
+    path = upload_temp_path(instance)
+    transaction.on_commit(lambda: path.unlink(missing_ok=True))
+
+
+# The index lives in the same database, so these writes commit or roll back
+# together with the row they mirror.
+@receiver(post_save, sender=Course)
+def course_search_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        index_course(instance.pk)
+
+
+@receiver(post_save, sender=Lesson)
+def lesson_search_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        index_lesson(instance.pk)
+
+
+@receiver(post_save, sender=CourseCategory)
+def category_search_saved(sender, instance, created, raw=False, **kwargs):
+    if not raw and not created:
+        reindex_category(instance.pk)
+
+
+@receiver(post_save, sender=CourseEnrollment)
+def enrollment_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        bump_student_versions([instance.student_id])
+        bump_course_versions([instance.course_id])
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=CourseCategory)
+def catalog_changed(sender, raw=False, **kwargs):
+    if not raw:
+        bump_catalog_version()
+
+
+def counted_row_saved(sender, created, raw=False, **kwargs):
+    if created and not raw:
+        adjust_row_count(sender, 1)
+
+
+def course_child_pre_save(sender, instance, raw=False, **kwargs):
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    fields = ['course_id', 'student_id', 'attendance_date'] if sender is AttendanceRecord else ['course_id']
+    instance._previous_row = sender.objects.filter(pk=instance.pk).values(*fields).first()
+
+
+def course_child_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        adjust_course_counter(sender, instance.course_id, 1)
+        if sender is AttendanceRecord:
+            record_attendance([_attendance_key(instance)])
+        return
+    previous = instance.__dict__.pop('_previous_row', None)
+    if previous is None:
+        return
+    if previous['course_id'] != instance.course_id:
+        adjust_course_counter(sender, previous['course_id'], -1)
+        adjust_course_counter(sender, instance.course_id, 1)
+    if sender is AttendanceRecord:
+        old_key = (previous['student_id'], previous['course_id'], previous['attendance_date'])
+        if old_key != _attendance_key(instance):
+            refresh_attendance_rollups([old_key, _attendance_key(instance)])
+
+
+# Deletes are fixed up with set-based SQL once per delete() call. Nothing
+# listens for per-row delete signals on the child tables, so Django's fast
+# delete removes their rows without loading them: cascades are handled here
+# from the parent rows, direct deletes through rows_deleting. Rollups are
+# rebuilt over the span the deleted records covered once they are gone.
+def _take_off_row_count(model, rows):
+    total = rows.count()
+    if total:
+        adjust_row_count(model, -total)
+
+
+@receiver(rows_deleting)
+def child_rows_deleting(sender, queryset, on_deleted, **kwargs):
+    _take_off_row_count(sender, queryset)
+    subtract_course_rows(sender, queryset)
+    if sender is Lesson:
+        unindex(queryset)
+        return
+    if sender is AttendanceRecord:
+        span = attendance_span(queryset)
+        if span:
+            on_deleted.append(lambda: refresh_attendance_span(*span))
+        queryset = queryset.filter(attendance_date=date.today())
+    else:
+        bump_student_versions(queryset.values_list('student_id', flat=True).distinct())
+    # Without this a same-day mark after the delete would be answered from
+    # the cache and neither re-enroll nor re-record the student. Only
+    # today's marks are ever looked up.
+    today = date.today()
+    marked = [(student_id, course_id, today) for student_id, course_id in queryset.values_list('student_id', 'course_id')]
+    if marked:
+        transaction.on_commit(lambda: forget_marked(marked))
+
+
+def _rows_deleted_with(sender, instance, origin):
+    """Return the ``sender`` rows a delete() removes and the list its follow-up work goes in.
+
+    When delete() was called on ``sender`` rows, or on rows ``sender``
+    cascades from, every row is covered at the first signal and later ones
+    get ``(None, None)``; otherwise each instance is handled on its own.
+    """
+    def single():
+        pending = instance.__dict__.setdefault('_pending_deletes', {})
+        return sender._base_manager.filter(pk=instance.pk), pending.setdefault(sender, [])
+
+    if origin is None:
+        return single()
+    if isinstance(origin, QuerySet):
+        origin_model, origin_ids = origin.model, origin.values('pk')
+    else:
+        origin_model, origin_ids = type(origin), [origin.pk]
+    origin_model = origin_model._meta.concrete_model
+    if origin_model is sender._meta.concrete_model:
+        lookup = 'pk__in'
+    else:
+        lookup = next(
+            (
+                f'{field.name}__in'
+                for field in sender._meta.concrete_fields
+                if field.is_relation and field.related_model is origin_model and field.remote_field.on_delete is CASCADE
+            ),
+            None,
+        )
+        if lookup is None:
+            return single()
+    pending = origin.__dict__.setdefault('_pending_deletes', {})
+    if sender in pending:
+        return None, None
+    pending[sender] = []
+    return sender._base_manager.filter(**{lookup: origin_ids}), pending[sender]
+
+
+@receiver(pre_delete, sender=CourseCategory)
+@receiver(pre_delete, sender=Course)
+@receiver(pre_delete, sender=User)
+def parent_rows_deleting(sender, instance, origin=None, using=None, **kwargs):
+    rows, on_deleted = _rows_deleted_with(sender, instance, origin)
+    if rows is None:
+        return
+    rows = rows.using(using)
+    if sender is User:
+        # Summaries go with the students; ids are never reused, so cached
+        # marks need no forgetting either.
+        for model in (CourseEnrollment, AttendanceRecord):
+            children = model._base_manager.using(using).filter(student__in=rows)
+            _take_off_row_count(model, children)
+            subtract_course_rows(model, children)
+        span = attendance_span(AttendanceRecord._base_manager.using(using).filter(student__in=rows))
+        if span:
+            start, end, course_ids, _ = span
+            on_deleted.append(lambda: rebuild_daily_rollups(start, end, course_ids))
+        return
+    _take_off_row_count(sender, rows)
+    if sender is Course:
+        # Counters, rollups and summaries go with the courses themselves.
+        for model in COUNTER_FIELDS:
+            _take_off_row_count(model, model._base_manager.using(using).filter(course__in=rows))
+        enrolled = CourseEnrollment._base_manager.using(using).filter(course__in=rows)
+        bump_student_versions(enrolled.values_list('student_id', flat=True).distinct())
+        unindex(rows)
+    bump_catalog_version()
+
+
+@receiver(post_delete, sender=CourseCategory)
+@receiver(post_delete, sender=Course)
+@receiver(post_delete, sender=User)
+def parent_row_deleted(sender, instance, origin=None, **kwargs):
+    # Parents are deleted after every row that cascades from them, and all
+    # pre_delete signals of a delete() come before its first post_delete.
+    for holder in (instance, origin):
+        for callback in getattr(holder, '_pending_deletes', {}).pop(sender, ()):
+            callback()
+
+
+def _attendance_key(record):
+    return (record.student_id, record.course_id, record.attendance_date)
+
+
+for _model in COUNTER_FIELDS:
+    pre_save.connect(course_child_pre_save, sender=_model, dispatch_uid=f'counters_pre_save_{_model.__name__}')
+    post_save.connect(course_child_saved, sender=_model, dispatch_uid=f'counters_saved_{_model.__name__}')
+
+for _model in COUNTED_MODELS:
+    post_save.connect(counted_row_saved, sender=_model, dispatch_uid=f'row_count_saved_{_model.__name__}')
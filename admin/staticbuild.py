@@ -0,0 +1,158 @@
+import gzip
+import mimetypes
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.base import ContentFile
+from django.http import FileResponse, Http404
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.mjs', '.map', '.svg', '.json', '.txt', '.html', '.xml', '.ico'}
+PRECOMPRESS_MIN_SIZE = 1024
+STATIC_UNHASHED_MAX_AGE = getattr(settings, 'STATIC_UNHASHED_MAX_AGE', 60)
+STATIC_HASHED_MAX_AGE = 365 * 24 * 60 * 60
+
+_HASHED_RE = re.compile(r'\.[0-9a-f]{12}\.[^./]+$')
+# Strings and comments are matched in one left-to-right pass, so a "/*"
+# inside a string is never taken for a comment, nor a quote inside a comment
+# for a string.
+_CSS_TOKEN_RE = re.compile(r'''"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|/\*.*?\*/''', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r'\s*([{};,>])\s*')
+
+
+def _minify_css_code(code):
+    return _CSS_PUNCT_RE.sub(r'\1', _CSS_SPACE_RE.sub(' ', code)).replace(';}', '}')
+
+
+def minify_css(text):
+    """Drop comments (keeping ``/*! ... */`` notices) and redundant whitespace outside strings."""
+    parts = []
+    code = []
+    position = 0
+    for match in _CSS_TOKEN_RE.finditer(text):
+        code.append(text[position:match.start()])
+        position = match.end()
+        token = match.group()
+        if token.startswith('/*') and not token.startswith('/*!'):
+            continue
+        parts += [_minify_css_code(''.join(code)), token]
+        code = []
+    code.append(text[position:])
+    parts.append(_minify_css_code(''.join(code)))
+    return ''.join(parts).strip()
+
+
+def minify_js(text):
+    return rjsmin.jsmin(text, keep_bang_comments=True) if rjsmin else text
+
+
+_MINIFIERS = {'.css': minify_css, '.js': minify_js}
+
+
+class BuildStaticFilesStorage(ManifestStaticFilesStorage):
+    """Hashed file names, minified CSS/JS and ``.gz``/``.br`` siblings for collectstatic."""
+
+    def _save(self, name, content):
+        minify = _MINIFIERS.get(Path(name).suffix)
+        if minify and '.min.' not in name:
+            content.seek(0)
+            raw = content.read()
+            try:
+                content = ContentFile(minify(raw.decode('utf-8')).encode('utf-8'))
+            except UnicodeDecodeError:
+                content = ContentFile(raw)
+        return super()._save(name, content)
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if not dry_run:
+            for name in sorted(set(self.hashed_files.values())):
+                self.precompress(name)
+
+    def precompress(self, name):
+        path = Path(self.path(name))
+        if path.suffix not in COMPRESSIBLE_EXTENSIONS or not path.is_file():
+            return
+        data = path.read_bytes()
+        if len(data) < PRECOMPRESS_MIN_SIZE:
+            return
+        encoded = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli:
+            encoded['.br'] = brotli.compress(data, quality=11)
+        for suffix, payload in encoded.items():
+            if len(payload) < len(data):
+                path.with_name(path.name + suffix).write_bytes(payload)
+
+
+def _accepted_encodings(header):
+    """Parse Accept-Encoding into ``{coding: q}``; ``br;q=0`` maps to 0, i.e. refused."""
+    accepted = {}
+    for item in header.split(','):
+        coding, *params = [part.strip() for part in item.split(';')]
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding.lower()] = quality
+    return accepted
+
+
+def serve_static(request, path):
+    """Serve collected assets, preferring precompressed siblings.
+
+    Content-hashed names are cached for a year as immutable; anything else
+    gets a short max-age so an unhashed URL never pins a stale file.
+    """
+    try:
+        full_path = Path(safe_join(settings.STATIC_ROOT, path))
+    except SuspiciousFileOperation:
+        raise Http404
+    if not full_path.is_file():
+        raise Http404
+
+    accepted = _accepted_encodings(request.headers.get('Accept-Encoding', ''))
+    served, encoding, best = full_path, None, 0
+    for candidate_encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+        quality = accepted.get(candidate_encoding, accepted.get('*', 0))
+        candidate = full_path.with_name(full_path.name + suffix)
+        if quality > best and candidate.is_file():
+            served, encoding, best = candidate, candidate_encoding, quality
+
+    stat = served.stat()
+    etag = quote_etag(f'{stat.st_mtime_ns:x}-{stat.st_size:x}')
+    response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if response is None:
+        content_type = mimetypes.guess_type(full_path.name)[0] or 'application/octet-stream'
+        response = FileResponse(served.open('rb'), content_type=content_type, filename=full_path.name)
+        if encoding:
+            response['Content-Encoding'] = encoding
+    response.headers.setdefault('ETag', etag)
+    response.headers.setdefault('Last-Modified', http_date(stat.st_mtime))
+    patch_vary_headers(response, ['Accept-Encoding'])
+    if _HASHED_RE.search(full_path.name):
+        patch_cache_control(response, public=True, max_age=STATIC_HASHED_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, public=True, max_age=STATIC_UNHASHED_MAX_AGE)
+    return response
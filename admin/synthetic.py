@@ -0,0 +1,219 @@
+import random
+from datetime import date, timedelta
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from .counters import rebuild_course_counters
+from .models import AttendanceRecord, Course, CourseCategory, CourseEnrollment, Lesson
+from .roles import FACULTY, STUDENT
+from .rollups import rebuild_daily_rollups, rebuild_student_attendance
+from .rowcounts import refresh_row_counts
+from .search import rebuild_search_index
+from .versions import bump_catalog_version
+
+User = get_user_model()
+
+TOPICS = [
+    'Python', 'SQL', 'HTML', 'CSS', 'JavaScript', 'React', 'Django', 'Data Analysis',
+    'Data Science', 'Machine Learning', 'Gen AI', 'Excel', 'Tally', 'Networking', 'Linux', 'Cloud',
+]
+LESSON_KINDS = ['Introduction', 'Lab', 'Workshop', 'Case Study', 'Assignment', 'Revision', 'Project', 'Quiz Review']
+LEVELS = [choice for choice, _ in Course.LEVEL_CHOICES]
+VISIBILITIES = ['public'] * 8 + ['private', 'draft']
+
+
+def _batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _bulk_insert(model, objects, batch_size):
+    created = []
+    for batch in _batched(objects, batch_size):
+        with transaction.atomic():
+            created.extend(model.objects.bulk_create(batch, batch_size=batch_size))
+    return created
+
+
+def _stream_insert(model, objects, batch_size):
+    total = 0
+    for batch in _batched(objects, batch_size):
+        with transaction.atomic():
+            model.objects.bulk_create(batch, batch_size=batch_size)
+        total += len(batch)
+    return total
+
+
+def _raw_insert(model, field_names, rows, batch_size):
+    """``executemany`` already-adapted tuples, skipping per-row model and SQL compilation.
+
+    Used for the two tables that reach millions of rows, where
+    ``bulk_create`` spends most of its time preparing values row by row.
+    """
+    connection = connections[router.db_for_write(model)]
+    quote = connection.ops.quote_name
+    columns = [model._meta.get_field(name).column for name in field_names]
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        quote(model._meta.db_table),
+        ', '.join(quote(column) for column in columns),
+        ', '.join(['%s'] * len(columns)),
+    )
+    total = 0
+    for batch in _batched(rows, batch_size):
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.executemany(sql, batch)
+        total += len(batch)
+    return total
+
+
+def synthetic_data_exists(prefix):
+    return User.objects.filter(username__startswith=f'{prefix}_').exists()
+
+
+def delete_synthetic_data(prefix):
+    User.objects.filter(username__startswith=f'{prefix}_').delete()
+    CourseCategory.objects.filter(name__startswith=f'{prefix} ').delete()
+
+
+def generate_synthetic_data(
+    *,
+    categories=50,
+    courses=2000,
+    lessons=200_000,
+    faculty=100,
+    students=50_000,
+    enrollments_per_student=3,
+    days=730,
+    attendance_rate=0.1,
+    seed=0,
+    batch_size=5000,
+    prefix='synthetic',
+    password='Student@123',
+    log=None,
+):
+    """Bulk-insert a reproducible catalog, users, enrollments and attendance history.
+
+    Every generated user shares one password hash, computed once, so
+    generating thousands of accounts does not pay the hasher cost per user.
+    Returns a dict with the number of rows created per table.
+    """
+    rng = random.Random(seed)
+    log = log or (lambda message: None)
+    stats = {}
+
+    category_objs = _bulk_insert(
+        CourseCategory,
+        (CourseCategory(name=f'{prefix} {TOPICS[i % len(TOPICS)]} {i}') for i in range(categories)),
+        batch_size,
+    )
+    stats['categories'] = len(category_objs)
+    log(f'{len(category_objs)} categories')
+
+    password_hash = make_password(password)
+    faculty_objs = _bulk_insert(
+        User,
+        (User(username=f'{prefix}_faculty_{i}', email=f'{prefix}_faculty_{i}@example.com', password=password_hash)
+         for i in range(faculty)),
+        batch_size,
+    )
+    student_objs = _bulk_insert(
+        User,
+        (User(username=f'{prefix}_student_{i}', email=f'{prefix}_student_{i}@example.com', password=password_hash)
+         for i in range(students)),
+        batch_size,
+    )
+    membership = User.groups.through
+    faculty_group = Group.objects.get_or_create(name=FACULTY)[0]
+    student_group = Group.objects.get_or_create(name=STUDENT)[0]
+    _stream_insert(
+        membership,
+        [membership(user_id=user.pk, group_id=faculty_group.pk) for user in faculty_objs]
+        + [membership(user_id=user.pk, group_id=student_group.pk) for user in student_objs],
+        batch_size,
+    )
+    stats['users'] = len(faculty_objs) + len(student_objs)
+    log(f'{len(faculty_objs)} faculty, {len(student_objs)} students')
+
+    course_objs = _bulk_insert(
+        Course,
+        (
+            Course(
+                title=f'{TOPICS[i % len(TOPICS)]} {i}',
+                category=category_objs[i % len(category_objs)],
+                description=f'{TOPICS[i % len(TOPICS)]} track number {i}.',
+                level=rng.choice(LEVELS),
+                duration_hours=rng.randint(4, 120),
+                created_by=rng.choice(faculty_objs) if faculty_objs else None,
+            )
+            for i in range(courses)
+        ),
+        batch_size,
+    )
+    stats['courses'] = len(course_objs)
+    log(f'{len(course_objs)} courses')
+
+    stats['lessons'] = _stream_insert(
+        Lesson,
+        (
+            Lesson(
+                course=course,
+                title=f'{rng.choice(LESSON_KINDS)} {i}',
+                description=f'Lesson {i} of {course.title}.',
+                visibility=rng.choice(VISIBILITIES),
+            )
+            for i in range(lessons)
+            for course in [course_objs[rng.randrange(len(course_objs))]]
+        ),
+        batch_size,
+    )
+    log(f'{stats["lessons"]} lessons')
+
+    per_student = min(enrollments_per_student, len(course_objs))
+    pairs = [
+        (student.pk, course.pk)
+        for student in student_objs
+        for course in rng.sample(course_objs, per_student)
+    ]
+    connection = connections[router.db_for_write(AttendanceRecord)]
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    stats['enrollments'] = _raw_insert(
+        CourseEnrollment,
+        ['student', 'course', 'enrolled_at'],
+        ((student_id, course_id, now) for student_id, course_id in pairs),
+        batch_size,
+    )
+    log(f'{stats["enrollments"]} enrollments')
+
+    today = date.today()
+    day_values = [connection.ops.adapt_datefield_value(today - timedelta(days=offset)) for offset in range(days + 1)]
+
+    def attendance():
+        for student_id, course_id in pairs:
+            first_day = rng.randrange(days) if days else 0
+            yield (student_id, course_id, day_values[first_day], 'enroll', now)
+            for offset in range(first_day - 1, -1, -1):
+                if rng.random() < attendance_rate:
+                    yield (student_id, course_id, day_values[offset], 'enter', now)
+
+    stats['attendance'] = _raw_insert(
+        AttendanceRecord,
+        ['student', 'course', 'attendance_date', 'source', 'marked_at'],
+        attendance(),
+        batch_size,
+    )
+    log(f'{stats["attendance"]} attendance records')
+
+    course_ids = [course.pk for course in course_objs]
+    rebuild_course_counters(course_ids)
+    rebuild_daily_rollups(course_ids=course_ids)
+    rebuild_student_attendance(course_ids=course_ids)
+    rebuild_search_index(course_ids)
+    refresh_row_counts()
+    bump_catalog_version()
+    return stats
@@ -0,0 +1,11 @@
+from django import template
+
+from admin.images import variant_url
+
+register = template.Library()
+
+
+@register.filter
+def variant(field_file, name):
+    """``{{ site_branding.logo|variant:'logo' }}``: URL of a resized variant, or the original."""
+    return variant_url(field_file, name)
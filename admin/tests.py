@@ -1,3 +1,1636 @@
-from django.test import TestCase
-
-# Create your tests here.
+import asyncio
+import base64
+import csv
+import gzip
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from io import BytesIO, StringIO
+from unittest import mock
+
+from asgiref.sync import async_to_sync, sync_to_async
+from PIL import Image as PILImage
+
+from django.contrib.auth.models import Group, User
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import OperationalError, connection, transaction
+from django.db.models import Count, Max
+from django.db.models.deletion import Collector
+from django.http import Http404
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+
+from .analytics import compute_attendance_analytics
+from .attendance import (
+    enroll_student,
+    get_attendance_backend,
+    mark_attendance,
+    remember_marked,
+    reset_attendance_backend,
+)
+from .branding import get_site_assets, invalidate_site_assets
+from .db import pragma_matches, read_sqlite_pragmas
+from .images import variant_name, variant_url
+from .importer import import_csv
+from . import urls as app_urls
+from . import views
+from .middleware import PrimaryPinningMiddleware
+from .models import (
+    AttendanceDailyRollup,
+    AttendanceRecord,
+    Course,
+    CourseCategory,
+    CourseEnrollment,
+    Lesson,
+    LessonUpload,
+    SiteBranding,
+    StudentCourseAttendance,
+    WebsiteImage,
+    prefetch_latest_lessons,
+)
+from .pagination import InvalidCursor, KeysetPaginator, encode_cursor
+from .routers import PrimaryReplicaRouter, end_request, start_request
+from .roles import FACULTY, STUDENT, get_user_roles
+from .rowcounts import COUNTED_MODELS, row_counts
+from .search import match_expression, rebuild_search_index, search, search_ids
+from .staticbuild import minify_css, serve_static
+from .synthetic import generate_synthetic_data
+from .uploads import complete_upload, upload_temp_path
+from .versions import adashboard_version
+
+
+class RoleCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.student = User.objects.get(username='student1')
+
+    def test_roles_loaded_once_per_request(self):
+        user = User.objects.get(pk=self.student.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_user_roles(user), {STUDENT})
+            get_user_roles(user)
+
+    def test_roles_cached_across_requests(self):
+        get_user_roles(User.objects.get(pk=self.student.pk))
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_roles(self.student), {STUDENT})
+
+    def test_group_membership_change_invalidates_cache(self):
+        get_user_roles(User.objects.get(pk=self.student.pk))
+        self.student.groups.add(Group.objects.get(name=FACULTY))
+        self.assertEqual(get_user_roles(User.objects.get(pk=self.student.pk)), {STUDENT, FACULTY})
+
+        Group.objects.get(name=FACULTY).user_set.remove(self.student)
+        self.assertEqual(get_user_roles(User.objects.get(pk=self.student.pk)), {STUDENT})
+
+    @override_settings(ROLE_CACHE_TIMEOUT=30)
+    def test_cached_roles_expire(self):
+        with mock.patch('admin.roles.cache') as shared:
+            shared.get.return_value = None
+            get_user_roles(User.objects.get(pk=self.student.pk))
+        self.assertTrue(shared.set.call_args_list)
+        self.assertTrue(all(call.args[2] == 30 for call in shared.set.call_args_list + shared.add.call_args_list))
+
+    def test_guard_redirects_other_role(self):
+        self.client.force_login(self.student)
+        response = self.client.get(reverse('faculty_dashboard'))
+        self.assertRedirects(response, reverse('student_dashboard'), fetch_redirect_response=False)
+
+
+class SiteAssetsCacheTests(TestCase):
+    def setUp(self):
+        invalidate_site_assets()
+
+    def test_marketing_page_renders_without_queries_once_warm(self):
+        self.client.get(reverse('about'))
+        with self.assertNumQueries(0):
+            self.client.get(reverse('about'))
+
+    def test_branding_save_rebuilds_snapshot(self):
+        self.client.get(reverse('about'))
+        with self.captureOnCommitCallbacks(execute=True):
+            SiteBranding.objects.create(site_name='Renamed School')
+        response = self.client.get(reverse('about'))
+        self.assertContains(response, 'Renamed School')
+
+    @override_settings(SITE_ASSETS_LOCAL_TIMEOUT=600)
+    def test_process_local_snapshot_expires(self):
+        before = get_site_assets()
+        SiteBranding.objects.create(site_name='Changed Elsewhere')
+        self.assertIs(get_site_assets(), before)
+        with mock.patch('admin.branding.time.monotonic', return_value=time.monotonic() + 300):
+            self.assertIs(get_site_assets(), before)
+        with mock.patch('admin.branding.time.monotonic', return_value=time.monotonic() + 3600):
+            self.assertEqual(get_site_assets().branding.site_name, 'Changed Elsewhere')
+
+    @override_settings(SITE_ASSETS_CACHE='default')
+    def test_shared_snapshot_follows_the_cache(self):
+        get_site_assets()
+        SiteBranding.objects.create(site_name='Changed Elsewhere')
+        cache.delete('site_assets:version')
+        self.assertEqual(get_site_assets().branding.site_name, 'Changed Elsewhere')
+
+
+class PublicPageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        invalidate_site_assets()
+
+    def test_conditional_request_returns_not_modified(self):
+        response = self.client.get(reverse('home'))
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertTrue(response.has_header('Last-Modified'))
+
+        response = self.client.get(reverse('home'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_deploy_changes_page_version(self):
+        response = self.client.get(reverse('home'))
+        etag, modified = response['ETag'], response['Last-Modified']
+        invalidate_site_assets()
+        self.assertEqual(self.client.get(reverse('home'))['Last-Modified'], modified)
+
+        with override_settings(DEPLOY_VERSION='release-2'):
+            response = self.client.get(reverse('home'), HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn('release-2', response['ETag'])
+            self.assertTrue(cache.get(f'public_page:home:release-2-{get_site_assets().version}'))
+
+    def test_branding_change_invalidates_page(self):
+        etag = self.client.get(reverse('terms'))['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            SiteBranding.objects.create(site_name='New Name')
+        response = self.client.get(reverse('terms'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_change_from_another_process_reaches_pages(self):
+        etag = self.client.get(reverse('about'))['ETag']
+        # Written without this process's on-commit invalidation, as another worker would.
+        SiteBranding.objects.create(site_name='Changed Elsewhere')
+        self.assertEqual(self.client.get(reverse('about'), HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with mock.patch('admin.branding.time.monotonic', return_value=time.monotonic() + 3600):
+            response = self.client.get(reverse('about'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Changed Elsewhere')
+
+    @override_settings(PUBLIC_PAGE_CACHE=False)
+    def test_cache_can_be_disabled(self):
+        response = self.client.get(reverse('privacy'))
+        self.assertFalse(response.has_header('ETag'))
+
+
+class CourseCounterTests(TestCase):
+    def setUp(self):
+        self.student = User.objects.get(username='student1')
+        self.course = Course.objects.get(title='Python')
+
+    def test_counters_follow_inserts_and_deletes(self):
+        enrollment = CourseEnrollment.objects.create(student=self.student, course=self.course)
+        Lesson.objects.create(course=self.course, title='Intro')
+        self.course.refresh_from_db()
+        self.assertEqual((self.course.enrollment_count, self.course.lesson_count), (1, 1))
+
+        enrollment.delete()
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.enrollment_count, 0)
+
+    def test_moving_a_lesson_moves_the_count(self):
+        other = Course.objects.get(title='HTML')
+        lesson = Lesson.objects.create(course=self.course, title='Intro')
+        lesson.course = other
+        lesson.save()
+        self.course.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual((self.course.lesson_count, other.lesson_count), (0, 1))
+
+    def test_rebuild_command_repairs_drift(self):
+        Lesson.objects.create(course=self.course, title='Intro')
+        Course.objects.filter(pk=self.course.pk).update(lesson_count=7)
+        with self.assertRaises(CommandError):
+            call_command('rebuild_course_counters', '--verify', stdout=StringIO())
+        call_command('rebuild_course_counters', stdout=StringIO())
+        call_command('rebuild_course_counters', '--verify', stdout=StringIO())
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.lesson_count, 1)
+
+    def test_drifted_counters_clamp_at_zero(self):
+        CourseEnrollment.objects.bulk_create([CourseEnrollment(student=self.student, course=self.course)])
+        self.course.delete()
+        self.assertFalse(CourseEnrollment.objects.filter(student=self.student).exists())
+
+        course = Course.objects.get(title='HTML')
+        enrollment = CourseEnrollment.objects.bulk_create([CourseEnrollment(student=self.student, course=course)])[0]
+        CourseEnrollment.objects.get(pk=enrollment.pk).delete()
+        course.refresh_from_db()
+        self.assertEqual(course.enrollment_count, 0)
+
+    def test_course_save_leaves_counters_alone(self):
+        Lesson.objects.create(course=self.course, title='Intro')
+        self.course.title = 'Python 3'
+        self.course.save()
+        self.course.refresh_from_db()
+        self.assertEqual((self.course.title, self.course.lesson_count), ('Python 3', 1))
+
+    def test_counter_update_commits_with_the_row(self):
+        with mock.patch('admin.signals.adjust_course_counter', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                Lesson.objects.create(course=self.course, title='Intro')
+        self.assertFalse(Lesson.objects.filter(title='Intro').exists())
+
+    def test_cascade_deletes_cost_the_same_whatever_they_remove(self):
+        queries = []
+        for title, days in (('Small', 2), ('Large', 40)):
+            course = Course.objects.create(category=self.course.category, title=title)
+            Lesson.objects.create(course=course, title='Intro')
+            CourseEnrollment.objects.create(student=self.student, course=course)
+            for day in range(days):
+                AttendanceRecord.objects.create(
+                    student=self.student, course=course, attendance_date=date.today() - timedelta(days=day)
+                )
+            with CaptureQueriesContext(connection) as captured:
+                course.delete()
+            queries.append(len(captured))
+        self.assertEqual(queries[0], queries[1])
+        self.assertFalse(search_ids('Intro', kind='lesson'))
+        collector = Collector(using='default')
+        for model in (CourseEnrollment, AttendanceRecord, AttendanceDailyRollup, StudentCourseAttendance):
+            self.assertTrue(collector.can_fast_delete(model.objects.all()), model)
+
+    def test_bulk_deletes_keep_derived_data_exact(self):
+        cache.clear()
+        other = User.objects.get(username='student2')
+        today = date.today()
+        for offset in range(3):
+            mark_attendance(self.student, self.course, attendance_date=today - timedelta(days=offset))
+        mark_attendance(other, self.course, attendance_date=today)
+
+        AttendanceRecord.objects.filter(student=self.student, attendance_date=today).delete()
+        summary = StudentCourseAttendance.objects.get(student=self.student, course=self.course)
+        self.assertEqual((summary.present_days, summary.last_attended), (2, today - timedelta(days=1)))
+        self.assertEqual(AttendanceDailyRollup.objects.get(course=self.course, attendance_date=today).present_count, 1)
+
+        User.objects.filter(pk=other.pk).delete()
+        self.course.refresh_from_db()
+        self.assertEqual((self.course.enrollment_count, self.course.attendance_count), (1, 2))
+        self.assertFalse(AttendanceDailyRollup.objects.filter(course=self.course, attendance_date=today).exists())
+
+        Lesson.objects.create(course=self.course, title='Intro')
+        CourseCategory.objects.filter(pk=self.course.category_id).delete()
+        self.assertFalse(search_ids('Intro'))
+        self.assertEqual(row_counts(COUNTED_MODELS), {model: model.objects.count() for model in COUNTED_MODELS})
+
+    def test_deleting_a_student_repairs_counters_and_rollups(self):
+        cache.clear()
+        other = User.objects.get(username='student2')
+        today = date.today()
+        for student in (self.student, other):
+            mark_attendance(student, self.course, attendance_date=today)
+            mark_attendance(student, self.course, attendance_date=today - timedelta(days=3))
+
+        self.student.delete()
+        self.course.refresh_from_db()
+        self.assertEqual((self.course.enrollment_count, self.course.attendance_count), (1, 2))
+        self.assertEqual(AttendanceDailyRollup.objects.get(course=self.course, attendance_date=today).present_count, 1)
+        self.assertEqual(StudentCourseAttendance.objects.get(course=self.course).present_days, 2)
+        counts = row_counts([CourseEnrollment, AttendanceRecord])
+        self.assertEqual(counts[AttendanceRecord], AttendanceRecord.objects.count())
+        self.assertEqual(counts[CourseEnrollment], CourseEnrollment.objects.count())
+
+
+class LatestLessonsTests(TestCase):
+    def setUp(self):
+        self.python = Course.objects.get(title='Python')
+        self.html = Course.objects.get(title='HTML')
+        for i in range(5):
+            Lesson.objects.create(course=self.python, title=f'Python {i}')
+            Lesson.objects.create(course=self.html, title=f'HTML {i}')
+        Lesson.objects.create(course=self.python, title='Hidden', visibility='draft')
+
+    def test_prefetch_limits_lessons_per_course(self):
+        with self.assertNumQueries(2):
+            courses = list(
+                Course.objects.filter(pk__in=[self.python.pk, self.html.pk])
+                .prefetch_related(prefetch_latest_lessons(3))
+            )
+        for course in courses:
+            self.assertEqual(len(course.recent_lessons), 3)
+        python = next(course for course in courses if course.pk == self.python.pk)
+        self.assertEqual([lesson.title for lesson in python.recent_lessons], ['Python 4', 'Python 3', 'Python 2'])
+
+    def test_student_courses_shows_latest_lessons(self):
+        self.client.force_login(User.objects.get(username='student1'))
+        response = self.client.get(reverse('student_courses'))
+        self.assertContains(response, 'Python 4')
+        self.assertNotContains(response, 'Python 1')
+
+
+class AttendanceWriteTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.student = User.objects.get(username='student1')
+        self.course = Course.objects.get(title='Python')
+
+    def test_mark_enrolls_and_records_once(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(mark_attendance(self.student, self.course))
+        with self.assertNumQueries(0):
+            self.assertFalse(mark_attendance(self.student, self.course))
+
+        self.course.refresh_from_db()
+        self.assertEqual((self.course.enrollment_count, self.course.attendance_count), (1, 1))
+        self.assertEqual(AttendanceRecord.objects.get(student=self.student).source, 'enter')
+
+    def test_existing_rows_are_left_alone(self):
+        CourseEnrollment.objects.create(student=self.student, course=self.course)
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_attendance(self.student, self.course, source='enroll')
+        cache.clear()
+        self.assertFalse(mark_attendance(self.student, self.course))
+
+        self.course.refresh_from_db()
+        self.assertEqual((self.course.enrollment_count, self.course.attendance_count), (1, 1))
+
+    def test_enter_course_view_marks_attendance(self):
+        self.client.force_login(self.student)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get(reverse('student_enter_course', args=[self.course.pk]))
+        self.assertRedirects(response, reverse('student_courses'), fetch_redirect_response=False)
+        self.assertTrue(CourseEnrollment.objects.filter(student=self.student, course=self.course).exists())
+        self.assertEqual(AttendanceRecord.objects.filter(student=self.student).count(), 1)
+
+    def test_deleting_rows_forgets_todays_mark(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_attendance(self.student, self.course)
+        with self.captureOnCommitCallbacks(execute=True):
+            CourseEnrollment.objects.get(student=self.student).delete()
+        self.client.force_login(self.student)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('student_enroll_course', args=[self.course.pk]))
+        self.assertTrue(CourseEnrollment.objects.filter(student=self.student, course=self.course).exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AttendanceRecord.objects.filter(student=self.student).delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(mark_attendance(self.student, self.course))
+        self.assertEqual(AttendanceRecord.objects.filter(student=self.student).count(), 1)
+
+    def test_enroll_view_enrolls_even_when_the_mark_is_cached(self):
+        remember_marked(self.student.pk, self.course.pk, date.today())
+        self.client.force_login(self.student)
+        self.client.post(reverse('student_enroll_course', args=[self.course.pk]))
+        self.assertTrue(CourseEnrollment.objects.filter(student=self.student, course=self.course).exists())
+
+    @override_settings(ATTENDANCE_MARKED_TIMEOUT=30)
+    def test_marked_flag_expires(self):
+        with mock.patch('admin.attendance.cache') as shared:
+            remember_marked(self.student.pk, self.course.pk, date.today())
+        self.assertEqual(shared.set.call_args.args[2], 30)
+
+
+@override_settings(ATTENDANCE_BACKEND={
+    'BACKEND': 'admin.attendance.BufferedAttendanceBackend',
+    'OPTIONS': {'batch_size': 2, 'threaded': False},
+})
+class BufferedAttendanceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_attendance_backend(setting='ATTENDANCE_BACKEND')
+        self.course = Course.objects.get(title='Python')
+        self.students = list(User.objects.filter(username__startswith='student'))
+
+    def test_marks_are_written_on_flush(self):
+        for student in self.students:
+            self.assertTrue(mark_attendance(student, self.course))
+        self.assertFalse(mark_attendance(self.students[0], self.course))
+        self.assertFalse(AttendanceRecord.objects.exists())
+        self.assertEqual(CourseEnrollment.objects.filter(course=self.course).count(), 3)
+
+        self.assertEqual(get_attendance_backend().flush(), 3)
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.attendance_count, 3)
+        self.assertEqual(AttendanceRecord.objects.filter(course=self.course).count(), 3)
+        self.assertEqual(AttendanceDailyRollup.objects.get(course=self.course).present_count, 3)
+
+    def test_flush_skips_rows_written_elsewhere(self):
+        student = self.students[0]
+        mark_attendance(student, self.course)
+        AttendanceRecord.objects.create(student=student, course=self.course, attendance_date=date.today())
+        self.assertEqual(get_attendance_backend().flush(), 0)
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.attendance_count, 1)
+
+    def test_failed_writes_are_retried_then_forgotten(self):
+        backend = get_attendance_backend()
+        backend.retry_delay = 0
+        student = self.students[0]
+        mark_attendance(student, self.course)
+        locked = OperationalError('database is locked')
+        with mock.patch('admin.attendance.record_attendance', side_effect=[locked, None]):
+            with self.assertLogs('admin.attendance', 'WARNING'):
+                self.assertEqual(backend.flush(), 1)
+
+        other = self.students[1]
+        mark_attendance(other, self.course)
+        with mock.patch('admin.attendance.record_attendance', side_effect=locked):
+            with self.assertLogs('admin.attendance', 'ERROR'):
+                self.assertEqual(backend.flush(), 0)
+        self.assertFalse(AttendanceRecord.objects.filter(student=other).exists())
+        self.assertTrue(mark_attendance(other, self.course))
+        self.assertEqual(backend.flush(), 1)
+
+
+class QueryPlanTests(TestCase):
+    """Check that the hot queries are answered from the composite indexes."""
+
+    def assertQueryUsesIndex(self, run_query, index_name):
+        with CaptureQueriesContext(connection) as queries:
+            run_query()
+        sql = queries.captured_queries[-1]['sql']
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            plan = ' '.join(str(row[-1]) for row in cursor.fetchall())
+        self.assertIn(index_name, plan, f'{index_name} not used by:\n{sql}\nplan: {plan}')
+
+    def setUp(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('EXPLAIN QUERY PLAN output is SQLite specific.')
+        self.student = User.objects.get(username='student1')
+
+    def test_student_attendance_summary(self):
+        self.assertQueryUsesIndex(
+            lambda: list(
+                AttendanceRecord.objects.filter(student=self.student)
+                .values('course_id')
+                .annotate(present_days=Count('id'), last_attended=Max('attendance_date'))
+            ),
+            'student_id_course_id_attendance_date',
+        )
+
+    def test_latest_public_lessons_prefetch(self):
+        self.assertQueryUsesIndex(
+            lambda: list(Course.objects.prefetch_related(prefetch_latest_lessons(3))),
+            'lesson_course_vis_created_idx',
+        )
+
+    def test_course_attendance_by_date(self):
+        self.assertQueryUsesIndex(
+            lambda: list(
+                AttendanceRecord.objects.filter(course_id=1, attendance_date__gte=date(2024, 1, 1))
+                .values('attendance_date')
+                .annotate(total=Count('id'))
+            ),
+            'attendance_course_date_idx',
+        )
+
+    def test_default_orderings(self):
+        self.assertQueryUsesIndex(lambda: list(AttendanceRecord.objects.all()[:100]), 'attendance_recent_idx')
+        self.assertQueryUsesIndex(lambda: list(CourseEnrollment.objects.all()[:100]), 'enrollment_enrolled_idx')
+        self.assertQueryUsesIndex(
+            lambda: list(Lesson.objects.select_related('course__category')[:10]),
+            'lesson_created_idx',
+        )
+
+
+BENCHMARK_SCALES = {
+    'ci': {'categories': 5, 'courses': 40, 'lessons': 400, 'faculty': 2, 'students': 50, 'days': 30},
+    'large': {'categories': 50, 'courses': 2000, 'lessons': 200_000, 'faculty': 100, 'students': 50_000, 'days': 730},
+}
+
+
+STAFF = 'staff'
+
+
+class ViewBudgetTests(TestCase):
+    """Drive every named route as the right role and hold it to a query budget.
+
+    Set BENCHMARK_SCALE=large to seed a production-sized dataset and
+    BENCHMARK_REPORT=1 to print per-view query count, SQL time and latency.
+    """
+
+    # name: (role, url kwargs, method, query budget); None kwargs come from the class fixtures
+    ROUTES = {
+        'home': (None, {}, 'get', 0),
+        'about': (None, {}, 'get', 0),
+        'course': (None, {}, 'get', 0),
+        'contact': (None, {}, 'get', 0),
+        'testimonials': (None, {}, 'get', 0),
+        'bastion': (None, {}, 'get', 0),
+        'privacy': (None, {}, 'get', 0),
+        'terms': (None, {}, 'get', 0),
+        'index': (None, {}, 'get', 0),
+        'login': (None, {}, 'get', 0),
+        'forgetpass': (None, {}, 'get', 0),
+        'admin_dashboard': (None, {}, 'get', 0),
+        'export_data': (STAFF, {'kind': 'attendance'}, 'get', 3),
+        'faculty_dashboard': (FACULTY, {}, 'get', 4),
+        'faculty_courses': (FACULTY, {}, 'get', 4),
+        'faculty_attendance_analytics': (FACULTY, {}, 'get', 6),
+        'faculty_web_course': (FACULTY, {}, 'get', 2),
+        'faculty_python_course': (FACULTY, {}, 'get', 2),
+        'faculty_data_course': (FACULTY, {}, 'get', 2),
+        'faculty_course_modules': (FACULTY, {}, 'get', 2),
+        'faculty_course_creation': (FACULTY, {}, 'get', 3),
+        'faculty_lesson_upload': (FACULTY, {}, 'get', 4),
+        'faculty_bulk_import': (FACULTY, {}, 'get', 2),
+        'lesson_uploads': (FACULTY, {}, 'get', 3),
+        'lesson_upload_chunk': (FACULTY, {'upload_id': None}, 'get', 3),
+        'student_dashboard': (STUDENT, {}, 'get', 2),
+        'student_courses': (STUDENT, {}, 'get', 6),
+        'student_enroll_course': (STUDENT, {'course_id': None}, 'post', 9),
+        'student_enter_course': (STUDENT, {'course_id': None}, 'get', 6),
+        'student_python': (STUDENT, {}, 'get', 2),
+        'student_sql': (STUDENT, {}, 'get', 2),
+        'student_html': (STUDENT, {}, 'get', 2),
+        'student_css': (STUDENT, {}, 'get', 2),
+        'student_quiz': (STUDENT, {}, 'get', 2),
+        'student_progress': (STUDENT, {}, 'get', 2),
+        'student_attendance': (STUDENT, {}, 'get', 4),
+        'search_catalog': (STUDENT, {}, 'get', 2),
+        'student_dashboard_api': (STUDENT, {}, 'get', 8),
+        'lesson_download': (STUDENT, {'lesson_id': None}, 'get', 4),
+    }
+
+    results = []
+
+    @classmethod
+    def setUpTestData(cls):
+        scale = BENCHMARK_SCALES[os.environ.get('BENCHMARK_SCALE', 'ci')]
+        generate_synthetic_data(prefix='bench', batch_size=1000, **scale)
+        cls.users = {
+            FACULTY: User.objects.get(username='bench_faculty_0'),
+            STUDENT: User.objects.get(username='bench_student_0'),
+            STAFF: User.objects.create_user('bench_staff', is_staff=True),
+        }
+        enrolled = CourseEnrollment.objects.filter(student=cls.users[STUDENT]).values_list('course_id', flat=True)
+        cls.course_id = Course.objects.filter(category__name__startswith='bench ').exclude(pk__in=enrolled)[0].pk
+        cls.enterClassContext(override_settings(MEDIA_ROOT=cls.enterClassContext(tempfile.TemporaryDirectory())))
+        lesson = Lesson.objects.create(course_id=enrolled[0], title='Budget notes')
+        lesson.lesson_file.save('notes.pdf', ContentFile(b'%PDF-1.4 notes'))
+        cls.lesson_id = lesson.pk
+        cls.upload_id = LessonUpload.objects.create(
+            lesson=Lesson.objects.filter(course_id=cls.course_id).first() or Lesson.objects.first(),
+            filename='lecture.mp4',
+            size=1,
+            sha256='0' * 64,
+            created_by=cls.users[FACULTY],
+        ).pk
+
+    @classmethod
+    def tearDownClass(cls):
+        if os.environ.get('BENCHMARK_REPORT') and cls.results:
+            sys.stderr.write(f"\n{'view':<28}{'queries':>8}{'sql ms':>10}{'total ms':>10}\n")
+            for name, queries, sql_ms, total_ms in cls.results:
+                sys.stderr.write(f'{name:<28}{queries:>8}{sql_ms:>10.1f}{total_ms:>10.1f}\n')
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        invalidate_site_assets()
+
+    def _request(self, name):
+        role, kwargs, method, _ = self.ROUTES[name]
+        kwargs = {key: getattr(self, key) if value is None else value for key, value in kwargs.items()}
+        response = getattr(self.client, method)(reverse(name, kwargs=kwargs))
+        if response.streaming:
+            b''.join(response.streaming_content)
+        return response
+
+    def test_every_route_has_a_budget(self):
+        names = {pattern.name for pattern in app_urls.urlpatterns if isinstance(pattern, URLPattern) and pattern.name}
+        self.assertEqual(names - set(self.ROUTES), set())
+
+    def test_query_budgets(self):
+        for name, (role, _, _, budget) in self.ROUTES.items():
+            with self.subTest(view=name):
+                if role:
+                    self.client.force_login(self.users[role])
+                else:
+                    self.client.logout()
+                with self.captureOnCommitCallbacks(execute=True):
+                    self._request(name)
+
+                started = time.perf_counter()
+                with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+                    response = self._request(name)
+                total_ms = (time.perf_counter() - started) * 1000
+                sql_ms = sum(float(query['time']) for query in queries.captured_queries) * 1000
+                self.results.append((name, len(queries), sql_ms, total_ms))
+
+                self.assertLess(response.status_code, 400)
+                self.assertLessEqual(
+                    len(queries),
+                    budget,
+                    f'{name} ran {len(queries)} queries (budget {budget}):\n'
+                    + '\n'.join(query['sql'] for query in queries.captured_queries),
+                )
+
+
+class SyntheticDataTests(TestCase):
+    OPTIONS = ['--prefix=gen', '--seed=3', '--categories=2', '--courses=4', '--lessons=10',
+               '--faculty=1', '--students=5', '--days=10']
+
+    def _attendance(self):
+        return list(
+            AttendanceRecord.objects.filter(student__username__startswith='gen_')
+            .order_by('pk')
+            .values_list('student__username', 'course__title', 'attendance_date')
+        )
+
+    def test_generation_is_reproducible(self):
+        call_command('generate_synthetic_data', *self.OPTIONS, stdout=StringIO())
+        first = self._attendance()
+        self.assertTrue(first)
+        self.assertEqual(User.objects.filter(username__startswith='gen_student_', groups__name=STUDENT).count(), 5)
+        call_command('rebuild_course_counters', '--verify', stdout=StringIO())
+
+        with self.assertRaises(CommandError):
+            call_command('generate_synthetic_data', *self.OPTIONS, stdout=StringIO())
+        call_command('generate_synthetic_data', *self.OPTIONS, '--flush', stdout=StringIO())
+        self.assertEqual(self._attendance(), first)
+
+
+class SqliteTuningTests(TestCase):
+    def setUp(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite only.')
+
+    def test_pragmas_applied_to_connection(self):
+        report = read_sqlite_pragmas(connection)
+        self.assertEqual(report['busy_timeout'][1], 5000)
+        self.assertTrue(pragma_matches('synchronous', *report['synchronous']))
+        self.assertTrue(pragma_matches('temp_store', *report['temp_store']))
+
+    def test_status_command_reports_settings(self):
+        out = StringIO()
+        call_command('sqlite_status', stdout=out)
+        self.assertIn('busy_timeout  5000', out.getvalue())
+
+
+@mock.patch('admin.routers.replica_available', return_value=True)
+class ReplicaRouterTests(TestCase):
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+        self.tokens = start_request()
+        self.addCleanup(end_request, self.tokens)
+
+    def test_reads_go_to_replica_until_a_write(self, _):
+        with mock.patch.object(connection, 'in_atomic_block', False):
+            self.assertEqual(self.router.db_for_read(Course), 'replica')
+            self.assertEqual(self.router.db_for_write(Course), 'default')
+            self.assertEqual(self.router.db_for_read(Course), 'default')
+
+    def test_migrations_only_on_primary(self, _):
+        self.assertTrue(self.router.allow_migrate('default', 'custom_admin'))
+        self.assertFalse(self.router.allow_migrate('replica', 'custom_admin'))
+
+    def test_write_sets_pin_cookie(self, _):
+        self.client.force_login(User.objects.get(username='student1'))
+        course = Course.objects.get(title='Python')
+        response = self.client.post(reverse('student_enroll_course', args=[course.pk]))
+        self.assertIn('primary_pin', response.cookies)
+
+        response = self.client.get(reverse('student_dashboard'))
+        self.assertNotIn('primary_pin', response.cookies)
+
+
+class AttendanceRollupTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.students = list(User.objects.filter(username__startswith='student').order_by('username'))
+        self.course = Course.objects.get(title='Python')
+
+    def _daily(self, day):
+        return AttendanceDailyRollup.objects.get(course=self.course, attendance_date=day).present_count
+
+    def test_marks_update_rollups_incrementally(self):
+        today = date.today()
+        mark_attendance(self.students[0], self.course, attendance_date=today - timedelta(days=1))
+        mark_attendance(self.students[0], self.course, attendance_date=today)
+        mark_attendance(self.students[1], self.course, attendance_date=today)
+
+        self.assertEqual(self._daily(today), 2)
+        summary = StudentCourseAttendance.objects.get(student=self.students[0], course=self.course)
+        self.assertEqual((summary.present_days, summary.last_attended), (2, today))
+
+    def test_deleting_a_record_refreshes_rollups(self):
+        today = date.today()
+        record = AttendanceRecord.objects.create(student=self.students[0], course=self.course, attendance_date=today)
+        AttendanceRecord.objects.create(student=self.students[1], course=self.course, attendance_date=today)
+        self.assertEqual(self._daily(today), 2)
+
+        record.delete()
+        self.assertEqual(self._daily(today), 1)
+        self.assertFalse(StudentCourseAttendance.objects.filter(student=self.students[0]).exists())
+
+    def test_rebuild_command_matches_incremental_rollups(self):
+        today = date.today()
+        for offset in range(3):
+            mark_attendance(self.students[0], self.course, attendance_date=today - timedelta(days=offset))
+        expected = list(AttendanceDailyRollup.objects.values_list('course_id', 'attendance_date', 'present_count'))
+        AttendanceDailyRollup.objects.all().delete()
+        StudentCourseAttendance.objects.all().delete()
+
+        call_command('rebuild_attendance_rollups', stdout=StringIO())
+        self.assertCountEqual(
+            AttendanceDailyRollup.objects.values_list('course_id', 'attendance_date', 'present_count'), expected
+        )
+        self.assertEqual(StudentCourseAttendance.objects.get(student=self.students[0]).present_days, 3)
+
+    def test_student_attendance_reads_summary(self):
+        mark_attendance(self.students[0], self.course)
+        self.client.force_login(self.students[0])
+        response = self.client.get(reverse('student_attendance'))
+        self.assertEqual(response.context['rows'][0]['present_days'], 1)
+
+
+class AttendanceAnalyticsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.faculty = User.objects.get(username='faculty1')
+        self.students = list(User.objects.filter(username__startswith='student').order_by('username'))
+        self.course = Course.objects.get(title='Python')
+
+    def test_compute_daily_rolling_and_streaks(self):
+        start = date(2026, 1, 1)
+        end = start + timedelta(days=9)
+        rows = [(1, start + timedelta(days=offset)) for offset in range(7, 10)] + [(2, start)]
+        result = compute_attendance_analytics(*zip(*rows), [1, 2, 3], start, end)
+
+        self.assertEqual([count for _, count, _ in result['days']], [1, 0, 0, 0, 0, 0, 0, 1, 1, 1])
+        self.assertEqual(result['days'][-1][2], 3)
+        self.assertEqual(result['days'][7][2], 1)
+        self.assertEqual(result['weeks'], [(start, 1), (start + timedelta(days=7), 3)])
+        self.assertEqual((result['enrolled'], result['attended']), (3, 2))
+        self.assertEqual(result['streaks'], [(1, 3, 3)])
+        self.assertEqual([row[0] for row in result['at_risk']], [3, 2, 1])
+        self.assertIsNone(result['at_risk'][0][2])
+
+    def test_compute_handles_empty_course(self):
+        result = compute_attendance_analytics((), (), [], date(2026, 1, 1), date(2026, 1, 7))
+        self.assertEqual(result['total_present'], 0)
+        self.assertEqual((result['streaks'], result['at_risk']), ([], []))
+
+    def test_view_is_cached_until_attendance_changes(self):
+        for student in self.students:
+            enroll_student(student, self.course)
+        mark_attendance(self.students[0], self.course)
+
+        self.client.force_login(self.faculty)
+        url = reverse('faculty_attendance_analytics')
+        response = self.client.get(url, {'course': self.course.pk})
+        analytics = response.context['analytics']
+        self.assertEqual((analytics['total_present'], analytics['attended'], analytics['enrolled']), (1, 1, 3))
+        self.assertEqual(analytics['at_risk_total'], 3)
+        self.assertEqual(analytics['at_risk'][-1][0], 'student1')
+
+        with self.assertNumQueries(4):
+            self.client.get(url, {'course': self.course.pk})
+        mark_attendance(self.students[1], self.course)
+        response = self.client.get(url, {'course': self.course.pk})
+        self.assertEqual(response.context['analytics']['total_present'], 2)
+
+    def test_editing_a_record_refreshes_the_cached_view(self):
+        enroll_student(self.students[0], self.course)
+        mark_attendance(self.students[0], self.course)
+        self.client.force_login(self.faculty)
+        url = reverse('faculty_attendance_analytics')
+        days = self.client.get(url, {'course': self.course.pk}).context['analytics']['days']
+        self.assertEqual((days[-2][1], days[-1][1]), (0, 1))
+
+        record = AttendanceRecord.objects.get(student=self.students[0])
+        record.attendance_date = date.today() - timedelta(days=1)
+        record.save()
+        days = self.client.get(url, {'course': self.course.pk}).context['analytics']['days']
+        self.assertEqual((days[-2][1], days[-1][1]), (1, 0))
+
+    def test_view_rejects_bad_ranges(self):
+        self.client.force_login(self.faculty)
+        response = self.client.get(reverse('faculty_attendance_analytics'), {'start': '2026-02-01', 'end': '2026-01-01'})
+        self.assertTrue(response.context['error'])
+        self.assertIsNone(response.context['analytics'])
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.staff = User.objects.create_user('reporter', is_staff=True)
+        self.students = list(User.objects.filter(username__startswith='student').order_by('username'))
+        self.python = Course.objects.get(title='Python')
+        self.html = Course.objects.get(title='HTML')
+        today = date.today()
+        for course in (self.python, self.html):
+            enroll_student(self.students[0], course)
+            mark_attendance(self.students[0], course, attendance_date=today - timedelta(days=10))
+            mark_attendance(self.students[0], course, attendance_date=today)
+
+    def _export(self, kind, **params):
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse('export_data', kwargs={'kind': kind}), params)
+        self.assertTrue(response.streaming)
+        return list(csv.reader(StringIO(b''.join(response.streaming_content).decode())))
+
+    def test_attendance_export_filters_without_model_instances(self):
+        since = (date.today() - timedelta(days=1)).isoformat()
+        with mock.patch.object(AttendanceRecord, 'from_db', side_effect=AssertionError('instance built')):
+            rows = self._export('attendance', course=self.python.pk, start=since)
+        self.assertEqual(rows[0], ['student', 'course', 'category', 'attendance_date', 'source', 'marked_at'])
+        self.assertEqual([row[:4] for row in rows[1:]], [
+            ['student1', 'Python', self.python.category.name, date.today().isoformat()],
+        ])
+
+    def test_enrollment_export_by_category(self):
+        rows = self._export('enrollments', category=self.html.category_id)
+        self.assertEqual({row[1] for row in rows[1:]}, {
+            title for title in Course.objects.filter(category=self.html.category, enrollments__isnull=False)
+            .values_list('title', flat=True)
+        })
+
+    def test_export_requires_staff_and_valid_filters(self):
+        url = reverse('export_data', kwargs={'kind': 'attendance'})
+        self.client.force_login(self.students[0])
+        self.assertEqual(self.client.get(url).status_code, 302)
+        self.client.force_login(self.staff)
+        self.assertEqual(self.client.get(url, {'start': 'yesterday'}).status_code, 400)
+        self.assertEqual(self.client.get(reverse('export_data', kwargs={'kind': 'users'})).status_code, 404)
+
+    def test_admin_action_streams_selection(self):
+        admin_user = User.objects.create_superuser('root', 'root@example.com', 'pw')
+        self.client.force_login(admin_user)
+        selected = AttendanceRecord.objects.filter(course=self.html).values_list('pk', flat=True)
+        response = self.client.post(
+            reverse('admin:custom_admin_attendancerecord_changelist'),
+            {'action': 'export_csv', '_selected_action': list(selected)},
+        )
+        rows = list(csv.reader(StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual({row[1] for row in rows[1:]}, {'HTML'})
+
+
+class BulkImportTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.faculty = User.objects.get(username='faculty1')
+
+    def _import(self, kind, text, **kwargs):
+        return import_csv(kind, StringIO(text), **kwargs)
+
+    def test_courses_resolve_categories_in_bulk_and_report_bad_rows(self):
+        text = (
+            'category,title,level,duration_hours\n'
+            'Term Imports,Rust,beginner,10\n'
+            'Term Imports,Go,expert,4\n'
+            'Term Imports,,beginner,1\n'
+            'Term Imports,Rust,beginner,10\n'
+            'Other Imports,Kotlin,advanced,x\n'
+            'Other Imports,Swift,advanced,20\n'
+        )
+        with self.assertNumQueries(18):
+            report = self._import('courses', text, user=self.faculty, batch_size=100)
+        self.assertEqual((report.rows, report.created, report.skipped), (6, 2, 1))
+        self.assertEqual([line for line, _ in report.errors], [3, 4, 6])
+        self.assertEqual(
+            set(Course.objects.filter(category__name__endswith=' Imports').values_list('title', 'created_by')),
+            {('Rust', self.faculty.pk), ('Swift', self.faculty.pk)},
+        )
+        self.assertEqual([result.object.title for result in search('swift')], ['Swift'])
+        self.assertEqual(self._import('courses', text).created, 0)
+
+    def test_users_and_enrollments_update_roles_and_counters(self):
+        report = self._import(
+            'users', 'username,role,email,password\nnewbie,student,n@example.com,Secret@123\nboss,faculty,,\n',
+            roles=(STUDENT,),
+        )
+        self.assertEqual((report.created, len(report.errors)), (1, 1))
+        newbie = User.objects.get(username='newbie')
+        self.assertTrue(newbie.check_password('Secret@123'))
+        self.assertEqual(get_user_roles(newbie), {STUDENT})
+
+        course = Course.objects.get(title='Python')
+        text = 'username,category,course\nnewbie,{0},Python\nstudent1,{0},Python\nghost,{0},Python\nnewbie,{0},Nope\n'
+        report = self._import('enrollments', text.format(course.category.name), batch_size=2)
+        self.assertEqual((report.created, [line for line, _ in report.errors]), (2, [4, 5]))
+        course.refresh_from_db()
+        self.assertEqual(course.enrollment_count, CourseEnrollment.objects.filter(course=course).count())
+        call_command('rebuild_course_counters', '--verify', stdout=StringIO())
+
+    def test_lessons_skip_duplicates_and_categories_ignore_case(self):
+        course = Course.objects.get(title='HTML')
+        text = f'category,course,title\n{course.category.name.upper()},HTML,Forms\n{course.category.name},HTML,Forms\n'
+        self.assertEqual(self._import('lessons', text)[2:4], (1, 1))
+        self.assertEqual(self._import('lessons', text)[2:4], (0, 2))
+        self.assertEqual(Lesson.objects.filter(course=course, title='Forms').count(), 1)
+
+        categories = CourseCategory.objects.count()
+        text = f'category,title\n{course.category.name.lower()},Canvas\nNew Imports,A\nnew imports,B\n'
+        self.assertEqual(self._import('courses', text).created, 3)
+        self.assertEqual(CourseCategory.objects.count(), categories + 1)
+        self.assertTrue(Course.objects.filter(category=course.category, title='Canvas').exists())
+
+    def test_enrollments_bump_only_the_imported_students(self):
+        course = Course.objects.get(title='Python')
+        imported, other = User.objects.get(username='student1'), User.objects.get(username='student2')
+        before = {student.pk: async_to_sync(adashboard_version)(student.pk) for student in (imported, other)}
+        with self.captureOnCommitCallbacks(execute=True):
+            self._import('enrollments', f'username,category,course\nstudent1,{course.category.name},Python\n')
+        self.assertNotEqual(async_to_sync(adashboard_version)(imported.pk), before[imported.pk])
+        self.assertEqual(async_to_sync(adashboard_version)(other.pk), before[other.pk])
+
+    def test_missing_column_rejects_file(self):
+        with self.assertRaises(ValueError):
+            self._import('lessons', 'title\nIntro\n')
+
+    def test_unreadable_records_are_reported(self):
+        course = Course.objects.get(title='HTML')
+        huge = 'x' * (csv.field_size_limit() + 1)
+        text = f'category,course,title\n{course.category.name},HTML,Tables\n{course.category.name},HTML,"{huge}"\n'
+        report = self._import('lessons', text)
+        self.assertEqual((report.created, [line for line, _ in report.errors]), (1, [3]))
+
+        self.client.force_login(self.faculty)
+        upload = SimpleUploadedFile('lessons.csv', text.encode())
+        response = self.client.post(reverse('faculty_bulk_import'), {'kind': 'lessons', 'csv_file': upload})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Unreadable CSV', response.context['errors_shown'][0][1])
+
+    def test_undecodable_text_keeps_the_rows_before_it(self):
+        course = Course.objects.get(title='HTML')
+        rows = ''.join(f'{course.category.name},HTML,Imported {index}\n' for index in range(1000))
+        upload = SimpleUploadedFile('lessons.csv', f'category,course,title\n{rows}'.encode() + b'\xff,HTML,Bad\n')
+        self.client.force_login(self.faculty)
+        response = self.client.post(reverse('faculty_bulk_import'), {'kind': 'lessons', 'csv_file': upload})
+        report = response.context['report']
+        self.assertEqual(response.context['error'], '')
+        self.assertGreater(report.created, 0)
+        self.assertEqual(report.created, report.stopped_at - 2)
+        self.assertEqual(Lesson.objects.filter(course=course, title__startswith='Imported ').count(), report.created)
+        self.assertIn(f'stopped at line {report.stopped_at}', response.content.decode())
+
+    def test_command_and_upload_page(self):
+        course = Course.objects.get(title='HTML')
+        path = os.path.join(self.enterContext(tempfile.TemporaryDirectory()), 'lessons.csv')
+        with open(path, 'w') as handle:
+            handle.write(f'category,course,title,visibility\n{course.category.name},HTML,Forms,public\n')
+        out, err = StringIO(), StringIO()
+        call_command('import_csv', 'lessons', path, '--created-by=faculty1', stdout=out, stderr=err)
+        self.assertIn('1 created', out.getvalue())
+        self.assertTrue(Lesson.objects.filter(course=course, title='Forms', created_by=self.faculty).exists())
+
+        self.client.force_login(self.faculty)
+        upload = SimpleUploadedFile('lessons.csv', f'category,course,title\n{course.category.name},HTML,Tables\n,HTML,\n'.encode())
+        response = self.client.post(reverse('faculty_bulk_import'), {'kind': 'lessons', 'csv_file': upload})
+        self.assertEqual(response.context['report'].created, 1)
+        self.assertEqual(len(response.context['errors_shown']), 1)
+        course.refresh_from_db()
+        self.assertEqual(course.lesson_count, Lesson.objects.filter(course=course).count())
+
+
+class ChunkedUploadTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.media = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(override_settings(MEDIA_ROOT=self.media))
+        self.faculty = User.objects.get(username='faculty1')
+        self.lesson = Lesson.objects.create(course=Course.objects.get(title='Python'), title='Recorded lecture')
+        self.payload = os.urandom(150_000)
+        self.client.force_login(self.faculty)
+
+    def _start(self, payload=None, whole_file_digest=True):
+        payload = self.payload if payload is None else payload
+        data = {'lesson_id': self.lesson.pk, 'filename': '../lecture.mp4', 'size': len(self.payload)}
+        if whole_file_digest:
+            data['sha256'] = hashlib.sha256(payload).hexdigest()
+        response = self.client.post(reverse('lesson_uploads'), data)
+        self.assertEqual(response.status_code, 201)
+        return reverse('lesson_upload_chunk', kwargs={'upload_id': response.json()['id']})
+
+    def _put(self, url, offset, data, checksum=None):
+        headers = {'HTTP_UPLOAD_CHECKSUM': checksum} if checksum else {}
+        return self.client.generic(
+            'PUT', url, data, content_type='application/octet-stream', HTTP_UPLOAD_OFFSET=str(offset), **headers
+        )
+
+    def _checksum(self, data):
+        return 'sha256 ' + base64.b64encode(hashlib.sha256(data).digest()).decode()
+
+    def test_resumes_from_offset_and_attaches_verified_file(self):
+        url = self._start()
+        with mock.patch('admin.uploads._COPY_BUFFER', 4096):
+            self.assertEqual(self._put(url, 0, self.payload[:60_000]).json()['offset'], 60_000)
+            stale = self._put(url, 0, self.payload[:60_000])
+            self.assertEqual((stale.status_code, stale.json()['offset']), (409, 60_000))
+            self.assertEqual(self.client.get(url).json()['offset'], 60_000)
+            self._put(url, 60_000, self.payload[60_000:])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url)
+        self.assertTrue(response.json()['completed'])
+        self.lesson.refresh_from_db()
+        self.assertTrue(self.lesson.lesson_file.name.startswith('lessons/files/lecture'))
+        with self.lesson.lesson_file.open('rb') as handle:
+            self.assertEqual(handle.read(), self.payload)
+        self.assertEqual(os.listdir(os.path.join(self.media, 'uploads', 'partial')), [])
+        self.assertEqual(self.client.get(reverse('lesson_uploads')).json()['uploads'], [])
+
+    def test_checksum_mismatch_resets_upload(self):
+        url = self._start(payload=b'something else')
+        self._put(url, 0, self.payload)
+        response = self.client.post(url)
+        self.assertEqual((response.status_code, response.json()['offset']), (409, 0))
+        self.lesson.refresh_from_db()
+        self.assertFalse(self.lesson.lesson_file)
+
+    def test_chunk_checksums_replace_the_whole_file_hash(self):
+        url = self._start(whole_file_digest=False)
+        first, rest = self.payload[:60_000], self.payload[60_000:]
+        self.assertEqual(self._put(url, 0, first).status_code, 400)
+        self.assertEqual(self._put(url, 0, first, checksum='md5 abc').status_code, 400)
+        corrupt = self._put(url, 0, first, checksum=self._checksum(rest))
+        self.assertEqual((corrupt.status_code, corrupt.json()['offset']), (409, 0))
+        self.assertEqual(self._put(url, 0, first, checksum=self._checksum(first)).json()['offset'], 60_000)
+        self._put(url, 60_000, rest, checksum=self._checksum(rest))
+
+        with mock.patch('admin.uploads._file_sha256') as rehash, self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(self.client.post(url).json()['completed'])
+        rehash.assert_not_called()
+        self.lesson.refresh_from_db()
+        with self.lesson.lesson_file.open('rb') as handle:
+            self.assertEqual(handle.read(), self.payload)
+
+    def test_replacing_a_file_deletes_the_old_one(self):
+        self.lesson.lesson_file.save('old.mp4', ContentFile(b'old'))
+        old_path = self.lesson.lesson_file.path
+        url = self._start()
+        self._put(url, 0, self.payload)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url)
+        self.lesson.refresh_from_db()
+        self.assertFalse(os.path.exists(old_path))
+        self.assertTrue(os.path.exists(self.lesson.lesson_file.path))
+
+    def test_oversized_chunks_and_foreign_uploads_are_rejected(self):
+        url = self._start()
+        with override_settings(LESSON_UPLOAD_CHUNK_SIZE=1000):
+            self.assertEqual(self._put(url, 0, self.payload[:2000]).status_code, 413)
+        self.client.force_login(User.objects.get(username='faculty2'))
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_completing_survives_a_rollback(self):
+        url = self._start()
+        self._put(url, 0, self.payload)
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            complete_upload(LessonUpload.objects.get())
+            raise RuntimeError
+        self.assertEqual(len(os.listdir(os.path.join(self.media, 'uploads', 'partial'))), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(self.client.post(url).json()['completed'])
+        self.lesson.refresh_from_db()
+        with self.lesson.lesson_file.open('rb') as handle:
+            self.assertEqual(handle.read(), self.payload)
+        self.assertEqual(os.listdir(os.path.join(self.media, 'uploads', 'partial')), [])
+
+    def test_missing_partial_file_is_gone(self):
+        url = self._start()
+        os.remove(upload_temp_path(LessonUpload.objects.get()))
+        self.assertEqual(self._put(url, 0, self.payload[:10]).status_code, 410)
+        self.assertEqual(self.client.post(url).status_code, 409)
+        LessonUpload.objects.update(offset=len(self.payload))
+        self.assertEqual(self.client.post(url).status_code, 410)
+
+    def test_purge_removes_stale_partial_files(self):
+        url = self._start()
+        self._put(url, 0, self.payload[:10])
+        LessonUpload.objects.update(updated_at=timezone.now() - timedelta(days=3))
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('purge_lesson_uploads', stdout=StringIO())
+        self.assertFalse(LessonUpload.objects.exists())
+        self.assertEqual(os.listdir(os.path.join(self.media, 'uploads', 'partial')), [])
+
+
+class LessonDownloadTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.enterContext(override_settings(MEDIA_ROOT=self.enterContext(tempfile.TemporaryDirectory())))
+        self.student = User.objects.get(username='student1')
+        self.course = Course.objects.get(title='Python')
+        self.payload = bytes(range(256)) * 40
+        self.lesson = Lesson.objects.create(course=self.course, title='Slides')
+        self.lesson.lesson_file.save('slides.pdf', ContentFile(self.payload))
+        self.url = reverse('lesson_download', kwargs={'lesson_id': self.lesson.pk})
+        enroll_student(self.student, self.course)
+        self.client.force_login(self.student)
+
+    def _body(self, response):
+        return b''.join(response.streaming_content)
+
+    def test_full_download_and_conditional_get(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response['Content-Type'], response['Accept-Ranges']), ('application/pdf', 'bytes'))
+        self.assertEqual(self._body(response), self.payload)
+
+        cached = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(cached.status_code, 304)
+
+    def test_byte_ranges(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=100-199')
+        self.assertEqual((response.status_code, response['Content-Range']), (206, f'bytes 100-199/{len(self.payload)}'))
+        self.assertEqual(self._body(response), self.payload[100:200])
+        self.assertEqual(self._body(self.client.get(self.url, HTTP_RANGE='bytes=10000-')), self.payload[10000:])
+        self.assertEqual(self._body(self.client.get(self.url, HTTP_RANGE='bytes=-5')), self.payload[-5:])
+        self.assertEqual(self.client.get(self.url, HTTP_RANGE='bytes=99999-').status_code, 416)
+
+        stale = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"old"')
+        self.assertEqual((stale.status_code, len(self._body(stale))), (200, len(self.payload)))
+
+    def test_access_requires_enrollment_and_public_lesson(self):
+        other = User.objects.get(username='student2')
+        self.client.force_login(other)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+        self.client.force_login(self.student)
+        Lesson.objects.filter(pk=self.lesson.pk).update(visibility='draft')
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        self.client.force_login(User.objects.get(username='faculty1'))
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_proxy_offload_modes(self):
+        with override_settings(LESSON_DOWNLOAD_MODE='x-accel', LESSON_DOWNLOAD_ACCEL_PREFIX='/internal/'):
+            response = self.client.get(self.url)
+        self.assertEqual(response['X-Accel-Redirect'], '/internal/' + self.lesson.lesson_file.name)
+        self.assertEqual(response.content, b'')
+        with override_settings(LESSON_DOWNLOAD_MODE='x-sendfile'):
+            response = self.client.get(self.url)
+        self.assertEqual(response['X-Sendfile'], self.lesson.lesson_file.path)
+
+
+@override_settings(IMAGE_VARIANTS_BACKGROUND=False)
+class ImageVariantTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        invalidate_site_assets()
+        self.enterContext(override_settings(MEDIA_ROOT=self.enterContext(tempfile.TemporaryDirectory())))
+
+    def _png(self, size=(1200, 800), name='banner.png', image_format='PNG'):
+        buffer = BytesIO()
+        mode = 'RGBA' if image_format == 'PNG' else 'RGB'
+        PILImage.new(mode, size, (200, 40, 40, 255)[:len(mode)]).save(buffer, image_format)
+        return ContentFile(buffer.getvalue(), name=name)
+
+    def test_variants_generated_after_commit_and_served(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            image = WebsiteImage.objects.create(title='Banner', image=self._png())
+        thumb = variant_name(image.image.name, 'thumb')
+        self.assertTrue(thumb.endswith('.thumb.webp'))
+        self.assertTrue(image.image.storage.exists(thumb))
+        with image.image.storage.open(thumb) as handle, PILImage.open(handle) as rendered:
+            self.assertEqual((rendered.format, rendered.size), ('WEBP', (135, 90)))
+        self.assertEqual(variant_url(image.image, 'thumb'), image.image.storage.url(thumb))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image.delete()
+        self.assertFalse(image.image.storage.exists(thumb))
+
+    def test_replacing_an_image_deletes_the_old_variants(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            image = WebsiteImage.objects.create(title='Hero', image=self._png())
+        old_thumb = variant_name(image.image.name, 'thumb')
+        storage = image.image.storage
+        self.assertTrue(storage.exists(old_thumb))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image.image = self._png(name='hero-2.png')
+            image.save()
+        self.assertFalse(storage.exists(old_thumb))
+        self.assertTrue(storage.exists(variant_name(image.image.name, 'thumb')))
+
+    def test_originals_sharing_a_stem_keep_their_own_variants(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            png = WebsiteImage.objects.create(title='PNG', image=self._png())
+            jpeg = WebsiteImage.objects.create(title='JPEG', image=self._png(name='banner.jpg', image_format='JPEG'))
+        png_thumb, jpeg_thumb = variant_name(png.image.name, 'thumb'), variant_name(jpeg.image.name, 'thumb')
+        self.assertNotEqual(png_thumb, jpeg_thumb)
+        storage = png.image.storage
+        self.assertTrue(storage.exists(png_thumb) and storage.exists(jpeg_thumb))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            png.delete()
+        self.assertFalse(storage.exists(png_thumb))
+        self.assertTrue(storage.exists(jpeg_thumb))
+
+    def test_filter_falls_back_to_original_until_variant_exists(self):
+        with mock.patch('admin.signals.schedule_variants'), self.captureOnCommitCallbacks(execute=True):
+            branding = SiteBranding.objects.create(logo=self._png((800, 200)))
+        rendered = Template("{% load image_variants %}{{ logo|variant:'logo' }}").render(Context({'logo': branding.logo}))
+        self.assertEqual(rendered, branding.logo.url)
+        version = get_site_assets().version
+
+        call_command('generate_image_variants', stdout=StringIO())
+        rendered = Template("{% load image_variants %}{{ logo|variant:'logo' }}").render(Context({'logo': branding.logo}))
+        self.assertTrue(rendered.endswith('.logo.webp'))
+        self.assertNotEqual(get_site_assets().version, version)
+
+
+class StaticBuildTests(TestCase):
+    def setUp(self):
+        source = self.enterContext(tempfile.TemporaryDirectory())
+        self.root = self.enterContext(tempfile.TemporaryDirectory())
+        os.makedirs(os.path.join(source, 'site'))
+        with open(os.path.join(source, 'site', 'app.css'), 'w') as handle:
+            handle.write('/* layout */\n.card {\n    color : red;\n    content: "a ; b";\n}\n' * 200)
+        with open(os.path.join(source, 'site', 'tiny.css'), 'w') as handle:
+            handle.write('p { margin: 0; }\n')
+        self.enterContext(override_settings(
+            STATICFILES_DIRS=[source],
+            STATIC_ROOT=self.root,
+            STATICFILES_FINDERS=['django.contrib.staticfiles.finders.FileSystemFinder'],
+            STORAGES={
+                'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+                'staticfiles': {'BACKEND': 'admin.staticbuild.BuildStaticFilesStorage'},
+            },
+        ))
+        call_command('collectstatic', interactive=False, verbosity=0)
+
+    def _hashed(self, name):
+        return staticfiles_storage.stored_name(name)
+
+    def test_minify_css_keeps_strings(self):
+        self.assertEqual(minify_css('/* x */ a , b {\n color: red ;\n content: " ; { " ;\n}'),
+                         'a,b{color: red;content: " ; { "}')
+        self.assertEqual(minify_css('a { content: "/*" ; }\nb { content: \'*/\' }'),
+                         'a{content: "/*"}b{content: \'*/\'}')
+        self.assertEqual(minify_css("/* don't */ a { }"), 'a{}')
+
+    def test_collect_writes_hashed_minified_and_compressed_files(self):
+        hashed = self._hashed('site/app.css')
+        self.assertRegex(hashed, r'^site/app\.[0-9a-f]{12}\.css$')
+        with open(os.path.join(self.root, hashed)) as handle:
+            content = handle.read()
+        self.assertNotIn('layout', content)
+        self.assertIn('.card{color : red;content: "a ; b"}', content)
+        with gzip.open(os.path.join(self.root, hashed + '.gz'), 'rt') as handle:
+            self.assertEqual(handle.read(), content)
+        self.assertFalse(os.path.exists(os.path.join(self.root, self._hashed('site/tiny.css') + '.gz')))
+
+    def test_serve_prefers_gzip_and_caches_hashed_names_forever(self):
+        hashed = self._hashed('site/app.css')
+        request = RequestFactory().get('/static/' + hashed, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        response = serve_static(request, hashed)
+        self.assertEqual((response['Content-Encoding'], response['Content-Type']), ('gzip', 'text/css'))
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertIn('Accept-Encoding', response['Vary'])
+        response.close()
+
+        brotli_path = os.path.join(self.root, hashed + '.br')
+        if not os.path.exists(brotli_path):
+            with open(brotli_path, 'wb') as handle:
+                handle.write(b'br')
+        for header, encoding in (('br;q=0, gzip', 'gzip'), ('gzip;q=0.5, br', 'br'), ('*;q=0', None)):
+            response = serve_static(RequestFactory().get('/', HTTP_ACCEPT_ENCODING=header), hashed)
+            self.assertEqual(response.get('Content-Encoding'), encoding, header)
+            response.close()
+
+        plain = serve_static(RequestFactory().get('/static/site/app.css'), 'site/app.css')
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        self.assertIn('max-age=60', plain['Cache-Control'])
+        plain.close()
+        revalidated = serve_static(RequestFactory().get('/', HTTP_IF_NONE_MATCH=plain['ETag']), 'site/app.css')
+        self.assertEqual(revalidated.status_code, 304)
+        with self.assertRaises(Http404):
+            serve_static(RequestFactory().get('/'), '../secrets.txt')
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.faculty = User.objects.get(username='faculty1')
+        self.student = User.objects.get(username='student1')
+        self.course = Course.objects.get(title='Python')
+        self.course.description = 'Variables, loops and functions.'
+        self.course.save()
+        self.lesson = Lesson.objects.create(course=self.course, title='Running scripts', description='The interpreter.')
+
+    def _titles(self, text, **kwargs):
+        return [result.object.title for result in search(text, **kwargs)]
+
+    def test_match_expression_quotes_terms_as_prefixes(self):
+        self.assertEqual(match_expression('run "python*'), '"run"* "python"*')
+        self.assertIsNone(match_expression(' -- '))
+        self.assertEqual(search_ids('") OR kind:*'), [])
+
+    def test_ranked_by_title_then_context_then_body(self):
+        other = Lesson.objects.create(course=self.course, title='Debugging', description='Loops that never end.')
+        Lesson.objects.create(course=self.course, title='Loops in depth')
+        titles = self._titles('loops')
+        self.assertEqual(titles[0], 'Loops in depth')
+        self.assertEqual(set(titles[1:]), {other.title, 'Python'})
+        self.assertEqual(self._titles('run script'), ['Running scripts'])
+
+    def test_signals_keep_the_index_in_sync(self):
+        self.lesson.title = 'Shell sessions'
+        self.lesson.save()
+        self.assertEqual(self._titles('running'), [])
+        self.assertEqual(self._titles('shell'), ['Shell sessions'])
+
+        self.course.title = 'Python Basics'
+        self.course.save(update_fields=['title'])
+        self.assertEqual(search_ids('basics shell'), [('lesson', self.lesson.pk)])
+
+        self.course.category.name = 'Scripting Languages'
+        self.course.category.save()
+        self.assertIn(('course', self.course.pk), search_ids('scripting', kind='course'))
+
+        self.lesson.delete()
+        self.assertEqual(self._titles('shell'), [])
+
+    def test_hidden_lessons_and_inactive_courses_need_include_hidden(self):
+        draft = Lesson.objects.create(course=self.course, title='Decorators draft', visibility='draft')
+        self.assertEqual(self._titles('decorators'), [])
+        self.assertEqual(self._titles('decorators', include_hidden=True), [draft.title])
+        Course.objects.filter(pk=self.course.pk).update(is_active=False)
+        self.assertEqual(self._titles('running'), [])
+
+    def test_rebuild_restores_rows_written_in_bulk(self):
+        Lesson.objects.bulk_create([Lesson(course=self.course, title=f'Generators {n}') for n in range(3)])
+        self.assertEqual(self._titles('generators'), [])
+        rebuild_search_index([self.course.pk])
+        self.assertEqual(len(self._titles('generators')), 3)
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM custom_admin_search')
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(self._titles('running'), ['Running scripts'])
+
+    def test_student_and_faculty_endpoints(self):
+        Lesson.objects.create(course=self.course, title='Running tests', visibility='private')
+        url = reverse('search_catalog')
+        self.client.force_login(self.student)
+        with self.assertNumQueries(5):
+            data = self.client.get(url, {'q': 'running'}).json()
+        self.assertEqual(data['results'], [{
+            'kind': 'lesson', 'id': self.lesson.pk, 'title': 'Running scripts',
+            'course_id': self.course.pk, 'course_title': 'Python', 'category': self.course.category.name,
+        }])
+        self.assertContains(self.client.get(reverse('student_courses'), {'q': 'running'}), 'Running scripts')
+
+        self.client.force_login(self.faculty)
+        self.assertEqual(len(self.client.get(url, {'q': 'running'}).json()['results']), 2)
+        self.assertContains(self.client.get(reverse('faculty_courses'), {'q': 'running'}), 'Running tests')
+
+    def test_admin_changelist_uses_the_index(self):
+        self.client.force_login(User.objects.create_superuser('search_admin', password='x'))
+        response = self.client.get(reverse('admin:custom_admin_lesson_changelist'), {'q': 'runn'})
+        self.assertEqual(list(response.context['cl'].queryset), [self.lesson])
+        self.assertIn('MATCH', str(response.context['cl'].queryset.query))
+        courses = self.client.get(reverse('admin:custom_admin_course_changelist'), {'q': 'python'})
+        self.assertEqual(list(courses.context['cl'].queryset), [self.course])
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.course = Course.objects.get(title='Python')
+        stamp = timezone.now()
+        lessons = Lesson.objects.bulk_create([Lesson(course=self.course, title=f'Page {n}') for n in range(7)])
+        # Shared timestamps force the cursor to break ties on the primary key.
+        for index, lesson in enumerate(lessons):
+            Lesson.objects.filter(pk=lesson.pk).update(created_at=stamp - timedelta(minutes=index // 3))
+        self.queryset = Lesson.objects.filter(course=self.course).order_by('-created_at')
+        self.expected = list(self.queryset.order_by('-created_at', '-pk').values_list('pk', flat=True))
+
+    def test_walks_forward_and_back_over_ties(self):
+        paginator = KeysetPaginator(self.queryset, 3)
+        seen = []
+        pages = []
+        page = paginator.page()
+        while True:
+            pages.append(page)
+            seen += [lesson.pk for lesson in page]
+            if not page.has_next:
+                break
+            with CaptureQueriesContext(connection) as queries:
+                page = paginator.page(page.next_cursor)
+            self.assertEqual(len(queries), 1)
+            self.assertNotIn('OFFSET', queries[0]['sql'])
+        self.assertEqual(seen, self.expected)
+        self.assertFalse(pages[0].has_previous)
+
+        back = paginator.page(pages[-1].previous_cursor)
+        self.assertEqual([lesson.pk for lesson in back], [lesson.pk for lesson in pages[-2]])
+        self.assertEqual(paginator.page(pages[1].previous_cursor).object_list, pages[0].object_list)
+        self.assertFalse(paginator.page(pages[1].previous_cursor).has_previous)
+
+    def test_rejects_malformed_cursors_and_unsupported_orderings(self):
+        paginator = KeysetPaginator(self.queryset, 3)
+        for cursor in ('not base64!', encode_cursor(['x']), encode_cursor(['not a date', 1])):
+            with self.subTest(cursor=cursor), self.assertRaises(InvalidCursor):
+                paginator.page(cursor)
+        with self.assertRaises(ValueError):
+            KeysetPaginator(Lesson.objects.order_by('course'), 3)
+
+    def test_admin_changelist_pages_by_cursor(self):
+        self.client.force_login(User.objects.create_superuser('keyset_admin', password='x'))
+        url = reverse('admin:custom_admin_lesson_changelist')
+        with mock.patch('admin.admin.LessonAdmin.list_per_page', 4):
+            params = {'course__category__id__exact': self.course.category_id}
+            page = self.client.get(url, params).context['cl'].keyset_page
+            self.assertEqual([lesson.pk for lesson in page], self.expected[:4])
+            second = self.client.get(url, {**params, 'cursor': page.next_cursor})
+            self.assertEqual([lesson.pk for lesson in second.context['cl'].result_list], self.expected[4:])
+            self.assertContains(second, 'Previous')
+            self.assertEqual(self.client.get(url, {'cursor': 'garbage'}).status_code, 302)
+
+            by_course = self.client.get(url, {'o': '2'})
+            self.assertIsNone(by_course.context['cl'].keyset_page)
+
+    def test_student_courses_are_paged(self):
+        self.client.force_login(User.objects.get(username='student1'))
+        active = Course.objects.filter(is_active=True).count()
+        with mock.patch('admin.views.COURSES_PER_PAGE', active - 1):
+            response = self.client.get(reverse('student_courses'))
+            self.assertEqual(len(response.context['page']), active - 1)
+            last = self.client.get(reverse('student_courses'), {'cursor': response.context['page'].next_cursor})
+        self.assertEqual(len(last.context['page']), 1)
+        self.assertFalse(last.context['page'].has_next)
+
+
+class RowCountTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.course = Course.objects.get(title='Python')
+        self.student = User.objects.get(username='student1')
+
+    def assertCountsExact(self):
+        self.assertEqual(row_counts(), {model: model.objects.count() for model in COUNTED_MODELS})
+
+    def test_writes_keep_stored_counts_exact(self):
+        self.assertCountsExact()
+        lesson = Lesson.objects.create(course=self.course, title='Counted')
+        mark_attendance(self.student, self.course)
+        self.assertCountsExact()
+        lesson.delete()
+        self.course.delete()
+        self.assertCountsExact()
+        import_csv('lessons', StringIO('category,course,title\nSoftware Development,HTML,Forms\n'))
+        self.assertCountsExact()
+
+    def test_refresh_command_reports_and_fixes_drift(self):
+        Lesson.objects.bulk_create([Lesson(course=self.course, title='Untracked')])
+        with self.assertRaises(CommandError):
+            call_command('refresh_row_counts', verify=True, stdout=StringIO())
+        out = StringIO()
+        call_command('refresh_row_counts', stdout=out)
+        self.assertIn('custom_admin_lesson', out.getvalue())
+        self.assertCountsExact()
+
+    def test_dashboard_and_admin_read_stored_totals(self):
+        mark_attendance(self.student, self.course)
+        self.client.force_login(User.objects.get(username='faculty1'))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('faculty_dashboard'))
+        self.assertEqual(response.context['lesson_count'], Lesson.objects.count())
+        self.assertFalse([query for query in queries if 'COUNT(' in query['sql']])
+
+        self.client.force_login(User.objects.create_superuser('count_admin', password='x'))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('admin:custom_admin_attendancerecord_changelist'))
+        self.assertEqual((response.context['cl'].result_count, response.context['cl'].full_result_count), (1, 1))
+        self.assertFalse([query for query in queries if 'COUNT(' in query['sql']])
+        filtered = self.client.get(reverse('admin:custom_admin_attendancerecord_changelist'), {'source__exact': 'x'})
+        self.assertEqual(filtered.context['cl'].result_count, 0)
+
+
+class AsyncViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.student = User.objects.get(username='student1')
+        self.faculty = User.objects.get(username='faculty1')
+        self.course = Course.objects.get(title='Python')
+
+    def test_dashboard_views_are_native_coroutines(self):
+        for view in (views.student_courses, views.student_attendance, views.faculty_courses, views.faculty_dashboard):
+            self.assertTrue(asyncio.iscoroutinefunction(view), view.__name__)
+
+        async def get_response(request):
+            return None
+        self.assertTrue(asyncio.iscoroutinefunction(PrimaryPinningMiddleware(get_response)))
+
+    async def test_student_views(self):
+        await self.async_client.aforce_login(self.student)
+        session = await self.async_client.asession()
+        await session.aset('student_notice', 'Welcome back.')
+        await session.asave()
+        await sync_to_async(mark_attendance)(self.student, self.course)
+
+        response = await self.async_client.get(reverse('student_courses'))
+        self.assertContains(response, 'Welcome back.')
+        self.assertIn(self.course.pk, response.context['enrolled_ids'])
+        response = await self.async_client.get(reverse('student_courses'))
+        self.assertNotContains(response, 'Welcome back.')
+
+        response = await self.async_client.get(reverse('student_attendance'))
+        self.assertEqual([(row['course'], row['present_days']) for row in response.context['rows']], [('Python', 1)])
+
+        response = await self.async_client.get(reverse('faculty_dashboard'))
+        self.assertRedirects(response, reverse('student_dashboard'), fetch_redirect_response=False)
+
+    async def test_faculty_views(self):
+        response = await self.async_client.get(reverse('faculty_courses'))
+        self.assertRedirects(response, reverse('login'), fetch_redirect_response=False)
+
+        await self.async_client.aforce_login(self.faculty)
+        response = await self.async_client.get(reverse('faculty_dashboard'))
+        self.assertEqual(response.context['course_count'], await Course.objects.acount())
+        response = await self.async_client.get(reverse('faculty_courses'), {'q': 'python'})
+        self.assertIn(self.course, [result.object for result in response.context['search_results']])
+        self.assertIn(self.course, response.context['page'].object_list)
+
+
+class StudentDashboardApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.student = User.objects.get(username='student1')
+        self.course = Course.objects.get(title='Python')
+        self.url = reverse('student_dashboard_api')
+        self.client.force_login(self.student)
+
+    def _get(self, data=None, **headers):
+        return self.client.get(self.url, data or {}, **headers)
+
+    def test_compact_payload(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_attendance(self.student, self.course)
+        response = self._get()
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+        data = response.json()
+        self.assertEqual(data['enrolled'], [self.course.pk])
+        self.assertEqual(data['attendance']['rows'], [[self.course.pk, 1, date.today().isoformat()]])
+        catalog = data['catalog']
+        self.assertEqual(catalog['fields'], ['id', 'category_id', 'title', 'level', 'duration_hours', 'is_active'])
+        self.assertIn([self.course.pk, self.course.category_id, 'Python', 'beginner', 0, True], catalog['courses'])
+        self.assertEqual(catalog['active'], sorted(Course.objects.filter(is_active=True).values_list('pk', flat=True)))
+        self.assertTrue(catalog['until'].endswith('Z'))
+
+    def test_etag_tracks_the_students_writes_and_the_catalog(self):
+        etag = self._get()['ETag']
+        with self.assertNumQueries(3):
+            self.assertEqual(self._get(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        # The tokens live in the database, not in a per-process cache.
+        cache.clear()
+        self.assertEqual(self._get(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            enroll_student(User.objects.get(username='faculty1'), self.course)
+        self.assertEqual(self._get(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_attendance(self.student, self.course)
+        response = self._get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.save(update_fields=['description'])
+        self.assertEqual(self._get(HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_catalog_deltas(self):
+        other = Course.objects.exclude(pk=self.course.pk).first()
+        with self.captureOnCommitCallbacks(execute=True):
+            other.save(update_fields=['updated_at'])
+        until = self._get().json()['catalog']['until']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.is_active = False
+            self.course.save(update_fields=['is_active', 'updated_at'])
+        catalog = self._get({'since': until}).json()['catalog']
+        # Rows stamped exactly at ``since`` are sent again rather than risk missing one.
+        self.assertEqual([row[0] for row in catalog['courses']], sorted([self.course.pk, other.pk]))
+        self.assertIn([self.course.pk, self.course.category_id, 'Python', 'beginner', 0, False], catalog['courses'])
+        self.assertNotIn(self.course.pk, catalog['active'])
+        self.assertEqual(catalog['since'], until)
+
+    def test_saving_some_fields_still_reaches_the_delta(self):
+        Course.objects.exclude(pk=self.course.pk).first().save()
+        until = self._get().json()['catalog']['until']
+        self.course.description = 'Now with type hints.'
+        self.course.duration_hours = 12
+        self.course.save(update_fields=['duration_hours'])
+        catalog = self._get({'since': until}).json()['catalog']
+        self.assertIn([self.course.pk, self.course.category_id, 'Python', 'beginner', 12, True], catalog['courses'])
+
+    def test_rejects_other_roles_and_bad_since(self):
+        self.assertEqual(self._get({'since': 'yesterday'}).status_code, 400)
+        self.client.force_login(User.objects.get(username='faculty1'))
+        self.assertEqual(self._get().status_code, 403)
+        self.client.logout()
+        self.assertEqual(self._get().status_code, 403)
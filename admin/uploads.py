@@ -0,0 +1,200 @@
+import base64
+import binascii
+import hashlib
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Lesson, LessonUpload
+
+_COPY_BUFFER = 64 * 1024
+
+
+def upload_chunk_size():
+    return getattr(settings, 'LESSON_UPLOAD_CHUNK_SIZE', 8 * 1024 * 1024)
+
+
+def _max_size():
+    return getattr(settings, 'LESSON_UPLOAD_MAX_SIZE', 4 * 1024 * 1024 * 1024)
+
+
+class UploadError(Exception):
+    """A chunk or completion request that cannot be applied to the upload."""
+
+
+class UploadOffsetMismatch(UploadError):
+    def __init__(self, offset):
+        super().__init__(f'Expected a chunk at offset {offset}.')
+        self.offset = offset
+
+
+class UploadChecksumMismatch(UploadOffsetMismatch):
+    def __init__(self, offset):
+        UploadError.__init__(self, f'Chunk checksum mismatch; resend from offset {offset}.')
+        self.offset = offset
+
+
+class UploadGone(UploadError):
+    def __init__(self):
+        super().__init__('The partial file is missing; start a new upload.')
+
+
+def upload_temp_path(upload):
+    temp_dir = getattr(settings, 'LESSON_UPLOAD_TEMP_DIR', 'uploads/partial')
+    return Path(settings.MEDIA_ROOT) / temp_dir / f'{upload.pk}.part'
+
+
+def _open_temp_file(upload):
+    try:
+        return open(upload_temp_path(upload), 'r+b')
+    except FileNotFoundError:
+        raise UploadGone from None
+
+
+def start_upload(lesson, filename, size, sha256, user):
+    """Open an upload; without a whole-file ``sha256`` every chunk must carry its own checksum."""
+    filename = os.path.basename(filename.replace('\\', '/')).strip()
+    sha256 = sha256.strip().lower()
+    if not filename:
+        raise UploadError('A file name is required.')
+    max_size = _max_size()
+    if not 0 < size <= max_size:
+        raise UploadError(f'File size must be between 1 and {max_size} bytes.')
+    if sha256 and (len(sha256) != 64 or any(char not in '0123456789abcdef' for char in sha256)):
+        raise UploadError('sha256 must be a 64 character hex digest.')
+
+    upload = LessonUpload.objects.create(lesson=lesson, filename=filename, size=size, sha256=sha256, created_by=user)
+    path = upload_temp_path(upload)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+    return upload
+
+
+def parse_chunk_checksum(upload, header):
+    """Return the raw digest from an ``Upload-Checksum: sha256 <base64>`` header, or None.
+
+    The header is required for uploads started without a whole-file digest.
+    """
+    if not header:
+        if not upload.sha256:
+            raise UploadError('Upload-Checksum is required for uploads started without a sha256.')
+        return None
+    algorithm, _, encoded = header.strip().partition(' ')
+    try:
+        digest = base64.b64decode(encoded.strip(), validate=True)
+    except binascii.Error:
+        digest = b''
+    if algorithm.lower() != 'sha256' or len(digest) != hashlib.sha256().digest_size:
+        raise UploadError('Upload-Checksum must be "sha256 <base64 digest>".')
+    return digest
+
+
+def write_chunk(upload, offset, stream, length, checksum=None):
+    """Copy ``length`` bytes from ``stream`` into the temp file at ``offset``.
+
+    The body is copied in small buffers, so memory use does not depend
+    on the chunk size. The stored offset only moves past bytes that
+    actually arrived, which is what lets a client resume after a dropped
+    connection. With a ``checksum`` the chunk is hashed as it is copied and
+    only accepted whole and matching. Returns the new offset.
+    """
+    if upload.completed_at or offset != upload.offset:
+        raise UploadOffsetMismatch(upload.offset)
+    chunk_size = upload_chunk_size()
+    if length > chunk_size or offset + length > upload.size:
+        raise UploadError(f'Chunks may be at most {chunk_size} bytes and must not pass the file size.')
+
+    written = 0
+    digest = hashlib.sha256()
+    with _open_temp_file(upload) as handle:
+        handle.seek(offset)
+        while written < length:
+            data = stream.read(min(_COPY_BUFFER, length - written))
+            if not data:
+                break
+            handle.write(data)
+            digest.update(data)
+            written += len(data)
+    if checksum is not None and (written != length or digest.digest() != checksum):
+        raise UploadChecksumMismatch(upload.offset)
+
+    if not LessonUpload.objects.filter(pk=upload.pk, offset=offset, completed_at__isnull=True).update(
+        offset=offset + written, updated_at=timezone.now()
+    ):
+        upload.refresh_from_db(fields=['offset'])
+        raise UploadOffsetMismatch(upload.offset)
+    upload.offset = offset + written
+    return upload.offset
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        while data := handle.read(1024 * 1024):
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def complete_upload(upload):
+    """Attach the assembled file to the lesson, replacing (and later deleting) any previous file.
+
+    Uploads whose chunks were checksummed are complete once every byte has
+    arrived. An upload started with a whole-file sha256 is re-read and
+    checked here instead; on a mismatch the partial file is discarded and
+    the upload restarts from offset 0. The lesson only ever points at a
+    complete, verified file.
+
+    The file is copied into storage and the temp file is only removed once
+    the transaction commits, so after a rollback the upload can still be
+    completed again.
+    """
+    if upload.completed_at:
+        raise UploadError('This upload has already been completed.')
+    if upload.offset != upload.size:
+        raise UploadOffsetMismatch(upload.offset)
+    path = upload_temp_path(upload)
+    with _open_temp_file(upload) as handle:
+        handle.truncate(upload.size)
+    if upload.sha256 and _file_sha256(path) != upload.sha256:
+        with _open_temp_file(upload) as handle:
+            handle.truncate(0)
+        LessonUpload.objects.filter(pk=upload.pk).update(offset=0, updated_at=timezone.now())
+        upload.offset = 0
+        raise UploadError('Checksum mismatch; the upload has been reset.')
+
+    with transaction.atomic():
+        if not LessonUpload.objects.filter(pk=upload.pk, completed_at__isnull=True).update(completed_at=timezone.now()):
+            raise UploadError('This upload has already been completed.')
+        lesson = Lesson.objects.select_for_update().get(pk=upload.lesson_id)
+        previous = lesson.lesson_file.name
+        with _open_temp_file(upload) as handle:
+            lesson.lesson_file.save(upload.filename, File(handle), save=False)
+        storage = lesson.lesson_file.storage
+        try:
+            lesson.save(update_fields=['lesson_file'])
+        except Exception:
+            storage.delete(lesson.lesson_file.name)
+            raise
+        transaction.on_commit(lambda: path.unlink(missing_ok=True))
+        if previous and previous != lesson.lesson_file.name:
+            transaction.on_commit(lambda: storage.delete(previous))
+    upload.refresh_from_db()
+    return lesson
+
+
+def discard_upload(upload):
+    upload.delete()
+
+
+def purge_stale_uploads(max_age):
+    """Delete uploads untouched for ``max_age``; unfinished ones take their temp files with them."""
+    stale = LessonUpload.objects.filter(updated_at__lt=timezone.now() - max_age)
+    count = 0
+    for upload in stale.iterator():
+        discard_upload(upload)
+        count += 1
+    return count
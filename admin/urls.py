@@ -15,14 +15,19 @@ urlpatterns = [
     path('login/', views.login_page, name='login'),
     path('forgetpass/', views.forget_password, name='forgetpass'),
     path('dashboard/admin/', views.admin_dashboard, name='admin_dashboard'),
+    path('dashboard/admin/export/<str:kind>.csv', views.export_data, name='export_data'),
     path('dashboard/faculty/', views.faculty_dashboard, name='faculty_dashboard'),
     path('dashboard/faculty/courses/', views.faculty_courses, name='faculty_courses'),
+    path('dashboard/faculty/analytics/', views.faculty_attendance_analytics, name='faculty_attendance_analytics'),
     path('dashboard/faculty/courses/web-development/', views.faculty_web_course, name='faculty_web_course'),
     path('dashboard/faculty/courses/python/', views.faculty_python_course, name='faculty_python_course'),
     path('dashboard/faculty/courses/data-analysis/', views.faculty_data_course, name='faculty_data_course'),
     path('dashboard/faculty/course-modules/', views.faculty_course_modules, name='faculty_course_modules'),
     path('dashboard/faculty/course-creation/', views.faculty_course_creation, name='faculty_course_creation'),
     path('dashboard/faculty/lesson-upload/', views.faculty_lesson_upload, name='faculty_lesson_upload'),
+    path('dashboard/faculty/bulk-import/', views.faculty_bulk_import, name='faculty_bulk_import'),
+    path('dashboard/faculty/uploads/', views.lesson_uploads, name='lesson_uploads'),
+    path('dashboard/faculty/uploads/<uuid:upload_id>/', views.lesson_upload_chunk, name='lesson_upload_chunk'),
     path('dashboard/student/', views.student_dashboard, name='student_dashboard'),
     path('dashboard/student/courses/', views.student_courses, name='student_courses'),
     path('dashboard/student/courses/<int:course_id>/enroll/', views.student_enroll_course, name='student_enroll_course'),
@@ -34,4 +39,7 @@ urlpatterns = [
     path('dashboard/student/quiz/', views.student_quiz, name='student_quiz'),
     path('dashboard/student/progress/', views.student_progress, name='student_progress'),
     path('dashboard/student/attendance/', views.student_attendance, name='student_attendance'),
+    path('api/student/dashboard/', views.student_dashboard_api, name='student_dashboard_api'),
+    path('dashboard/search/', views.search_catalog, name='search_catalog'),
+    path('lessons/<int:lesson_id>/download/', views.lesson_download, name='lesson_download'),
 ]
@@ -0,0 +1,75 @@
+import uuid
+
+from django.db import router
+
+from .models import DashboardVersion
+
+# Opaque change tokens behind the student dashboard API's ETags. They live in
+# the database, so every worker sees a bump as soon as the write that caused
+# it commits, and a rolled-back write leaves the old token in place. A
+# missing row reads as '0', so nothing needs seeding.
+STUDENTS_KEY = 'students'
+CATALOG_KEY = 'catalog'
+# Per-course tokens behind the attendance analytics cache; COURSES_KEY moves
+# them all at once after a rebuild that was not limited to some courses.
+COURSES_KEY = 'courses'
+
+
+def _token():
+    return uuid.uuid4().hex[:16]
+
+
+def _student_key(student_id):
+    return f'student:{student_id}'
+
+
+def _course_key(course_id):
+    return f'course:{course_id}'
+
+
+async def adashboard_version(student_id):
+    """Return a token that changes whenever the student's dashboard data or the catalog does."""
+    keys = [STUDENTS_KEY, _student_key(student_id), CATALOG_KEY]
+    tokens = {key: token async for key, token in DashboardVersion.objects.filter(key__in=keys).values_list('key', 'token')}
+    return '.'.join(tokens.get(key, '0') for key in keys)
+
+
+def _bump(keys, batch_size=500):
+    DashboardVersion.objects.using(router.db_for_write(DashboardVersion)).bulk_create(
+        [DashboardVersion(key=key, token=_token()) for key in keys],
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=['key'],
+        update_fields=['token'],
+    )
+
+
+def bump_student_versions(student_ids=None):
+    """Start new versions for ``student_ids``, or for every student when omitted, as part of the current write."""
+    if student_ids is None:
+        _bump([STUDENTS_KEY])
+        return
+    keys = sorted({_student_key(student_id) for student_id in student_ids})
+    if keys:
+        _bump(keys)
+
+
+def bump_catalog_version():
+    _bump([CATALOG_KEY])
+
+
+def course_version(course_id):
+    """Return a token that changes whenever the course's attendance or enrollments do."""
+    keys = [COURSES_KEY, _course_key(course_id)]
+    tokens = dict(DashboardVersion.objects.filter(key__in=keys).values_list('key', 'token'))
+    return '.'.join(tokens.get(key, '0') for key in keys)
+
+
+def bump_course_versions(course_ids=None):
+    """Start new versions for ``course_ids``, or for every course when omitted, as part of the current write."""
+    if course_ids is None:
+        _bump([COURSES_KEY])
+        return
+    keys = sorted({_course_key(course_id) for course_id in course_ids})
+    if keys:
+        _bump(keys)
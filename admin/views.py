@@ -1,43 +1,138 @@
-from datetime import date
+import asyncio
+import zlib
+from datetime import UTC, date, timedelta
+from io import TextIOWrapper
 
+from asgiref.sync import sync_to_async
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth import authenticate, login
-from django.db.models import Count, Max, Prefetch
+from django.db import transaction
+from django.db.models import Sum
+from django.http import Http404, HttpResponseBadRequest, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
-
-from .models import AttendanceRecord, Course, CourseCategory, CourseEnrollment, Lesson
-
-
-def _student_guard(request):
-    if not request.user.is_authenticated:
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.http import quote_etag
+from django.views.decorators.http import require_GET, require_http_methods
+
+from .analytics import course_attendance_analytics, default_range
+from .attendance import enroll_student, mark_attendance
+from .downloads import serve_file
+from .exports import EXPORTS, export_queryset, stream_csv
+from .importer import IMPORT_COLUMNS, import_csv
+from .models import (
+    AttendanceDailyRollup,
+    Course,
+    CourseCategory,
+    CourseEnrollment,
+    Lesson,
+    LessonUpload,
+    StudentCourseAttendance,
+    prefetch_latest_lessons,
+)
+from .page_cache import cached_public_page
+from .pagination import CURSOR_VAR, InvalidCursor, KeysetPaginator
+from .roles import FACULTY, STUDENT, aget_user_roles, get_user_roles
+from .rowcounts import arow_counts
+from .search import search
+from .uploads import (
+    UploadError,
+    UploadGone,
+    UploadOffsetMismatch,
+    complete_upload,
+    discard_upload,
+    parse_chunk_checksum,
+    start_upload,
+    upload_chunk_size,
+    write_chunk,
+)
+from .versions import adashboard_version
+
+STUDENT_COURSE_LESSON_PREVIEW = 3
+COURSES_PER_PAGE = 24
+RECENT_LESSONS_PER_PAGE = 10
+FACULTY_ATTENDANCE_DAYS = 7
+ANALYTICS_MAX_DAYS = 366
+IMPORT_ERRORS_SHOWN = 200
+SEARCH_QUERY_MAX_LENGTH = 200
+
+# Row layouts for student_dashboard_api. Rows are sent as plain arrays and
+# the layouts once per payload, which keeps large catalogs compact.
+DASHBOARD_ATTENDANCE_FIELDS = ('course_id', 'present_days', 'last_attended')
+DASHBOARD_COURSE_FIELDS = ('id', 'category_id', 'title', 'level', 'duration_hours', 'is_active')
+
+
+_ROLE_HOMES = {STUDENT: 'student_dashboard', FACULTY: 'faculty_dashboard'}
+
+
+def _role_redirect(user, roles, role):
+    """Where to send ``user`` instead of a ``role`` page, or None when they may open it."""
+    if not user.is_authenticated:
         return redirect('login')
-    if request.user.groups.filter(name='Student').exists():
+    if role in roles:
         return None
-    if request.user.is_staff or request.user.is_superuser:
+    if user.is_staff or user.is_superuser:
         return redirect('/admin/')
-    if request.user.groups.filter(name='Faculty').exists():
-        return redirect('faculty_dashboard')
+    for other, home in _ROLE_HOMES.items():
+        if other in roles:
+            return redirect(home)
     return redirect('login')
 
 
+def _student_guard(request):
+    return _role_redirect(request.user, get_user_roles(request.user), STUDENT)
+
+
 def _faculty_guard(request):
-    if not request.user.is_authenticated:
-        return redirect('login')
-    if request.user.groups.filter(name='Faculty').exists():
-        return None
-    if request.user.is_staff or request.user.is_superuser:
-        return redirect('/admin/')
-    if request.user.groups.filter(name='Student').exists():
-        return redirect('student_dashboard')
-    return redirect('login')
+    return _role_redirect(request.user, get_user_roles(request.user), FACULTY)
+
+
+async def _astudent_guard(request):
+    user = await request.auser()
+    return _role_redirect(user, await aget_user_roles(user), STUDENT)
+
+
+async def _afaculty_guard(request):
+    user = await request.auser()
+    return _role_redirect(user, await aget_user_roles(user), FACULTY)
+
+
+def _search_query(request):
+    return request.GET.get('q', '').strip()[:SEARCH_QUERY_MAX_LENGTH]
+
+
+def _keyset_page(request, queryset, per_page):
+    paginator = KeysetPaginator(queryset, per_page)
+    try:
+        return paginator.page(request.GET.get(CURSOR_VAR))
+    except InvalidCursor:
+        return paginator.page()
+
+
+async def _akeyset_page(request, queryset, per_page):
+    paginator = KeysetPaginator(queryset, per_page)
+    try:
+        return await paginator.apage(request.GET.get(CURSOR_VAR))
+    except InvalidCursor:
+        return await paginator.apage()
+
+
+async def _alist(queryset):
+    return [row async for row in queryset]
+
+
+async def _asearch(query, include_hidden=False):
+    return await sync_to_async(search)(query, include_hidden=include_hidden) if query else None
+
+
+async def _arender(request, template_name, context):
+    # Templates and context processors may still touch the ORM lazily.
+    return await sync_to_async(render)(request, template_name, context)
 
 
 def _mark_attendance(student, course, source='enter'):
-    AttendanceRecord.objects.get_or_create(
-        student=student,
-        course=course,
-        attendance_date=date.today(),
-        defaults={'source': source},
-    )
+    return mark_attendance(student, course, source=source)
 
 
 def _resolve_category(existing_category_id, new_category_name):
@@ -53,34 +148,42 @@ def _resolve_category(existing_category_id, new_category_name):
     return None
 
 
+@cached_public_page
 def home(request):
     return render(request, 'Home Page/front.html')
 
 
+@cached_public_page
 def about(request):
     return render(request, 'Home Page/about.html')
 
 
+@cached_public_page
 def course(request):
     return render(request, 'Home Page/course.html')
 
 
+@cached_public_page
 def contact(request):
     return render(request, 'Home Page/contact.html')
 
 
+@cached_public_page
 def testimonials(request):
     return render(request, 'Home Page/test.html')
 
 
+@cached_public_page
 def bastion(request):
     return render(request, 'Home Page/bastion.html')
 
 
+@cached_public_page
 def privacy(request):
     return render(request, 'Home Page/privacy.html')
 
 
+@cached_public_page
 def terms(request):
     return render(request, 'Home Page/terms.html')
 
@@ -111,8 +214,9 @@ def login_page(request):
                 {'error': 'Invalid username or password.', 'selected_role': selected_role},
             )
 
-        is_faculty = user.groups.filter(name='Faculty').exists()
-        is_student = user.groups.filter(name='Student').exists()
+        roles = get_user_roles(user)
+        is_faculty = FACULTY in roles
+        is_student = STUDENT in roles
 
         if selected_role == 'faculty' and not is_faculty:
             return render(
@@ -154,31 +258,92 @@ def admin_dashboard(request):
     return render(request, 'login/admin.html')
 
 
-def faculty_dashboard(request):
-    guard = _faculty_guard(request)
+@staff_member_required
+def export_data(request, kind):
+    if kind not in EXPORTS:
+        raise Http404
+    try:
+        course_ids = [int(value) for value in request.GET.getlist('course')]
+        category_ids = [int(value) for value in request.GET.getlist('category')]
+        start = date.fromisoformat(request.GET['start']) if request.GET.get('start') else None
+        end = date.fromisoformat(request.GET['end']) if request.GET.get('end') else None
+    except ValueError:
+        return HttpResponseBadRequest('Invalid course, category or date filter.')
+    queryset = export_queryset(kind, course_ids=course_ids, category_ids=category_ids, start=start, end=end)
+    return stream_csv(kind, queryset)
+
+
+async def faculty_dashboard(request):
+    guard = await _afaculty_guard(request)
     if guard:
         return guard
+    since = date.today() - timedelta(days=FACULTY_ATTENDANCE_DAYS - 1)
+    counts, recent_attendance = await asyncio.gather(
+        arow_counts([CourseCategory, Course, Lesson, CourseEnrollment]),
+        _alist(
+            AttendanceDailyRollup.objects.filter(attendance_date__gte=since)
+            .values('attendance_date')
+            .annotate(present=Sum('present_count'))
+            .order_by('-attendance_date')
+        ),
+    )
     context = {
-        'category_count': CourseCategory.objects.count(),
-        'course_count': Course.objects.count(),
-        'lesson_count': Lesson.objects.count(),
-        'enrollment_count': CourseEnrollment.objects.count(),
+        'category_count': counts[CourseCategory],
+        'course_count': counts[Course],
+        'lesson_count': counts[Lesson],
+        'enrollment_count': counts[CourseEnrollment],
+        'recent_attendance': recent_attendance,
     }
-    return render(request, 'FacultyDashboard/courses-dashboard.html', context)
+    return await _arender(request, 'FacultyDashboard/courses-dashboard.html', context)
 
 
-def faculty_courses(request):
+async def faculty_courses(request):
+    guard = await _afaculty_guard(request)
+    if guard:
+        return guard
+
+    query = _search_query(request)
+    courses_qs = Course.objects.filter(is_active=True).select_related('category').order_by('category__name', 'title')
+    page, search_results = await asyncio.gather(
+        _akeyset_page(request, courses_qs, COURSES_PER_PAGE),
+        _asearch(query, include_hidden=True),
+    )
+    context = {'page': page, 'query': query, 'search_results': search_results}
+    return await _arender(request, 'FacultyDashboard/courses-available.html', context)
+
+
+def faculty_attendance_analytics(request):
     guard = _faculty_guard(request)
     if guard:
         return guard
 
-    courses_qs = Course.objects.filter(is_active=True).annotate(
-        enrollment_count=Count('enrollments', distinct=True),
-        attendance_count=Count('attendance_records', distinct=True),
-        lesson_count=Count('lessons', distinct=True),
-    ).order_by('title')
-    categories = CourseCategory.objects.prefetch_related(Prefetch('courses', queryset=courses_qs))
-    return render(request, 'FacultyDashboard/courses-available.html', {'categories': categories})
+    courses = list(Course.objects.filter(is_active=True).select_related('category').order_by('category__name', 'title'))
+    start, end = default_range()
+    error = ''
+    try:
+        if request.GET.get('start'):
+            start = date.fromisoformat(request.GET['start'])
+        if request.GET.get('end'):
+            end = date.fromisoformat(request.GET['end'])
+    except ValueError:
+        error = 'Dates must be in YYYY-MM-DD format.'
+    if not error and start > end:
+        error = 'Start date must not be after the end date.'
+    elif not error and (end - start).days >= ANALYTICS_MAX_DAYS:
+        error = f'Choose a range of at most {ANALYTICS_MAX_DAYS} days.'
+
+    course_id = request.GET.get('course')
+    course = next((c for c in courses if str(c.id) == course_id), courses[0] if courses else None)
+    analytics = course_attendance_analytics(course, start, end) if course and not error else None
+    context = {
+        'courses': courses,
+        'selected_course': course,
+        'start': start,
+        'end': end,
+        'error': error,
+        'analytics': analytics,
+    }
+    return render(request, 'FacultyDashboard/attendance-analytics.html', context)
 
 
 def faculty_web_course(request):
@@ -286,7 +451,9 @@ def faculty_lesson_upload(request):
             message = f'Lesson "{lesson_title}" added under "{course.category.name} > {course.title}".'
 
     courses = Course.objects.filter(is_active=True).select_related('category').order_by('category__name', 'title')
-    recent_lessons = Lesson.objects.select_related('course__category').order_by('-created_at')[:10]
+    recent_lessons = _keyset_page(
+        request, Lesson.objects.select_related('course__category').order_by('-created_at'), RECENT_LESSONS_PER_PAGE
+    )
     return render(
         request,
         'FacultyDashboard/lesson-upload.html',
@@ -294,6 +461,114 @@ def faculty_lesson_upload(request):
     )
 
 
+def _upload_state(upload):
+    return {
+        'id': str(upload.pk),
+        'lesson': upload.lesson_id,
+        'filename': upload.filename,
+        'size': upload.size,
+        'offset': upload.offset,
+        'chunk_size': upload_chunk_size(),
+        'completed': upload.completed_at is not None,
+    }
+
+
+@require_http_methods(['GET', 'POST'])
+def lesson_uploads(request):
+    guard = _faculty_guard(request)
+    if guard:
+        return guard
+
+    if request.method == 'GET':
+        pending = LessonUpload.objects.filter(created_by=request.user, completed_at__isnull=True)
+        return JsonResponse({'uploads': [_upload_state(upload) for upload in pending]})
+
+    lesson = Lesson.objects.filter(pk=request.POST.get('lesson_id') or None).first()
+    size = request.POST.get('size', '')
+    if not lesson:
+        return JsonResponse({'error': 'Select a valid lesson.'}, status=400)
+    if not size.isdigit():
+        return JsonResponse({'error': 'File size is required.'}, status=400)
+    try:
+        upload = start_upload(
+            lesson, request.POST.get('filename', ''), int(size), request.POST.get('sha256', ''), request.user
+        )
+    except UploadError as exc:
+        return JsonResponse({'error': str(exc)}, status=400)
+    return JsonResponse(_upload_state(upload), status=201)
+
+
+@require_http_methods(['GET', 'PUT', 'POST', 'DELETE'])
+def lesson_upload_chunk(request, upload_id):
+    guard = _faculty_guard(request)
+    if guard:
+        return guard
+
+    upload = get_object_or_404(LessonUpload, pk=upload_id, created_by=request.user)
+    if request.method == 'DELETE':
+        discard_upload(upload)
+        return JsonResponse({'id': str(upload_id), 'deleted': True})
+    if request.method == 'PUT':
+        offset = request.headers.get('Upload-Offset', '')
+        length = request.META.get('CONTENT_LENGTH') or '0'
+        if not offset.isdigit() or not length.isdigit():
+            return JsonResponse({'error': 'Upload-Offset and Content-Length are required.'}, status=400)
+        try:
+            checksum = parse_chunk_checksum(upload, request.headers.get('Upload-Checksum'))
+        except UploadError as exc:
+            return JsonResponse({**_upload_state(upload), 'error': str(exc)}, status=400)
+        try:
+            write_chunk(upload, int(offset), request, int(length), checksum)
+        except UploadOffsetMismatch as exc:
+            return JsonResponse({**_upload_state(upload), 'error': str(exc)}, status=409)
+        except UploadGone as exc:
+            return JsonResponse({**_upload_state(upload), 'error': str(exc)}, status=410)
+        except UploadError as exc:
+            return JsonResponse({**_upload_state(upload), 'error': str(exc)}, status=413)
+    elif request.method == 'POST':
+        try:
+            complete_upload(upload)
+        except UploadGone as exc:
+            return JsonResponse({**_upload_state(upload), 'error': str(exc)}, status=410)
+        except UploadError as exc:
+            return JsonResponse({**_upload_state(upload), 'error': str(exc)}, status=409)
+    return JsonResponse(_upload_state(upload))
+
+
+def faculty_bulk_import(request):
+    guard = _faculty_guard(request)
+    if guard:
+        return guard
+
+    report = None
+    error = ''
+    if request.method == 'POST':
+        kind = request.POST.get('kind')
+        upload = request.FILES.get('csv_file')
+        if kind not in IMPORT_COLUMNS:
+            error = 'Select what to import.'
+        elif not upload:
+            error = 'Choose a CSV file to upload.'
+        else:
+            try:
+                report = import_csv(
+                    kind,
+                    TextIOWrapper(upload.file, encoding='utf-8-sig', newline=''),
+                    user=request.user,
+                    roles=(STUDENT,),
+                )
+            except (UnicodeDecodeError, ValueError) as exc:
+                error = str(exc)
+
+    context = {
+        'columns': IMPORT_COLUMNS,
+        'report': report,
+        'errors_shown': report.errors[:IMPORT_ERRORS_SHOWN] if report else [],
+        'error': error,
+    }
+    return render(request, 'FacultyDashboard/bulk-import.html', context)
+
+
 def student_dashboard(request):
     guard = _student_guard(request)
     if guard:
@@ -301,28 +576,30 @@ def student_dashboard(request):
     return render(request, 'StudentDashBord/student.html')
 
 
-def student_courses(request):
-    guard = _student_guard(request)
+async def student_courses(request):
+    guard = await _astudent_guard(request)
     if guard:
         return guard
 
-    notice = request.session.pop('student_notice', '')
-    courses_qs = Course.objects.filter(is_active=True).annotate(
-        enrollment_count=Count('enrollments', distinct=True),
-        lesson_count=Count('lessons', distinct=True),
-    ).prefetch_related(
-        Prefetch('lessons', queryset=Lesson.objects.filter(visibility='public').order_by('-created_at'))
-    ).order_by('title')
-    categories = CourseCategory.objects.prefetch_related(Prefetch('courses', queryset=courses_qs))
-    enrolled_ids = set(
-        CourseEnrollment.objects.filter(student=request.user).values_list('course_id', flat=True)
+    user = await request.auser()
+    notice = await request.session.apop('student_notice', '')
+    query = _search_query(request)
+    courses_qs = Course.objects.filter(is_active=True).select_related('category').prefetch_related(
+        prefetch_latest_lessons(STUDENT_COURSE_LESSON_PREVIEW)
+    ).order_by('category__name', 'title')
+    enrolled_ids, page, search_results = await asyncio.gather(
+        _alist(CourseEnrollment.objects.filter(student=user).values_list('course_id', flat=True)),
+        _akeyset_page(request, courses_qs, COURSES_PER_PAGE),
+        _asearch(query),
     )
     context = {
-        'categories': categories,
-        'enrolled_ids': enrolled_ids,
+        'page': page,
+        'enrolled_ids': set(enrolled_ids),
         'notice': notice,
+        'query': query,
+        'search_results': search_results,
     }
-    return render(request, 'StudentDashBord/courses.html', context)
+    return await _arender(request, 'StudentDashBord/courses.html', context)
 
 
 def student_enroll_course(request, course_id):
@@ -332,9 +609,12 @@ def student_enroll_course(request, course_id):
     if request.method != 'POST':
         return redirect('student_courses')
 
-    course = get_object_or_404(Course, id=course_id, is_active=True)
-    CourseEnrollment.objects.get_or_create(student=request.user, course=course)
-    _mark_attendance(request.user, course, source='enroll')
+    course = get_object_or_404(Course.objects.select_related('category'), id=course_id, is_active=True)
+    if not _mark_attendance(request.user, course, source='enroll'):
+        # A repeat mark is answered from the cache without enrolling, and the
+        # enrollment may have been removed since the mark was cached.
+        with transaction.atomic():
+            enroll_student(request.user, course)
     request.session['student_notice'] = f'Enrolled in "{course.title}" under "{course.category.name}".'
     return redirect('student_courses')
 
@@ -345,12 +625,56 @@ def student_enter_course(request, course_id):
         return guard
 
     course = get_object_or_404(Course, id=course_id, is_active=True)
-    CourseEnrollment.objects.get_or_create(student=request.user, course=course)
     _mark_attendance(request.user, course, source='enter')
     request.session['student_notice'] = f'Attendance marked for "{course.title}" on {date.today()}.'
     return redirect('student_courses')
 
 
+def search_catalog(request):
+    """JSON search over courses and lessons; faculty and staff also see hidden ones."""
+    if not request.user.is_authenticated:
+        return redirect('login')
+    roles = get_user_roles(request.user)
+    include_hidden = FACULTY in roles or request.user.is_staff
+    if not (include_hidden or STUDENT in roles):
+        raise Http404
+    query = _search_query(request)
+    results = []
+    for result in search(query, include_hidden=include_hidden) if query else []:
+        course = result.object if result.kind == 'course' else result.object.course
+        results.append({
+            'kind': result.kind,
+            'id': result.object.pk,
+            'title': result.object.title,
+            'course_id': course.pk,
+            'course_title': course.title,
+            'category': course.category.name,
+        })
+    return JsonResponse({'query': query, 'results': results})
+
+
+def lesson_download(request, lesson_id):
+    if not request.user.is_authenticated:
+        return redirect('login')
+    lesson = get_object_or_404(Lesson.objects.select_related('course'), id=lesson_id)
+    roles = get_user_roles(request.user)
+    if not (FACULTY in roles or request.user.is_staff):
+        allowed = (
+            STUDENT in roles
+            and lesson.visibility == 'public'
+            and lesson.course.is_active
+            and CourseEnrollment.objects.filter(student=request.user, course_id=lesson.course_id).exists()
+        )
+        if not allowed:
+            raise Http404
+    if not lesson.lesson_file:
+        raise Http404
+    try:
+        return serve_file(request, lesson.lesson_file)
+    except FileNotFoundError:
+        raise Http404
+
+
 def student_python(request):
     guard = _student_guard(request)
     if guard:
@@ -393,15 +717,17 @@ def student_progress(request):
     return render(request, 'StudentDashBord/progress.html')
 
 
-def student_attendance(request):
-    guard = _student_guard(request)
+async def student_attendance(request):
+    guard = await _astudent_guard(request)
     if guard:
         return guard
 
-    enrollments = CourseEnrollment.objects.filter(student=request.user).select_related('course__category')
-    summary = AttendanceRecord.objects.filter(student=request.user).values('course_id').annotate(
-        present_days=Count('id'),
-        last_attended=Max('attendance_date'),
+    user = await request.auser()
+    enrollments, summary = await asyncio.gather(
+        _alist(CourseEnrollment.objects.filter(student=user).select_related('course__category')),
+        _alist(
+            StudentCourseAttendance.objects.filter(student=user).values('course_id', 'present_days', 'last_attended')
+        ),
     )
     summary_map = {row['course_id']: row for row in summary}
 
@@ -415,4 +741,71 @@ def student_attendance(request):
             'last_attended': data.get('last_attended'),
         })
 
-    return render(request, 'StudentDashBord/attendance.html', {'rows': rows})
+    return await _arender(request, 'StudentDashBord/attendance.html', {'rows': rows})
+
+
+def _utc_stamp(value):
+    # A Z suffix rather than +00:00, so the value survives an unencoded query string.
+    return value.astimezone(UTC).isoformat().replace('+00:00', 'Z') if value else None
+
+
+async def _student_dashboard_payload(user, since):
+    courses = Course.objects.order_by('pk')
+    courses = courses.filter(updated_at__gte=since) if since else courses.filter(is_active=True)
+    enrolled, attendance, changed, active, categories = await asyncio.gather(
+        _alist(CourseEnrollment.objects.filter(student=user).order_by('course_id').values_list('course_id', flat=True)),
+        _alist(
+            StudentCourseAttendance.objects.filter(student=user).order_by('course_id')
+            .values_list(*DASHBOARD_ATTENDANCE_FIELDS)
+        ),
+        _alist(courses.values_list(*DASHBOARD_COURSE_FIELDS, 'updated_at')),
+        _alist(Course.objects.filter(is_active=True).order_by('pk').values_list('pk', flat=True)),
+        _alist(CourseCategory.objects.order_by('pk').values_list('pk', 'name')),
+    )
+    until = max((row[-1] for row in changed), default=since)
+    return {
+        'enrolled': enrolled,
+        'attendance': {'fields': DASHBOARD_ATTENDANCE_FIELDS, 'rows': attendance},
+        'catalog': {
+            'since': _utc_stamp(since),
+            'until': _utc_stamp(until),
+            'fields': DASHBOARD_COURSE_FIELDS,
+            'courses': [row[:-1] for row in changed],
+            'active': active,
+            'categories': categories,
+        },
+    }
+
+
+@require_GET
+async def student_dashboard_api(request):
+    """Enrolled course ids, attendance summary and catalog for the student front end.
+
+    Pass the previous response's ``catalog.until`` as ``?since=`` to receive
+    only courses changed after it (``catalog.active`` still lists every live
+    course, so removals show up). Responses carry an ETag that changes with
+    the student's enrollments, attendance and the catalog, so polling with
+    If-None-Match mostly returns 304 without touching those tables.
+    """
+    user = await request.auser()
+    if STUDENT not in await aget_user_roles(user):
+        return JsonResponse({'detail': 'Student login required.'}, status=403)
+
+    since_param = request.GET.get('since', '')
+    try:
+        since = parse_datetime(since_param) if since_param else None
+    except ValueError:
+        since = None
+    if since_param and since is None:
+        return JsonResponse({'detail': 'since must be an ISO 8601 timestamp.'}, status=400)
+    if since and timezone.is_naive(since):
+        since = timezone.make_aware(since, UTC)
+
+    etag = quote_etag(f'{await adashboard_version(user.pk)}.{zlib.crc32(since_param.encode()):x}')
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        payload = await _student_dashboard_payload(user, since)
+        response = JsonResponse(payload, json_dumps_params={'separators': (',', ':')})
+    response.headers.setdefault('ETag', etag)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -46,6 +47,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'admin.middleware.PrimaryPinningMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -78,8 +80,33 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        'CONN_MAX_AGE': int(os.environ.get('DJANGO_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+        },
+    },
+    # Read-only connection to the same file; dashboard reads are routed here
+    # by admin.routers.PrimaryReplicaRouter.
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get('DJANGO_REPLICA_NAME', f'file:{BASE_DIR / "db.sqlite3"}?mode=ro'),
+        'CONN_MAX_AGE': int(os.environ.get('DJANGO_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    },
 }
+
+DATABASE_ROUTERS = ['admin.routers.PrimaryReplicaRouter']
+
+# Seconds a client keeps reading from the primary after it writes.
+REPLICA_PIN_SECONDS = 10
+
+# PRAGMAs applied to every new SQLite connection default to
+# admin.db.DEFAULT_SQLITE_PRAGMAS; set SQLITE_PRAGMAS to override them. Run
+# ``manage.py sqlite_status`` to see the values in effect.
 
 
 # Password validation
@@ -118,6 +145,20 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# Static build mode: run ``DJANGO_STATIC_BUILD=1 python manage.py collectstatic``
+# to write content-hashed, minified files with .gz/.br siblings to STATIC_ROOT,
+# and keep DJANGO_STATIC_BUILD=1 at runtime so {% static %} emits the hashed
+# names and the app serves them with far-future cache headers.
+STATIC_BUILD = os.environ.get('DJANGO_STATIC_BUILD') == '1'
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {
+        'BACKEND': 'admin.staticbuild.BuildStaticFilesStorage' if STATIC_BUILD
+        else 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
@@ -125,3 +166,68 @@ MEDIA_ROOT = BASE_DIR / 'media'
 # https://docs.djangoproject.com/en/6.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Cache alias used to share the site branding/images snapshot between
+# processes. Only point this at a backend every process shares (Redis,
+# Memcached, database); CACHES is not configured here, so 'default' is a
+# per-process LocMemCache. None keeps the snapshot in process memory only,
+# rebuilt every SITE_ASSETS_LOCAL_TIMEOUT seconds so other processes see
+# changes.
+SITE_ASSETS_CACHE = None
+SITE_ASSETS_LOCAL_TIMEOUT = 60
+
+# Seconds a user's roles stay cached. Role changes clear the cache, but only
+# in processes sharing it; with the default per-process cache other workers
+# keep a removed role for up to this long.
+ROLE_CACHE_TIMEOUT = 60
+
+# Serve the public marketing pages from a rendered-page cache keyed on the
+# site assets version, with ETag/Last-Modified validators.
+PUBLIC_PAGE_CACHE = True
+PUBLIC_PAGE_CACHE_TIMEOUT = 60 * 60
+
+# Identifies the deployed templates and code in public page ETags and cache
+# keys. Set it per release (e.g. the commit hash); when empty, a digest of
+# the template and app files is used.
+DEPLOY_VERSION = os.environ.get('DJANGO_DEPLOY_VERSION', '')
+
+# How attendance marks from student_enroll_course/student_enter_course are
+# written. Use 'admin.attendance.BufferedAttendanceBackend' to queue them in
+# memory and insert them in batches from a background thread.
+ATTENDANCE_BACKEND = {
+    'BACKEND': 'admin.attendance.DirectAttendanceBackend',
+    'OPTIONS': {},
+}
+
+# Seconds a same-day attendance mark is remembered so repeat visits skip the
+# database. Deleting the record clears it only in processes sharing the
+# cache; other workers may skip a new mark for up to this long.
+ATTENDANCE_MARKED_TIMEOUT = 300
+
+# Chunked lesson uploads: partial files live under MEDIA_ROOT until the
+# checksum is verified and the file is copied onto the Lesson.
+LESSON_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+LESSON_UPLOAD_MAX_SIZE = 4 * 1024 * 1024 * 1024
+LESSON_UPLOAD_TEMP_DIR = 'uploads/partial'
+
+# How lesson_download hands out files: 'direct' streams them with
+# FileResponse, 'x-accel' sets X-Accel-Redirect for nginx (map
+# LESSON_DOWNLOAD_ACCEL_PREFIX to MEDIA_ROOT as an internal location) and
+# 'x-sendfile' sets X-Sendfile for Apache/lighttpd.
+LESSON_DOWNLOAD_MODE = 'direct'
+LESSON_DOWNLOAD_ACCEL_PREFIX = '/protected-media/'
+
+# Most results returned by course/lesson search. On SQLite the FTS5 index
+# from admin.search answers it; other databases fall back to LIKE filters.
+SEARCH_LIMIT = 50
+
+# Resized copies generated next to each SiteBranding logo and WebsiteImage
+# after upload (on a background thread unless IMAGE_VARIANTS_BACKGROUND is
+# False). Add e.g. 'thumb_avif': {'size': (160, 90), 'format': 'AVIF'} for
+# AVIF output; formats Pillow cannot encode are skipped.
+IMAGE_VARIANTS = {
+    'thumb': {'size': (160, 90), 'format': 'WEBP', 'quality': 80},
+    'logo': {'size': (400, 68), 'format': 'WEBP', 'quality': 85},
+    'large': {'size': (1600, 1600), 'format': 'WEBP', 'quality': 80},
+}
+IMAGE_VARIANTS_BACKGROUND = True
@@ -15,14 +15,19 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
-from django.urls import include, path
+from django.urls import include, path, re_path
 from django.conf import settings
 from django.conf.urls.static import static
 
+from admin.staticbuild import serve_static
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('admin.urls')),
 ]
 
+if settings.STATIC_BUILD:
+    urlpatterns += [re_path(rf'^{settings.STATIC_URL.strip("/")}/(?P<path>.*)$', serve_static)]
+
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
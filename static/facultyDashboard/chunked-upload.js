@@ -0,0 +1,77 @@
+(function () {
+  const form = document.getElementById('chunked-upload');
+  if (!form) {
+    return;
+  }
+  const status = document.getElementById('chunked-status');
+  const endpoint = form.dataset.endpoint;
+  const csrf = form.querySelector('[name=csrfmiddlewaretoken]').value;
+
+  function toBase64(buffer) {
+    return btoa(String.fromCharCode(...new Uint8Array(buffer)));
+  }
+
+  async function send(url, options) {
+    const headers = Object.assign({ 'X-CSRFToken': csrf }, options.headers || {});
+    const response = await fetch(url, Object.assign({ credentials: 'same-origin' }, options, { headers }));
+    const body = await response.json();
+    // 409 carries the server's offset, which is where the next chunk has to start.
+    if (!response.ok && response.status !== 409) {
+      throw new Error(body.error || response.statusText);
+    }
+    return body;
+  }
+
+  form.addEventListener('submit', async (event) => {
+    event.preventDefault();
+    const file = form.elements.file.files[0];
+    const lesson = form.elements.lesson_id.value;
+    if (!file || !lesson) {
+      return;
+    }
+    const key = `lesson-upload:${lesson}:${file.name}:${file.size}:${file.lastModified}`;
+    try {
+      let state = null;
+      const saved = localStorage.getItem(key);
+      if (saved) {
+        state = await send(`${endpoint}${saved}/`, { method: 'GET' }).catch(() => null);
+      }
+      if (!state || state.completed) {
+        const data = new FormData();
+        data.append('lesson_id', lesson);
+        data.append('filename', file.name);
+        data.append('size', file.size);
+        state = await send(endpoint, { method: 'POST', body: data });
+        localStorage.setItem(key, state.id);
+      }
+
+      // Each chunk carries its own SHA-256, so only one chunk is ever held
+      // in memory and the server verifies it as it is written.
+      const url = `${endpoint}${state.id}/`;
+      let stalled = 0;
+      while (state.offset < state.size) {
+        const offset = state.offset;
+        const chunk = await file.slice(offset, offset + state.chunk_size).arrayBuffer();
+        const digest = toBase64(await crypto.subtle.digest('SHA-256', chunk));
+        state = await send(url, {
+          method: 'PUT',
+          body: chunk,
+          headers: { 'Upload-Offset': String(offset), 'Upload-Checksum': `sha256 ${digest}` },
+        });
+        stalled = state.offset > offset ? 0 : stalled + 1;
+        if (stalled >= 3) {
+          throw new Error(state.error || 'The upload is not making progress.');
+        }
+        status.textContent = `Uploaded ${Math.floor((state.offset * 100) / state.size)}%`;
+      }
+      state = await send(url, { method: 'POST' });
+      if (!state.completed) {
+        throw new Error(state.error || 'The upload could not be completed.');
+      }
+      localStorage.removeItem(key);
+      status.textContent = 'Upload complete.';
+    } catch (error) {
+      status.textContent = `${error.message} Submit again to resume.`;
+    }
+  });
+})();